@@ -0,0 +1,47 @@
+"""Time to parse publication dates with strptime and with pypresseportal_dates.
+
+python benchmarks/bench_dates.py --count 100000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from payloads import story_item  # noqa: E402
+from pypresseportal.pypresseportal_dates import (  # noqa: E402
+    PUBLISHED_FORMAT,
+    parse_published_batch,
+    published_epochs,
+)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = [
+        story_item(i, media=False, body_words=1)["published"] for i in range(args.count)
+    ]
+    cases = {
+        "datetime.strptime": lambda: [
+            datetime.strptime(value, PUBLISHED_FORMAT) for value in values
+        ],
+        "parse_published_batch": lambda: parse_published_batch(values),
+        "published_epochs": lambda: published_epochs(values),
+    }
+    print(f"{args.count} dates")
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"  {name:22} {seconds / args.count * 1e9:8.0f} ns/date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Time to decode API responses with the json decoders of pypresseportal_json.
+
+Decodes a synthetic page of stories and, next to it, the recorded API responses in
+``tests/replies``.
+
+python benchmarks/bench_json.py --stories 50 --repeat 20
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import timeit
+
+from typing import Callable, Dict, List, Tuple
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from payloads import story_page_json  # noqa: E402
+from pypresseportal.pypresseportal_json import (  # noqa: E402
+    orjson,
+    orjson_decoder,
+    stdlib_decoder,
+)
+
+
+def recorded_replies() -> List[Tuple[str, bytes]]:
+    """Returns the names and contents of the recorded responses in tests/replies."""
+    replies = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "tests", "replies", "*.json"))):
+        with open(path, "rb") as in_file:
+            replies.append((os.path.basename(path), in_file.read()))
+    return replies
+
+
+def decoders(content: bytes) -> Dict[str, Callable[[], object]]:
+    """Returns the decoding cases for one response."""
+    cases = {
+        # What PresseportalApi did before, via requests' Response.text
+        "json.loads(text)": lambda: json.loads(content.decode("utf-8")),
+        "stdlib_decoder(bytes)": lambda: stdlib_decoder(content),
+    }
+    if orjson is not None:
+        cases["orjson_decoder(bytes)"] = lambda: orjson_decoder(content)
+    return cases
+
+
+def run(name: str, content: bytes, repeat: int) -> None:
+    """Times the decoders on one response and prints the results."""
+    print(f"{name}, {len(content) / 1024:.1f} KiB")
+    # Small responses are decoded many times per measurement, for stable timings
+    number = max(1, 2**16 // max(len(content), 1))
+    baseline = None
+    for case_name, case in decoders(content).items():
+        seconds = min(timeit.repeat(case, number=number, repeat=repeat)) / number
+        baseline = baseline or seconds
+        throughput = len(content) / seconds / 2**20
+        print(
+            f"  {case_name:22} {seconds * 1e6:10.1f} us/response"
+            f" {throughput:8.1f} MiB/s {baseline / seconds:6.2f}x"
+        )
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stories", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if orjson is None:
+        print("orjson is not installed, skipping orjson_decoder")
+    content = story_page_json(args.stories).encode("utf-8")
+    run(f"synthetic page of {args.stories} stories", content, args.repeat)
+    for name, reply in recorded_replies():
+        run(f"tests/replies/{name}", reply, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Time to parse pages of stories with the default, compact and lazy models.
+
+Builds stories from decoded synthetic pages and reads either only ``id`` and
+``title`` (as a router would) or every attribute:
+
+    python benchmarks/bench_lazy.py --pages 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from payloads import story_page_json  # noqa: E402
+from pypresseportal import Story  # noqa: E402
+from pypresseportal.pypresseportal_compact import CompactStory  # noqa: E402
+from pypresseportal.pypresseportal_lazy import LazyStory  # noqa: E402
+
+MODELS = {"Story": Story, "CompactStory": CompactStory, "LazyStory": LazyStory}
+ALL_ATTRIBUTES = ("id", "title", "published", "company_id", "keywords", "body")
+
+
+def run(pages, model, attributes) -> None:
+    """Builds stories from all pages and reads ``attributes`` of each story."""
+    for page in pages:
+        for item in page["content"]["story"]:
+            story = model(item)
+            for attribute in attributes:
+                getattr(story, attribute)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = [
+        json.loads(story_page_json(50, start))
+        for start in range(0, args.pages * 50, 50)
+    ]
+    count = args.pages * 50
+    for label, attributes in (("id, title", ("id", "title")), ("all", ALL_ATTRIBUTES)):
+        print(f"{count} stories, reading {label}")
+        for name, model in MODELS.items():
+            seconds = min(
+                timeit.repeat(
+                    lambda: run(pages, model, attributes), number=1, repeat=args.repeat
+                )
+            )
+            print(f"  {name:14} {seconds / count * 1e6:8.2f} µs/story")
+
+
+if __name__ == "__main__":
+    main()
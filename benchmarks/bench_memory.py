@@ -0,0 +1,65 @@
+"""Memory used per story by the default and the compact models.
+
+Decodes synthetic pages of stories, builds models from them and drops the decoded
+pages, then reports the memory that remains allocated per story:
+
+    python benchmarks/bench_memory.py --stories 20000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from payloads import story_page_json  # noqa: E402
+from pypresseportal import Story  # noqa: E402
+from pypresseportal.pypresseportal_compact import CompactStory  # noqa: E402
+
+MODELS = {
+    "Story": lambda item: Story(item),
+    "CompactStory": lambda item: CompactStory(item),
+    "CompactStory (keep_data=False)": lambda item: CompactStory(item, keep_data=False),
+}
+
+
+def measure(pages, make_story) -> int:
+    """Returns the bytes still allocated after building stories from ``pages``."""
+    gc.collect()
+    tracemalloc.start()
+    stories = []
+    for page in pages:
+        for item in json.loads(page)["content"]["story"]:
+            stories.append(make_story(item))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stories
+    return current
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stories", type=int, default=10000)
+    parser.add_argument("--teaser", action="store_true", help="use teasers")
+    args = parser.parse_args()
+
+    pages = [
+        story_page_json(50, start, teaser=args.teaser, office=bool(start % 100))
+        for start in range(0, args.stories, 50)
+    ]
+    count = len(pages) * 50
+    baseline = None
+    print(f"{count} stories, {'teaser' if args.teaser else 'full body'}")
+    for name, make_story in MODELS.items():
+        per_story = measure(pages, make_story) / count
+        baseline = baseline or per_story
+        print(f"{name:32} {per_story:10.0f} bytes/story {per_story / baseline:7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Throughput and allocations of the parsing hot path.
+
+Measures model construction (``Story``, ``Company``, ``Office``, ``Entity``),
+``_parse_story_data`` and ``_parse_search_results``, json decoding and
+``_build_request`` on synthetic 50 story pages. Save the results of a known good
+version and compare later runs against them to catch regressions:
+
+    python benchmarks/bench_parsing.py --save baseline.json
+    python benchmarks/bench_parsing.py --compare baseline.json
+
+With ``--compare``, the exit status is 1 if a case became slower than
+``--threshold`` or its peak allocations grew more than ``--alloc-threshold``
+(relative to the baseline). Timings are compared relative to a fixed reference
+workload timed in the same run, which evens out machines and loads of different
+speed. Allocations are deterministic.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from payloads import (  # noqa: E402
+    company_item,
+    entity_item,
+    office_item,
+    search_page,
+    story_page,
+)
+from pypresseportal import Company, Entity, Office, PresseportalApi, Story  # noqa: E402
+from pypresseportal.pypresseportal_json import (  # noqa: E402
+    orjson,
+    orjson_decoder,
+    stdlib_decoder,
+)
+
+API_KEY = "NO_KEY_NEEDED_FOR_BENCHMARKS"
+STORIES_URL = "https://api.presseportal.de/api/article/all"
+# Page variants: arguments of payloads.story_item
+PAGES = {
+    "full": {},
+    "teaser": {"teaser": True},
+    "no media": {"media": False},
+    "no keywords": {"keywords": False},
+    "office": {"office": True},
+}
+
+# Name, function running one operation, items processed per operation
+Case = Tuple[str, Callable[[], object], int]
+
+
+def cases() -> List[Case]:
+    """Returns all benchmark cases."""
+    api_object = PresseportalApi(API_KEY)
+    result: List[Case] = []
+    for variant, arguments in PAGES.items():
+        page = story_page(50, **arguments)
+        items = page["content"]["story"]
+        content = json.dumps(page).encode("utf-8")
+        result.append(
+            (f"Story[{variant}]", lambda items=items: [Story(i) for i in items], 50)
+        )
+        result.append(
+            (
+                f"_parse_story_data[{variant}]",
+                lambda page=page: api_object._parse_story_data(page),
+                50,
+            )
+        )
+        result.append(
+            (
+                f"stdlib_decoder[{variant}]",
+                lambda content=content: stdlib_decoder(content),
+                50,
+            )
+        )
+        if orjson is not None:
+            result.append(
+                (
+                    f"orjson_decoder[{variant}]",
+                    lambda content=content: orjson_decoder(content),
+                    50,
+                )
+            )
+
+    companies = [company_item(i) for i in range(50)]
+    offices = [office_item(i) for i in range(50)]
+    entities = [entity_item(i, office=bool(i % 2)) for i in range(50)]
+    results = search_page(50)
+    result.extend(
+        [
+            ("Company", lambda: [Company(item) for item in companies], 50),
+            ("Office", lambda: [Office(item) for item in offices], 50),
+            ("Entity", lambda: [Entity(item) for item in entities], 50),
+            (
+                "_parse_search_results",
+                lambda: api_object._parse_search_results(results),
+                50,
+            ),
+            (
+                "_build_request",
+                lambda: api_object._build_request(STORIES_URL, "image", 0, 50, True),
+                1,
+            ),
+        ]
+    )
+    return result
+
+
+def reference_seconds(repeat: int) -> float:
+    """Returns the seconds of a fixed pure Python workload, similar to model construction."""
+
+    def workload() -> object:
+        return [{"id": str(i), "title": f"Titel {i}"} for i in range(1000)]
+
+    return min(timeit.repeat(workload, number=20, repeat=repeat)) / 20
+
+
+def allocations(function: Callable[[], object]) -> Tuple[int, int]:
+    """Returns the peak and the retained bytes allocated by one call of ``function``."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        value = function()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del value
+    return peak - start, current - start
+
+
+def run(case: Case, repeat: int, min_seconds: float) -> Dict[str, float]:
+    """Measures a case, see :func:`cases`."""
+    _, function, items = case
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_seconds / 0.2))
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+    peak, retained = allocations(function)
+    return {
+        "seconds": seconds,
+        "items_per_second": items / seconds,
+        "peak_bytes": peak,
+        "retained_bytes": retained,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    thresholds: Dict[str, float],
+    speed: float = 1.0,
+) -> List[str]:
+    """Returns a description of every regression against the baseline.
+
+    Timings of the baseline are multiplied by ``speed``, the ratio of the reference
+    seconds of both runs.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for key, threshold in thresholds.items():
+            before, after = baseline[name][key], result[key]
+            if key == "seconds":
+                before *= speed
+            if before > 0 and after > before * (1 + threshold):
+                regressions.append(
+                    f"{name}: {key} {before:.4g} -> {after:.4g} ({after / before - 1:+.0%})"
+                )
+    return regressions
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-seconds", type=float, default=0.05, help="per timing repetition"
+    )
+    parser.add_argument("--filter", default="", help="only cases containing this")
+    parser.add_argument("--save", help="write the results to this json file")
+    parser.add_argument("--compare", help="json file written by --save")
+    parser.add_argument("--threshold", type=float, default=0.25, help="time")
+    parser.add_argument("--alloc-threshold", type=float, default=0.05)
+    args = parser.parse_args()
+
+    reference = reference_seconds(args.repeat)
+    results: Dict[str, Dict[str, float]] = {}
+    print(
+        f"{'case':32} {'us/op':>10} {'items/s':>12} {'peak KiB':>10} {'kept KiB':>10}"
+    )
+    for case in cases():
+        name = case[0]
+        if args.filter not in name:
+            continue
+        result = results[name] = run(case, args.repeat, args.min_seconds)
+        print(
+            f"{name:32} {result['seconds'] * 1e6:10.1f} "
+            f"{result['items_per_second']:12.0f} "
+            f"{result['peak_bytes'] / 1024:10.1f} "
+            f"{result['retained_bytes'] / 1024:10.1f}"
+        )
+
+    reference = min(reference, reference_seconds(args.repeat))
+    print(f"reference workload {reference * 1e6:.1f} us")
+    if args.save:
+        with open(args.save, "w") as out_file:
+            json.dump(
+                {
+                    "python": sys.version.split()[0],
+                    "reference_seconds": reference,
+                    "results": results,
+                },
+                out_file,
+                indent=2,
+            )
+    if args.compare:
+        with open(args.compare, "r") as in_file:
+            saved = json.load(in_file)
+        thresholds = {"seconds": args.threshold, "peak_bytes": args.alloc_threshold}
+        speed = reference / saved["reference_seconds"]
+        regressions = compare(results, saved["results"], thresholds, speed)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
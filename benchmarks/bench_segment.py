@@ -0,0 +1,82 @@
+"""Compression ratio and scan throughput of segment files.
+
+python benchmarks/bench_segment.py --count 20000 --block-size 262144
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from payloads import PUBLISHED, story_item  # noqa: E402
+from pypresseportal.pypresseportal_segment import (  # noqa: E402
+    CODECS,
+    Segment,
+    SegmentWriter,
+)
+
+
+def _timed(function):
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--block-size", type=int, default=262144)
+    args = parser.parse_args()
+
+    # Stories a minute apart, most recent first as the API returns them
+    items = [story_item(i, office=i % 5 == 0) for i in range(args.count)]
+    company_id = next(item["company"]["id"] for item in items if "company" in item)
+    end = PUBLISHED - timedelta(minutes=args.count // 2)
+    start = end - timedelta(hours=6)
+    scans = {
+        "full scan": {},
+        "6 hour range": {"start": start, "end": end},
+        "one company": {"company_id": company_id},
+    }
+
+    print(f"{args.count} stories, blocks of {args.block_size // 1024} KiB")
+    with tempfile.TemporaryDirectory() as directory:
+        for codec in sorted(CODECS):
+            path = os.path.join(directory, f"{codec}.ppseg")
+
+            def write():
+                with SegmentWriter(path, codec=codec, block_size=args.block_size) as w:
+                    w.write_items(items)
+
+            write_seconds, _ = _timed(write)
+            with Segment(path) as segment:
+                raw_mb = segment.raw_size / 1e6
+                print(
+                    f"  {codec:5} {raw_mb:7.1f} MB json -> "
+                    f"{os.path.getsize(path) / 1e6:6.1f} MB file, "
+                    f"ratio {segment.ratio:5.1f}, "
+                    f"write {raw_mb / write_seconds:6.1f} MB/s"
+                )
+                for name, conditions in scans.items():
+                    blocks = segment.blocks_for(**conditions)
+                    seconds, found = _timed(
+                        lambda: sum(1 for _ in segment.items(**conditions))
+                    )
+                    read_mb = sum(segment.blocks[b].raw_size for b in blocks) / 1e6
+                    print(
+                        f"        {name:13} {found:6} stories, "
+                        f"{len(blocks):4}/{len(segment.blocks)} blocks, "
+                        f"{seconds * 1e3:8.1f} ms, "
+                        f"{len(segment) / seconds:10.0f} stories/s scanned, "
+                        f"{read_mb / seconds:6.1f} MB/s read"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""End-to-end throughput and latency of the synchronous client against the API stand-in.
+
+python benchmarks/loadtest.py --threads 8 --duration 10 --latency 0.05 --jitter 0.02
+
+Starts a :mod:`pypresseportal.pypresseportal_mockserver` in a subprocess (so that
+the server does not compete with the client threads for the GIL), or uses a running
+stand-in given with ``--url``. Each thread runs its own ``PresseportalApi`` and
+sends a weighted mix of story queries until the duration is over. Reported are
+requests and stories per second, errors by exception class, and latency
+percentiles of all queries and per query type. Latencies include parsing and, with
+``--retries``, the retries of a query.
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pypresseportal import PresseportalApi  # noqa: E402
+from pypresseportal.pypresseportal_ratelimit import RetryPolicy  # noqa: E402
+
+API_KEY = "LOADTEST_API_KEY_FOR_THE_STAND_IN"
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Name, weight, query
+Query = Tuple[str, int, Callable[[PresseportalApi], list]]
+QUERIES: List[Query] = [
+    ("get_stories", 4, lambda api: api.get_stories()),
+    ("get_stories[teaser]", 2, lambda api: api.get_stories(start=50, teaser=True)),
+    ("get_stories_topic", 2, lambda api: api.get_stories_topic("finanzen")),
+    ("get_stories_keywords", 1, lambda api: api.get_stories_keywords(["umwelt"])),
+    (
+        "get_stories_specific_company",
+        1,
+        lambda api: api.get_stories_specific_company("100007", limit=20),
+    ),
+    (
+        "get_public_service_specific_region",
+        1,
+        lambda api: api.get_public_service_specific_region("hh"),
+    ),
+    ("get_investor_relations_news", 1, lambda api: api.get_investor_relations_news()),
+]
+
+
+class Sample(NamedTuple):
+    """Outcome of one query."""
+
+    query: str
+    seconds: float
+    stories: int
+    error: str
+
+
+def percentile(values: Sequence[float], share: float) -> float:
+    """Returns the nearest-rank percentile of sorted values."""
+    if not values:
+        return float("nan")
+    return values[min(len(values) - 1, max(0, int(share * len(values) + 0.5) - 1))]
+
+
+def worker(
+    url: str, deadline: float, seed: int, retries: int, samples: List[Sample]
+) -> None:
+    """Sends queries until ``deadline`` and appends their outcome to ``samples``."""
+    rng = random.Random(seed)
+    weights = [weight for _, weight, _ in QUERIES]
+    retry = RetryPolicy(max_retries=retries, backoff_factor=0.05) if retries else None
+    with PresseportalApi(API_KEY, api_url=url, retry=retry) as api_object:
+        while time.perf_counter() < deadline:
+            name, _, query = rng.choices(QUERIES, weights)[0]
+            started = time.perf_counter()
+            try:
+                stories, error = len(query(api_object) or ()), ""
+            except Exception as exception:
+                stories, error = 0, type(exception).__name__
+            samples.append(Sample(name, time.perf_counter() - started, stories, error))
+
+
+def start_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, str]:
+    """Starts the stand-in in a subprocess and returns it with its URL."""
+    command = [sys.executable, "-m", "pypresseportal.pypresseportal_mockserver"]
+    command += ["--port", "0", "--rate", str(args.rate)]
+    for option in (
+        "latency",
+        "jitter",
+        "failure_rate",
+        "error_rate",
+        "disconnect_rate",
+    ):
+        command += [f"--{option.replace('_', '-')}", str(getattr(args, option))]
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    process = subprocess.Popen(
+        command, stdout=subprocess.PIPE, universal_newlines=True, env=env
+    )
+    line = process.stdout.readline()  # type: ignore
+    if not line:
+        process.wait()
+        sys.exit("The stand-in server did not start")
+    return process, line.split()[-1]
+
+
+def report(samples: List[Sample], seconds: float) -> None:
+    """Prints throughput, errors and latency percentiles."""
+    by_query: Dict[str, List[float]] = defaultdict(list)
+    for sample in samples:
+        by_query[sample.query].append(sample.seconds)
+    by_query["all"] = [sample.seconds for sample in samples]
+    errors = Counter(sample.error for sample in samples if sample.error)
+    stories = sum(sample.stories for sample in samples)
+
+    print(
+        f"{len(samples)} requests in {seconds:.1f} s: "
+        f"{len(samples) / seconds:.1f} requests/s, {stories / seconds:.0f} stories/s"
+    )
+    failed = sum(errors.values())
+    print(f"errors: {failed} ({failed / max(1, len(samples)):.1%})", end="")
+    print("".join(f", {name} {count}" for name, count in errors.most_common()))
+    print(f"{'query':36} {'count':>6} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}")
+    for name in sorted(by_query, key=lambda name: (name == "all", name)):
+        values = sorted(by_query[name])
+        p50, p90, p99 = (percentile(values, share) * 1e3 for share in (0.5, 0.9, 0.99))
+        print(f"{name:36} {len(values):6} {p50:8.1f} {p90:8.1f} {p99:8.1f}")
+
+
+def main() -> None:
+    """Runs the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="API URL of a running stand-in")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--retries", type=int, default=0, help="per query")
+    parser.add_argument("--seed", type=int, default=0, help="of the query mix")
+    server = parser.add_argument_group("stand-in server, without --url")
+    server.add_argument("--rate", type=float, default=1.0, help="stories per second")
+    server.add_argument("--latency", type=float, default=0.0, help="seconds")
+    server.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    server.add_argument("--failure-rate", type=float, default=0.0)
+    server.add_argument("--error-rate", type=float, default=0.0)
+    server.add_argument("--disconnect-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    process, url = (None, args.url) if args.url else start_server(args)
+    try:
+        samples: List[Sample] = []
+        started = time.perf_counter()
+        deadline = started + args.duration
+        threads = [
+            threading.Thread(
+                target=worker,
+                args=(url, deadline, args.seed + i, args.retries, samples),
+            )
+            for i in range(args.threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    print(f"{args.threads} threads against {url}")
+    report(samples, elapsed)
+
+
+if __name__ == "__main__":
+    main()
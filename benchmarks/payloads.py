@@ -0,0 +1,183 @@
+"""Synthetic presseportal.de API payloads for the benchmarks.
+
+The generated stories have the structure of ``tests/replies/get_stories.json`` with
+realistic field sizes: German titles and bodies, two to six keywords, and a
+company or a public service office as publisher.
+"""
+
+import json
+import random
+
+from datetime import datetime, timedelta, timezone
+
+WORDS = (
+    "Polizei Feuerwehr Einsatz Unfall Verkehr Kreisstraße Zeugen gesucht Brand "
+    "Wohnhaus Umwelt Klimaschutz Unternehmen Quartal Umsatz Wachstum Bürger "
+    "Straßensperrung Ermittlungen Präsidium Pressestelle Mitteilung Gemeinde"
+).split()
+KEYWORDS = (
+    "Umwelt",
+    "Klimaschutz",
+    "Polizei",
+    "Feuerwehr",
+    "Verkehr",
+    "Wirtschaft",
+    "Finanzen",
+    "Gesundheit",
+    "Auto",
+    "Energie",
+)
+RESSORTS = ("vermischtes", "wirtschaft", "blaulicht", "finanzen", "panorama")
+PUBLISHED = datetime(2020, 7, 2, 4, 30, tzinfo=timezone(timedelta(hours=2)))
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def story_item(
+    index: int,
+    teaser: bool = False,
+    media: bool = True,
+    office: bool = False,
+    keywords: bool = True,
+    body_words: int = 350,
+    seed: int = 0,
+) -> dict:
+    """Returns the json data of one synthetic story.
+
+    Args:
+        index (int): Position of the story, stories are published a minute apart.
+        teaser (bool, optional): Return a teaser instead of a full body. Defaults to False.
+        media (bool, optional): Attach an image. Defaults to True.
+        office (bool, optional): Publish from a public service office instead of a company. Defaults to False.
+        keywords (bool, optional): Attach keywords. Defaults to True.
+        body_words (int, optional): Number of words in the body. Defaults to 350.
+        seed (int, optional): Random seed, the same arguments return the same story. Defaults to 0.
+
+    Returns:
+        dict: Story data as returned by the API.
+    """
+    rng = random.Random(seed * 1000003 + index)
+    publisher_id = str(1000 + rng.randrange(200))
+    published = PUBLISHED - timedelta(minutes=index)
+    item = {
+        "id": str(4000000 + index),
+        "url": f"https://www.presseportal.de/pm/{publisher_id}/{4000000 + index}",
+        "title": _text(rng, 8),
+        "published": published.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "language": "de",
+        "ressort": rng.choice(RESSORTS),
+        "keywords": (
+            {"keyword": rng.sample(KEYWORDS, rng.randint(2, 6))} if keywords else []
+        ),
+        "highlight": "0",
+        "short": f"http://ots.de/{index:06x}",
+    }
+    if teaser:
+        item["teaser"] = _text(rng, 40)
+    else:
+        item["body"] = _text(rng, body_words)
+    publisher = {
+        "id": publisher_id,
+        "url": f"https://www.presseportal.de/nr/{publisher_id}",
+        "name": f"Pressestelle {publisher_id}",
+    }
+    item["office" if office else "company"] = publisher
+    if media:
+        item["media"] = {
+            "image": [
+                {
+                    "id": str(900000 + index),
+                    "url": f"https://cache.pressmailing.net/thumbnail/story_big/{index}.jpg",
+                    "name": f"{index}.jpg",
+                    "size": "123456",
+                    "mime": "image/jpeg",
+                    "type": "image",
+                    "caption": _text(rng, 6),
+                }
+            ]
+        }
+    return item
+
+
+def story_page(count: int = 50, start: int = 0, **kwargs) -> dict:
+    """Returns the json data of a page of synthetic stories.
+
+    Args:
+        count (int, optional): Number of stories. Defaults to 50.
+        start (int, optional): Index of the first story. Defaults to 0.
+        **kwargs: Arguments for :func:`story_item`.
+
+    Returns:
+        dict: Page as returned by the API.
+    """
+    return {
+        "success": "1",
+        "request": {"start": str(start), "limit": str(count), "format": "json"},
+        "content": {"story": [story_item(start + i, **kwargs) for i in range(count)]},
+    }
+
+
+def story_page_json(count: int = 50, start: int = 0, **kwargs) -> str:
+    """Returns a page of synthetic stories as json text, see :func:`story_page`."""
+    return json.dumps(story_page(count, start, **kwargs))
+
+
+def company_item(index: int) -> dict:
+    """Returns the json data of a synthetic company, as in ``info/company`` responses."""
+    company_id = str(100000 + index)
+    return {
+        "id": company_id,
+        "url": f"https://www.presseportal.de/nr/{company_id}",
+        "name": f"Unternehmen {index} GmbH",
+        "isin": f"DE000{index:07d}",
+        "wkn": f"{index:06d}",
+        "shortname": f"U{index}",
+        "rss": f"https://www.presseportal.de/rss/pm_{company_id}.rss2",
+        "logo": f"https://cache.pressmailing.net/thumbnail/big/{company_id}/logo.jpg",
+        "web": [
+            {
+                "link": [
+                    {"title": "Homepage", "url": f"https://u{index}.example"},
+                    {"title": "Youtube-Kanal", "url": f"https://u{index}.example/tv"},
+                ]
+            }
+        ],
+        "homepage": f"https://u{index}.example",
+    }
+
+
+def office_item(index: int) -> dict:
+    """Returns the json data of a synthetic office, as in ``info/office`` responses."""
+    office_id = str(110000 + index)
+    return {
+        "id": office_id,
+        "url": f"https://www.presseportal.de/blaulicht/nr/{office_id}",
+        "name": f"Polizeipräsidium {index}",
+        "logo": f"https://cache.pressmailing.net/thumbnail/big/{office_id}/logo",
+        "shortname": f"POL-{index}",
+        "rss": f"https://www.presseportal.de/rss/dienststelle_{office_id}.rss2",
+        "homepage": f"https://polizei{index}.example",
+        "web": [{"link": [{"title": "Homepage", "url": f"https://p{index}.example"}]}],
+    }
+
+
+def entity_item(index: int, office: bool = False) -> dict:
+    """Returns the json data of a synthetic search result, as in ``search`` responses."""
+    item = office_item(index) if office else company_item(index)
+    return {
+        "id": item["id"],
+        "url": item["url"],
+        "name": item["name"],
+        "type": "office" if office else "company",
+    }
+
+
+def search_page(count: int = 20, office: bool = False) -> dict:
+    """Returns the json data of a page of synthetic search results."""
+    return {
+        "success": "1",
+        "request": {"limit": str(count), "format": "json", "hits": str(count)},
+        "content": {"result": [entity_item(i, office) for i in range(count)]},
+    }
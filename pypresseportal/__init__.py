@@ -1,5 +1,9 @@
 """PyPresseportal - Python wrapper for the presseportal.de API."""
 
 from .pypresseportal import *
+from .pypresseportal_async import AsyncPresseportalApi
+from .pypresseportal_bulk import FetchJob, FetchResult, TaggedStory
+from .pypresseportal_poller import StoryPoller
+from .pypresseportal_storybatch import StoryBatch
 
 __version__ = "0.1"
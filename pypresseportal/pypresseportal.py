@@ -5,14 +5,18 @@ accessible as Python objects. You need an API key from
 presseportal.de to use PyPresseportal (https://api.presseportal.de/en).
 """
 
-import json
+import threading
+import time
 
-from datetime import datetime
-from typing import Dict, List, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
 
 import requests
 
 from pypresseportal.pypresseportal_constants import (
+    API_URL,
+    STREAM_CHUNK_SIZE,
+    STORIES_LIMIT_MAX,
     MEDIA_TYPES,
     PUBLIC_SERVICE_MEDIA_TYPES,
     INVESTOR_RELATIONS_NEWS_TYPES,
@@ -20,6 +24,45 @@ from pypresseportal.pypresseportal_constants import (
     TOPICS,
     KEYWORDS,
 )
+from pypresseportal.pypresseportal_archive import StoryArchive
+from pypresseportal.pypresseportal_cache import BaseCache
+from pypresseportal.pypresseportal_compact import (
+    CompactCompany,
+    CompactEntity,
+    CompactOffice,
+    CompactStory,
+)
+from pypresseportal.pypresseportal_conditional import (
+    ConditionalEntry,
+    ConditionalStore,
+    content_digest,
+)
+from pypresseportal.pypresseportal_dates import parse_published
+from pypresseportal.pypresseportal_lazy import LazyStory
+from pypresseportal.pypresseportal_metrics import (
+    ERRORS,
+    PAGE_STORIES,
+    PARSE_SECONDS,
+    REQUEST_SECONDS,
+    REQUESTS,
+    RESPONSE_BYTES,
+    MetricsSink,
+    endpoint_label,
+)
+from pypresseportal.pypresseportal_ratelimit import (
+    RateLimiter,
+    RetryableResponse,
+    RetryPolicy,
+    parse_retry_after,
+)
+from pypresseportal.pypresseportal_bulk import (
+    STORY_ENDPOINTS,
+    FetchJob,
+    FetchResult,
+    TaggedStory,
+    merge_tagged,
+)
+from pypresseportal.pypresseportal_json import JsonDecoder, default_decoder
 from pypresseportal.pypresseportal_errors import (
     ApiError,
     ApiConnectionFail,
@@ -33,6 +76,13 @@ from pypresseportal.pypresseportal_errors import (
     SearchTermError,
     SearchEntityError,
 )
+from pypresseportal.pypresseportal_storybatch import StoryBatch
+from pypresseportal.pypresseportal_stream import iter_story_items
+from pypresseportal.pypresseportal_session import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    session_pool,
+)
 
 
 class Company:
@@ -151,7 +201,7 @@ class Story:
         self.id = data["id"]
         self.url = data["url"]
         self.title = data["title"]
-        self.published = datetime.strptime(data["published"], "%Y-%m-%dT%H:%M:%S%z")
+        self.published = parse_published(data["published"])
         self.highlight = data["highlight"]
         self.short = data["short"]
 
@@ -194,45 +244,74 @@ class Story:
                     setattr(self, media_type, data["media"][media_type])
 
 
-class PresseportalApi:
-    """A Python interface into the presseportal.de API.
-
-    The website presseportal.de is a service provided by 'news aktuell', owned by dpa
-    (Deutsche Presse Agentur). An API key from presseportal.de is required.
-    You can find more information and apply for an API key at
-    https://api.presseportal.de/en. The documentation for PyPresseportal is at
-    https://pypresseportal.readthedocs.io/.
-
-    First, create an instance of the ``PresseportalApi`` class, using your API key:
-
-    >>> from pypresseportal import PresseportalApi
-    >>> api_object = PresseportalApi(YOUR_API_KEY)
-
-    Next, request data from the API, using the various methods in this class.
-
-    For example:
-
-    Use the method get_stories() to access the most recently published stories (https://api.presseportal.de/doc/article/all).
-    If no arguments are provided, PyPresseportal defaults to retrieving the 50 most
-    recent stories available. For example:
-
-        >>> stories = api_object.get_stories()
-
-    Story data can be accessed through the individual Story object's attributes. For example:
-
-        >>> stories[0].title
-        "Kohls Wohnhaus hat keinen Denkmalwert"
-        >>> stories[0].id
-        "4622388"
+RequestComponents = Tuple[str, Dict[str, str], Dict[str, str]]
+# Top-level keys of successful responses
+_RESPONSE_KEYS = frozenset(("content", "company", "office"))
+
+
+class PresseportalApiBase:
+    """Shared request building, validation and parsing for the API clients.
+
+    ``PresseportalApiBase`` holds everything that does not depend on how a query is sent:
+    the API key, URL and parameter construction, validation of arguments against the
+    constants in :mod:`pypresseportal.pypresseportal_constants`, and mapping of the
+    returned json data to :class:`Story`, :class:`Entity`, :class:`Company` and
+    :class:`Office` objects. Each ``_prepare_*`` method returns the
+    ``(url, params, headers)`` of a query, or None if the query can not return any stories.
+    :class:`PresseportalApi` and :class:`pypresseportal.AsyncPresseportalApi` only add the transport.
+
+    Args:
+        api_key (str): Your API key from presseportal.de.
+        cache (BaseCache, optional): Cache for API responses. Defaults to None (no caching).
+        conditional_requests (bool, optional): Send conditional requests and reuse the previous result if a response is unchanged. Defaults to False.
+        rate_limiter (RateLimiter, optional): Rate limiter for all requests. Defaults to None (no limit).
+        retry (RetryPolicy, optional): Policy for repeating failed requests. Defaults to None (no retries).
+        compact_models (bool, optional): Return the ``__slots__`` based models of :mod:`pypresseportal.pypresseportal_compact`. Defaults to False.
+        keep_raw_data (bool, optional): Keep the raw json data in the ``data`` attribute of compact models. Defaults to True.
+        lazy_models (bool, optional): Return stories as :class:`pypresseportal.pypresseportal_lazy.LazyStory` objects. Takes precedence over ``compact_models`` for stories. Defaults to False.
+        epoch_published (bool, optional): Store the publication date of compact stories as an integer ``published_epoch``, see :class:`pypresseportal.pypresseportal_compact.CompactStory`. Defaults to False.
+        json_decoder (JsonDecoder, optional): Function decoding the raw bytes of a response, see :mod:`pypresseportal.pypresseportal_json`. Defaults to None (``orjson`` if it is installed, otherwise ``json``).
+        archive (StoryArchive, optional): Store every story returned by a query in this archive, see :mod:`pypresseportal.pypresseportal_archive`. Defaults to None.
+        metrics (MetricsSink, optional): Sink for request, parsing and error metrics, see :mod:`pypresseportal.pypresseportal_metrics`. Defaults to None (no metrics).
+        api_url (str, optional): Base URL of the API, for example of the local stand-in of :mod:`pypresseportal.pypresseportal_mockserver`. Defaults to "https://api.presseportal.de/api".
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        cache: BaseCache = None,
+        conditional_requests: bool = False,
+        rate_limiter: RateLimiter = None,
+        retry: RetryPolicy = None,
+        compact_models: bool = False,
+        keep_raw_data: bool = True,
+        lazy_models: bool = False,
+        epoch_published: bool = False,
+        json_decoder: JsonDecoder = None,
+        archive: StoryArchive = None,
+        metrics: MetricsSink = None,
+        api_url: str = API_URL,
+    ):
         """Constructor method."""
         self.data_format = "json"
         if type(api_key) is str and len(api_key) > 5:
             self.api_key = api_key
         else:
             raise ApiKeyError(api_key)
+        self.cache = cache
+        self.conditional: Union[ConditionalStore, None] = None
+        if conditional_requests:
+            self.conditional = ConditionalStore()
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.compact_models = compact_models
+        self.keep_raw_data = keep_raw_data
+        self.lazy_models = lazy_models
+        self.epoch_published = epoch_published
+        self.json_decoder = default_decoder() if json_decoder is None else json_decoder
+        self.archive = archive
+        self.metrics = metrics
+        self.api_url = api_url.rstrip("/")
 
     def _build_request(
         self,
@@ -242,7 +321,7 @@ class PresseportalApi:
         limit: Union[int, None] = None,
         teaser: Union[bool, None] = None,
         search_term: Union[str, None] = None,
-    ) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+    ) -> RequestComponents:
         # Set up url and append media type, if required
         url = base_url
         if media:
@@ -269,37 +348,45 @@ class PresseportalApi:
 
         return url, params, headers
 
-    def _get_data(self, url: str, params: dict, headers: dict) -> dict:
-        #######################Disable for testing ##############
-        try:
-            request = requests.get(url=url, params=params, headers=headers)
-        except (
-            requests.exceptions.ConnectionError,
-            requests.exceptions.TooManyRedirects,
-            requests.exceptions.Timeout,
-        ) as error:
-            raise ApiConnectionFail(error)
-        json_data = json.loads(request.text)
-        # with open("out.json", "w") as outfile:
-        #     json.dump(json_data, outfile)
-        #######################Enable for testing ###############
-        # # read file
-        # with open("out.json", "r") as in_file:
-        #     data = in_file.read()
-        # # parse file
-        # json_data = json.loads(data)
-        #########################################################
+    def _check_json_data(self, json_data: dict) -> dict:
         # Raise error if API does not report success
         if "error" in json_data:
             error_code = json_data["error"]["code"]
             error_msg = json_data["error"]["msg"]
             raise ApiError(error_code, error_msg)
 
-        if "content" not in json_data:
+        # Story and search queries return "content", information queries the entity
+        if not _RESPONSE_KEYS.intersection(json_data):
             raise ApiDataError()
 
         return json_data
 
+    def _conditional_json_data(
+        self,
+        conditional: ConditionalStore,
+        key: str,
+        entry: Union[ConditionalEntry, None],
+        status: int,
+        response_headers: Mapping[str, str],
+        content: bytes,
+        decode: Callable[[], dict],
+    ) -> dict:
+        # Reuse the previous json data if the API reports it as not modified,
+        # or if the payload is identical, otherwise decode and check the payload
+        if entry is not None and status == 304:
+            conditional.count_reuse(not_modified=True)
+            digest = entry.digest
+            json_data = entry.json_data
+        else:
+            digest = content_digest(content)
+            if entry is not None and entry.digest == digest:
+                conditional.count_reuse(not_modified=False)
+                json_data = entry.json_data
+            else:
+                json_data = self._check_json_data(decode())
+        conditional.update(key, entry, response_headers, digest, json_data)
+        return json_data
+
     def _is_media_valid(
         self, media: Union[str, None], allowed_media_type: tuple = MEDIA_TYPES
     ) -> bool:
@@ -309,393 +396,258 @@ class PresseportalApi:
             return False
         return True
 
+    def _record_request(
+        self, url: str, started: float, error: Union[Exception, None] = None
+    ) -> None:
+        # Count and duration of a _get_data call, and its error if it failed
+        metrics = self.metrics
+        if metrics is None:
+            return
+        endpoint = endpoint_label(url)
+        labels = {"endpoint": endpoint}
+        metrics.inc(REQUESTS, labels)
+        metrics.observe(REQUEST_SECONDS, labels, time.perf_counter() - started)
+        if error is not None:
+            self._count_error(endpoint, error)
+
+    def _count_bytes(self, url: str, size: int) -> None:
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.inc(RESPONSE_BYTES, {"endpoint": endpoint_label(url)}, size)
+
+    def _count_error(self, operation: str, error: Exception) -> None:
+        metrics = self.metrics
+        if metrics is not None:
+            labels = {"operation": operation, "error": type(error).__name__}
+            metrics.inc(ERRORS, labels)
+
+    def _measure_parse(
+        self, parser: str, parse: Callable[[dict], Any], json_data: dict
+    ) -> Any:
+        metrics = self.metrics
+        if metrics is None:
+            return parse(json_data)
+        started = time.perf_counter()
+        try:
+            result = parse(json_data)
+        except Exception as error:
+            self._count_error(parser, error)
+            raise
+        seconds = time.perf_counter() - started
+        metrics.observe(PARSE_SECONDS, {"parser": parser}, seconds)
+        return result
+
     def _parse_story_data(self, json_data: dict) -> List[Story]:
+        archive = self._story_archive(json_data)
+        stories = self._parse_stories(json_data)
+        # After parsing, so that the parse time does not include the database write
+        if archive is not None:
+            archive.add_items(json_data["content"]["story"])
+        return stories
+
+    def _story_archive(self, json_data: dict) -> Union[StoryArchive, None]:
+        # Archive for the stories of a response, None if there is nothing to archive
+        if self.archive is None:
+            return None
+        if self.conditional is not None and self.conditional.parsed(json_data):
+            # Stories of an unchanged response have been archived before
+            return None
+        return self.archive
+
+    def _parse_stories(self, json_data: dict) -> List[Story]:
+        if self.metrics is None:
+            return self._story_list(json_data)
+        stories = self._measure_parse("stories", self._story_list, json_data)
+        self.metrics.observe(PAGE_STORIES, {}, len(stories))
+        return stories
+
+    def _story_list(self, json_data: dict) -> List[Story]:
+        if self.conditional is not None:
+            # Stories of an unchanged response have been parsed before
+            parsed = self.conditional.parsed(json_data)
+            if parsed is not None:
+                return parsed
+
         stories_list = []
         for item in json_data["content"]["story"]:
-            stories_list.append(Story(item))
+            stories_list.append(self._make_story(item))
 
+        if self.conditional is not None:
+            self.conditional.set_parsed(json_data, stories_list)
         return stories_list
 
+    def _make_story(self, item: dict) -> Story:
+        # Story object of the model selected for this API object
+        if self.lazy_models:
+            return LazyStory(item)  # type: ignore
+        if self.compact_models:
+            return CompactStory(  # type: ignore
+                item, self.keep_raw_data, self.epoch_published
+            )
+        return Story(item)
+
     def _parse_search_results(self, json_data: dict) -> Union[List[Entity], None]:
+        if self.metrics is None:
+            return self._search_result_list(json_data)
+        return self._measure_parse(
+            "search_results", self._search_result_list, json_data
+        )
+
+    def _search_result_list(self, json_data: dict) -> Union[List[Entity], None]:
         if "content" in json_data:
-            search_results_list = []
+            search_results_list: list = []
             for item in json_data["content"]["result"]:
-                search_results_list.append(Entity(item))
+                if self.compact_models:
+                    search_results_list.append(CompactEntity(item, self.keep_raw_data))
+                else:
+                    search_results_list.append(Entity(item))
             return search_results_list
         else:
             return None
 
-    def get_public_service_news(
-        self, media: str = None, start: int = 0, limit: int = 50, teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for public service news (police and fire departments, etc.).
-
-        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/publicservice.
-
-        Args:
-            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+    def _parse_company(self, json_data: dict) -> Company:
+        if self.compact_models:
+            return CompactCompany(json_data["company"], self.keep_raw_data)  # type: ignore
+        return Company(json_data["company"])
 
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            MediaError: API does not support the requested media type.
+    def _parse_office(self, json_data: dict) -> Office:
+        if self.compact_models:
+            return CompactOffice(json_data["office"], self.keep_raw_data)  # type: ignore
+        return Office(json_data["office"])
 
-        Returns:
-            List[Story]: List of Story objects
-        """
+    def _prepare_public_service_news(
+        self, media: str = None, start: int = 0, limit: int = 50, teaser: bool = False,
+    ) -> Union[RequestComponents, None]:
         if not self._is_media_valid(media, PUBLIC_SERVICE_MEDIA_TYPES):
-            return []
+            return None
         # Set up query components
-        base_url = "https://api.presseportal.de/api/article/publicservice"
-        url, params, headers = self._build_request(
-            base_url, media, start, limit, teaser
-        )
-
-        # Query API and map results
-        json_data = self._get_data(url=url, params=params, headers=headers)
-        return self._parse_story_data(json_data)
+        base_url = f"{self.api_url}/article/publicservice"
+        return self._build_request(base_url, media, start, limit, teaser)
 
-    def get_public_service_specific_office(
+    def _prepare_public_service_specific_office(
         self,
         id: str,
         media: str = None,
         start: int = 0,
         limit: int = 50,
         teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for stories released by a specific public service office.
-
-        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/publicservice/office/id
-
-        Args:
-            id (str): id of office (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
-            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
-
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            MediaError: API does not support the requested media type.
-
-        Returns:
-            List[Story]: List of Story objects
-        """
-        if self._is_media_valid(media, PUBLIC_SERVICE_MEDIA_TYPES):
-            # Set up query components
-            if type(id) is not str:
-                id = str(id)
-            base_url = (
-                f"https://api.presseportal.de/api/article/publicservice/office/{id}"
-            )
-            url, params, headers = self._build_request(
-                base_url, media, start, limit, teaser
-            )
-
-            # Query API and map results
-            json_data = self._get_data(url=url, params=params, headers=headers)
-            stories_list = self._parse_story_data(json_data)
-        else:
-            stories_list = []
-
-        return stories_list
+    ) -> Union[RequestComponents, None]:
+        if not self._is_media_valid(media, PUBLIC_SERVICE_MEDIA_TYPES):
+            return None
+        # Set up query components
+        if type(id) is not str:
+            id = str(id)
+        base_url = f"{self.api_url}/article/publicservice/office/{id}"
+        return self._build_request(base_url, media, start, limit, teaser)
 
-    def get_public_service_specific_region(
+    def _prepare_public_service_specific_region(
         self,
         region_code: str,
         media: str = None,
         start: int = 0,
         limit: int = 50,
         teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for stories by public service offices in a specific region.
-
-        Returns a list of :class:`pypresseportal.Story` objects. List of region codes and more information: https://api.presseportal.de/doc/article/publicservice/region.
-
-        Args:
-            region_code (str): Only request stories located in this specific region.
-            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
-
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            MediaError: API does not support the requested media type.
-            RegionError: API does not support the requested region code.
-
-        Returns:
-            List[Story]: List of Story objects
-        """
+    ) -> Union[RequestComponents, None]:
         # Check if region is supported by API
         if region_code not in PUBLIC_SERVICE_REGIONS:
             raise RegionError(region_code, PUBLIC_SERVICE_REGIONS)
 
-        if self._is_media_valid(media, PUBLIC_SERVICE_MEDIA_TYPES):
-            # Set up query components
-            base_url = f"https://api.presseportal.de/api/article/publicservice/region/{region_code}"
-            url, params, headers = self._build_request(
-                base_url, media, start, limit, teaser
-            )
-
-            # Query API and map results
-            json_data = self._get_data(url=url, params=params, headers=headers)
-            stories_list = self._parse_story_data(json_data)
-        else:
-            stories_list = []
-
-        return stories_list
+        if not self._is_media_valid(media, PUBLIC_SERVICE_MEDIA_TYPES):
+            return None
+        # Set up query components
+        base_url = f"{self.api_url}/article/publicservice/region/{region_code}"
+        return self._build_request(base_url, media, start, limit, teaser)
 
-    def get_stories(
+    def _prepare_stories(
         self, media: str = None, start: int = 0, limit: int = 50, teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for most recent press releases.
-
-        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/all.
-
-        Args:
-            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
-
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            MediaError: API does not support the requested media type.
-
-        Returns:
-            List[Story]: List of Story objects
-        """
-        if self._is_media_valid(media):
-            # Set up query components
-            base_url = "https://api.presseportal.de/api/article/all"
-            url, params, headers = self._build_request(
-                base_url, media, start, limit, teaser
-            )
-            # Query API and map results
-            json_data = self._get_data(url=url, params=params, headers=headers)
-            stories_list = self._parse_story_data(json_data)
-        else:
-            stories_list = []
-
-        return stories_list
+    ) -> Union[RequestComponents, None]:
+        if not self._is_media_valid(media):
+            return None
+        # Set up query components
+        base_url = f"{self.api_url}/article/all"
+        return self._build_request(base_url, media, start, limit, teaser)
 
-    def get_stories_specific_company(
+    def _prepare_stories_specific_company(
         self,
         id: str,
         media: str = None,
         start: int = 0,
         limit: int = 50,
         teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for press releases of a specific company.
-
-        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/en/doc/article/company/id
-
-        Args:
-            id (str): id of company (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
-            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
-
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            MediaError: API does not support the requested media type.
-
-        Returns:
-            List[Story]: List of Story objects
-        """
-        if self._is_media_valid(media):
-            # Set up query components
-            if type(id) is not str:
-                id = str(id)
-            base_url = f"https://api.presseportal.de/api/article/company/{id}"
-            url, params, headers = self._build_request(
-                base_url, media, start, limit, teaser
-            )
-
-            # Query API and map results
-            json_data = self._get_data(url=url, params=params, headers=headers)
-            stories_list = self._parse_story_data(json_data)
-        else:
-            stories_list = []
-
-        return stories_list
+    ) -> Union[RequestComponents, None]:
+        if not self._is_media_valid(media):
+            return None
+        # Set up query components
+        if type(id) is not str:
+            id = str(id)
+        base_url = f"{self.api_url}/article/company/{id}"
+        return self._build_request(base_url, media, start, limit, teaser)
 
-    def get_stories_topic(
+    def _prepare_stories_topic(
         self,
         topic: str,
         media: str = None,
         start: int = 0,
         limit: int = 50,
         teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for most recent press releases assigned to a specific topic.
-
-        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/topic/ident
-
-        Args:
-            topic (str): One specific topic from https://api.presseportal.de/doc/value/topic
-            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
-
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            MediaError: API does not support the requested media type.
-            TopicError: API does not support the requested topic.
-
-        Returns:
-            List[Story]: List of Story objects
-        """
+    ) -> Union[RequestComponents, None]:
         # Check if topic is supported by API
         if topic not in TOPICS:
             raise TopicError(topic, TOPICS)
 
-        if self._is_media_valid(media):
-            # Set up query components
-            base_url = f"https://api.presseportal.de/api/article/topic/{topic}"
-            url, params, headers = self._build_request(
-                base_url, media, start, limit, teaser
-            )
-
-            # Query API and map results
-            json_data = self._get_data(url=url, params=params, headers=headers)
-            stories_list = self._parse_story_data(json_data)
-        else:
-            stories_list = []
-
-        return stories_list
+        if not self._is_media_valid(media):
+            return None
+        # Set up query components
+        base_url = f"{self.api_url}/article/topic/{topic}"
+        return self._build_request(base_url, media, start, limit, teaser)
 
-    def get_stories_keywords(
+    def _prepare_stories_keywords(
         self,
         keywords: List[str],
         media: str = None,
         start: int = 0,
         limit: int = 50,
         teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for most recent press releases assigned to specific keywords.
+    ) -> Union[RequestComponents, None]:
+        # Check if keywords are supported by API
+        for keyword in keywords:
+            if keyword not in KEYWORDS:
+                raise KeywordError(keyword, KEYWORDS)
 
-        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/keyword/ident
+        # Construct keyword string
+        keywords_str = ",".join(keywords)
 
-        Args:
-            keywords (List[str]):  A list of one ore more keywords from https://api.presseportal.de/doc/value/keyword
-            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+        if not self._is_media_valid(media):
+            return None
+        # Set up query components
+        base_url = f"{self.api_url}/article/keyword/{keywords_str}"
+        return self._build_request(base_url, media, start, limit, teaser)
 
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            MediaError: API does not support the requested media type.
-            KeywordError: API does not support the requested keyword(s).
-
-        Returns:
-            List[Story]: List of Story objects
-        """
-        # Check if keywords are supported by API
-        for keyword in keywords:
-            if keyword not in KEYWORDS:
-                raise KeywordError(keyword, KEYWORDS)
-
-        # Construct keyword string
-        keywords_str = ",".join(keywords)
-
-        if self._is_media_valid(media):
-            # Set up query components
-            base_url = f"https://api.presseportal.de/api/article/keyword/{keywords_str}"
-            url, params, headers = self._build_request(
-                base_url, media, start, limit, teaser
-            )
-
-            # Query API and map results
-            json_data = self._get_data(url=url, params=params, headers=headers)
-            stories_list = self._parse_story_data(json_data)
-        else:
-            stories_list = []
-
-        return stories_list
-
-    def get_investor_relations_news(
+    def _prepare_investor_relations_news(
         self,
         news_type: str = "all",
         start: int = 0,
         limit: int = 50,
         teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for most recent investor relations press releases.
-
-        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/ir/list
-
-        Args:
-            news_type (str, optional): Investor relations news type (https://api.presseportal.de/doc/value/ir_type). Defaults to "all".
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
-
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            NewsTypeError: API does not support the requested news type.
-
-        Returns:
-            List[Story]: List of Story objects
-        """
+    ) -> Union[RequestComponents, None]:
         # Check if investor relations news type is supported by API
         if news_type.lower() not in INVESTOR_RELATIONS_NEWS_TYPES:
             raise NewsTypeError(news_type, INVESTOR_RELATIONS_NEWS_TYPES)
 
         # Set up query components
-        base_url = f"https://api.presseportal.de/api/ir/{news_type.lower()}"
-        url, params, headers = self._build_request(
+        base_url = f"{self.api_url}/ir/{news_type.lower()}"
+        return self._build_request(
             base_url=base_url, media=None, start=start, limit=limit, teaser=teaser
         )
 
-        # Query API and map results
-        json_data = self._get_data(url=url, params=params, headers=headers)
-        stories_list = self._parse_story_data(json_data)
-
-        return stories_list
-
-    def get_investor_relations_news_company(
+    def _prepare_investor_relations_news_company(
         self,
         id: str,
         news_type: str = "all",
         start: int = 0,
         limit: int = 50,
         teaser: bool = False,
-    ) -> List[Story]:
-        """Queries API for investor relations press releases of a specific company.
-
-        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/ir/company/id/list
-
-        Args:
-            id (str): id of company (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
-            news_type (str, optional): Investor relations news type (https://api.presseportal.de/doc/value/ir_type). Defaults to "all".
-            start (int, optional): Start/offset of the result article list. Defaults to 0.
-            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
-            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
-
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            NewsTypeError: API does not support the requested news type.
-
-        Returns:
-            List[Story]: List of Story objects
-        """
+    ) -> Union[RequestComponents, None]:
         # Check if investor relations news type is supported by API
         if news_type.lower() not in INVESTOR_RELATIONS_NEWS_TYPES:
             raise NewsTypeError(news_type, INVESTOR_RELATIONS_NEWS_TYPES)
@@ -703,43 +655,17 @@ class PresseportalApi:
         # Set up query components
         if type(id) is not str:
             id = str(id)
-        base_url = (
-            f"https://api.presseportal.de/api/ir/company/{id}/{news_type.lower()}"
-        )
-        url, params, headers = self._build_request(
+        base_url = f"{self.api_url}/ir/company/{id}/{news_type.lower()}"
+        return self._build_request(
             base_url=base_url, media=None, start=start, limit=limit, teaser=teaser
         )
 
-        # Query API and map results
-        json_data = self._get_data(url=url, params=params, headers=headers)
-        stories_list = self._parse_story_data(json_data)
-
-        return stories_list
-
-    def get_entity_search_results(
+    def _prepare_entity_search_results(
         self,
         search_term: Union[str, List[str]],
         entity: str = "company",
         limit: int = 20,
-    ) -> Union[List[Entity], None]:
-        """Search for company or public service office by location or name.
-
-        Returns a list of :class:`pypresseportal.Entity` objects. More information: https://api.presseportal.de/doc/search/company
-
-        Args:
-            search_term (Union[str, List[str]]): One or multiple search terms (min 3 chars.).
-            entity (str, optional): Search for 'office' or 'company'. Defaults to "company".
-            limit (int, optional): Limit number of objects in response (API maximum is 20). Defaults to 20.
-
-        Raises:
-            ApiConnectionFail: Could not connect to API.
-            ApiError: API returned an error.
-            SearchTermError: Api does not support the requested search term.
-            SearchEntityError: Api does not support the requested entity.
-
-        Returns:
-            Union[List[Entity], None]: List of Entity objects. None if nothing found.
-        """
+    ) -> RequestComponents:
         # Check search term
         if isinstance(search_term, list):
             search_term = ",".join(search_term).lower()
@@ -750,14 +676,14 @@ class PresseportalApi:
 
         # Check entity and define base_url
         if entity.lower() == "office":
-            base_url = "https://api.presseportal.de/api/search/office"
+            base_url = f"{self.api_url}/search/office"
         elif entity.lower() == "company":
-            base_url = "https://api.presseportal.de/api/search/company"
+            base_url = f"{self.api_url}/search/company"
         else:
             raise SearchEntityError(entity)
 
         # Set up query components
-        url, params, headers = self._build_request(
+        return self._build_request(
             base_url=base_url,
             media=None,
             start=None,
@@ -766,66 +692,1397 @@ class PresseportalApi:
             search_term=search_term,
         )
 
-        # Query API and map results
-        json_data = self._get_data(url=url, params=params, headers=headers)
-        search_results_list = self._parse_search_results(json_data)
+    def _prepare_company_information(self, id: str) -> RequestComponents:
+        # Check id and define base_url
+        if type(id) is not str:
+            id = str(id)
+        base_url = f"{self.api_url}/info/company/{id}"
 
-        return search_results_list
+        # Set up query components
+        return self._build_request(base_url=base_url)
 
-    def get_company_information(self, id: str) -> Company:
-        """Queries API for detailed information about a specific company.
+    def _prepare_public_service_office_information(self, id: str) -> RequestComponents:
+        # Check id and define base_url
+        if type(id) is not str:
+            id = str(id)
+        base_url = f"{self.api_url}/info/office/{id}"
 
-        Returns a :class:`pypresseportal.Company` object. More information: https://api.presseportal.de/doc/info/company/id
+        # Set up query components
+        return self._build_request(base_url=base_url)
+
+    def _prepare_story_query(
+        self, endpoint: str, start: int, limit: int, arguments: Dict
+    ) -> Union[RequestComponents, None]:
+        # Request components of a story query method, e.g. "get_stories_topic"
+        if endpoint not in STORY_ENDPOINTS:
+            raise ValueError(f"'{endpoint}' is not a story query method.")
+        prepare = getattr(self, "_prepare_" + endpoint[len("get_") :])
+        return prepare(start=start, limit=limit, **arguments)
+
+
+class PresseportalApi(PresseportalApiBase):
+    """A Python interface into the presseportal.de API.
+
+    The website presseportal.de is a service provided by 'news aktuell', owned by dpa
+    (Deutsche Presse Agentur). An API key from presseportal.de is required.
+    You can find more information and apply for an API key at
+    https://api.presseportal.de/en. The documentation for PyPresseportal is at
+    https://pypresseportal.readthedocs.io/.
+
+    First, create an instance of the ``PresseportalApi`` class, using your API key:
+
+    >>> from pypresseportal import PresseportalApi
+    >>> api_object = PresseportalApi(YOUR_API_KEY)
+
+    Next, request data from the API, using the various methods in this class.
+
+    For example:
+
+    Use the method get_stories() to access the most recently published stories (https://api.presseportal.de/doc/article/all).
+    If no arguments are provided, PyPresseportal defaults to retrieving the 50 most
+    recent stories available. For example:
+
+        >>> stories = api_object.get_stories()
+
+    Story data can be accessed through the individual Story object's attributes. For example:
+
+        >>> stories[0].title
+        "Kohls Wohnhaus hat keinen Denkmalwert"
+        >>> stories[0].id
+        "4622388"
+
+    All queries are sent through a pooled keep-alive HTTP session, which is shared
+    with every other ``PresseportalApi`` object using the same API key and pool settings.
+    Use the object as a context manager (or call :meth:`close`) to release the session:
+
+        >>> with PresseportalApi(YOUR_API_KEY, pool_maxsize=20) as api_object:
+        ...     stories = api_object.get_stories()
+
+    Args:
+        api_key (str): Your API key from presseportal.de.
+        pool_connections (int, optional): Number of host connection pools to cache. Defaults to 10.
+        pool_maxsize (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+        keep_alive (bool, optional): Reuse connections between requests. Defaults to True.
+        pool_block (bool, optional): Wait for a free connection instead of opening additional connections when the pool is exhausted. Defaults to False.
+        cache (BaseCache, optional): Cache for API responses, for example a :class:`pypresseportal.pypresseportal_cache.ResponseCache`. Defaults to None (no caching).
+        conditional_requests (bool, optional): Send ``If-None-Match``/``If-Modified-Since`` headers and reuse the previously parsed stories if a response is unchanged. Defaults to False.
+        rate_limiter (RateLimiter, optional): A :class:`pypresseportal.pypresseportal_ratelimit.RateLimiter` for all requests of this object (it can be shared with other objects). Defaults to None (no limit).
+        retry (RetryPolicy, optional): A :class:`pypresseportal.pypresseportal_ratelimit.RetryPolicy` for repeating requests that failed for transient reasons. Defaults to None (no retries).
+        compact_models (bool, optional): Return the memory-compact models of :mod:`pypresseportal.pypresseportal_compact` (for example :class:`pypresseportal.pypresseportal_compact.CompactStory`) instead of ``Story``, ``Entity``, ``Company`` and ``Office``. Defaults to False.
+        keep_raw_data (bool, optional): Keep the raw json data in the ``data`` attribute of compact models. Set to False to save memory. Defaults to True.
+        lazy_models (bool, optional): Return :class:`pypresseportal.pypresseportal_lazy.LazyStory` objects, which decode each attribute on first access, instead of ``Story``. Takes precedence over ``compact_models`` for stories. Defaults to False.
+        epoch_published (bool, optional): Store the publication date of compact stories as an integer ``published_epoch``, see :class:`pypresseportal.pypresseportal_compact.CompactStory`. Defaults to False.
+        json_decoder (JsonDecoder, optional): Function decoding the raw bytes of a response, see :mod:`pypresseportal.pypresseportal_json`. Defaults to None (``orjson`` if it is installed, otherwise ``json``).
+        archive (StoryArchive, optional): Store every story returned by a query in this archive, see :mod:`pypresseportal.pypresseportal_archive`. Defaults to None.
+        metrics (MetricsSink, optional): Sink for request, parsing and error metrics, see :mod:`pypresseportal.pypresseportal_metrics`. Defaults to None (no metrics).
+        api_url (str, optional): Base URL of the API, for example of the local stand-in of :mod:`pypresseportal.pypresseportal_mockserver`. Defaults to "https://api.presseportal.de/api".
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        pool_block: bool = False,
+        cache: BaseCache = None,
+        conditional_requests: bool = False,
+        rate_limiter: RateLimiter = None,
+        retry: RetryPolicy = None,
+        compact_models: bool = False,
+        keep_raw_data: bool = True,
+        lazy_models: bool = False,
+        epoch_published: bool = False,
+        json_decoder: JsonDecoder = None,
+        archive: StoryArchive = None,
+        metrics: MetricsSink = None,
+        api_url: str = API_URL,
+    ):
+        """Constructor method."""
+        super().__init__(
+            api_key,
+            cache,
+            conditional_requests,
+            rate_limiter,
+            retry,
+            compact_models,
+            keep_raw_data,
+            lazy_models,
+            epoch_published,
+            json_decoder,
+            archive,
+            metrics,
+            api_url,
+        )
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.pool_block = pool_block
+        self._session: Union[requests.Session, None] = None
+        self._session_lock = threading.Lock()
+
+    def __enter__(self) -> "PresseportalApi":
+        """Enters a ``with`` block, returns the API object."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Leaves a ``with`` block and releases the HTTP session."""
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled HTTP session used for all queries.
+
+        The session is acquired from the shared pool on first use. Threads of
+        :meth:`fetch_many` that start at the same time acquire it only once.
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                session = self._session
+                if session is None:
+                    session = self._session = session_pool.acquire(
+                        self.api_key,
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        keep_alive=self.keep_alive,
+                        pool_block=self.pool_block,
+                    )
+        return session
+
+    def close(self) -> None:
+        """Releases the HTTP session.
+
+        Connections are closed once no other ``PresseportalApi`` object shares the session.
+        The API object can still be used afterwards, it then acquires a new session.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                session_pool.release(self._session)
+                self._session = None
+
+    def _get_data(self, url: str, params: dict, headers: dict) -> dict:
+        if self.metrics is None:
+            return self._cached_data(url, params, headers)
+        started = time.perf_counter()
+        try:
+            json_data = self._cached_data(url, params, headers)
+        except Exception as error:
+            self._record_request(url, started, error)
+            raise
+        self._record_request(url, started)
+        return json_data
+
+    def _cached_data(self, url: str, params: dict, headers: dict) -> dict:
+        if self.cache is None:
+            return self._request_data(url, params, headers)
+
+        cache_key = self.cache.key(url, params)
+        json_data = self.cache.get(cache_key)
+        if json_data is not None:
+            return json_data
+        try:
+            json_data = self._request_data(url, params, headers)
+        except ApiConnectionFail:
+            # Serve the last good response, if there is one
+            json_data = self.cache.get_stale(cache_key)
+            if json_data is None:
+                raise
+            return json_data
+        self.cache.set(cache_key, url, json_data)
+        return json_data
+
+    def _request_data(self, url: str, params: dict, headers: dict) -> dict:
+        attempt = 0
+        while True:
+            # The policy, if this attempt may be repeated
+            retry = (
+                self.retry
+                if self.retry is not None and self.retry.can_retry(attempt)
+                else None
+            )
+            try:
+                return self._send_request(url, params, headers, retry)
+            except (ApiConnectionFail, ApiError, RetryableResponse) as error:
+                if retry is None or not retry.should_retry(error):
+                    raise
+                retry_after = getattr(error, "retry_after", None)
+                if retry_after is not None and self.rate_limiter is not None:
+                    # Hold back all other requests sharing the rate limiter, too
+                    self.rate_limiter.pause(retry_after)
+                retry.wait(attempt, retry_after)
+                attempt += 1
+
+    def _send_request(
+        self, url: str, params: dict, headers: dict, retry: RetryPolicy = None
+    ) -> dict:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        entry = None
+        if self.conditional is not None:
+            conditional_key = self.conditional.key(url, params)
+            entry = self.conditional.get(conditional_key)
+            if entry is not None:
+                headers = entry.request_headers(headers)
+        try:
+            request = self.session.get(url=url, params=params, headers=headers)
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.TooManyRedirects,
+            requests.exceptions.Timeout,
+        ) as error:
+            raise ApiConnectionFail(error)
+        if self.metrics is not None:
+            self._count_bytes(url, len(request.content))
+        if retry is not None and request.status_code in retry.statuses:
+            raise RetryableResponse(
+                request.status_code,
+                parse_retry_after(request.headers.get("Retry-After")),
+            )
+        if self.conditional is not None:
+            return self._conditional_json_data(
+                self.conditional,
+                conditional_key,
+                entry,
+                request.status_code,
+                request.headers,
+                request.content,
+                lambda: self.json_decoder(request.content),
+            )
+        json_data = self.json_decoder(request.content)
+        return self._check_json_data(json_data)
+
+    def _iter_pages(
+        self,
+        method: Callable[..., List[Story]],
+        start: int,
+        max_stories: Union[int, None],
+        page_size: int,
+        **kwargs,
+    ) -> Iterator[Story]:
+        # Request pages until the API returns a short page or max_stories is reached.
+        # Only the current page is referenced while its stories are yielded.
+        page_size = max(1, min(page_size, STORIES_LIMIT_MAX))
+        yielded = 0
+        while max_stories is None or yielded < max_stories:
+            limit = page_size
+            if max_stories is not None:
+                limit = min(page_size, max_stories - yielded)
+            page = method(start=start, limit=limit, **kwargs)
+            page_length = len(page)
+            for story in page:
+                yield story
+            del page
+            yielded += page_length
+            start += page_length
+            if page_length < limit:
+                return
+
+    def get_public_service_news(
+        self, media: str = None, start: int = 0, limit: int = 50, teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for public service news (police and fire departments, etc.).
+
+        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/publicservice.
 
         Args:
-            id (str): id of company (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
 
         Raises:
             ApiConnectionFail: Could not connect to API.
             ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
 
         Returns:
-            Company: An object containing details about the requested company.
+            List[Story]: List of Story objects
         """
-        # Check id and define base_url
-        if type(id) is not str:
-            id = str(id)
-        base_url = f"https://api.presseportal.de/api/info/company/{id}"
-
-        # Set up query components
-        url, params, headers = self._build_request(base_url=base_url)
+        request = self._prepare_public_service_news(media, start, limit, teaser)
+        if request is None:
+            return []
 
         # Query API and map results
+        url, params, headers = request
         json_data = self._get_data(url=url, params=params, headers=headers)
-        company_info = Company(json_data["company"])
-
-        return company_info
+        return self._parse_story_data(json_data)
 
-    def get_public_service_office_information(self, id: str) -> Office:
-        """Queries API for detailed information about a specific public service office (police or fire department, etc.).
+    def get_public_service_specific_office(
+        self,
+        id: str,
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for stories released by a specific public service office.
 
-        Returns a :class:`pypresseportal.Office` object. More information: https://api.presseportal.de/doc/info/office/id
+        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/publicservice/office/id
 
         Args:
             id (str): id of office (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
 
         Raises:
             ApiConnectionFail: Could not connect to API.
             ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
 
         Returns:
-            Office: An object containing details about the requested office.
+            List[Story]: List of Story objects
         """
-        # Check id and define base_url
-        if type(id) is not str:
-            id = str(id)
-        base_url = f"https://api.presseportal.de/api/info/office/{id}"
-
-        # Set up query components
-        url, params, headers = self._build_request(base_url=base_url)
+        request = self._prepare_public_service_specific_office(
+            id, media, start, limit, teaser
+        )
+        if request is None:
+            return []
 
         # Query API and map results
+        url, params, headers = request
         json_data = self._get_data(url=url, params=params, headers=headers)
-        office_info = Office(json_data["office"])
+        return self._parse_story_data(json_data)
+
+    def get_public_service_specific_region(
+        self,
+        region_code: str,
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for stories by public service offices in a specific region.
+
+        Returns a list of :class:`pypresseportal.Story` objects. List of region codes and more information: https://api.presseportal.de/doc/article/publicservice/region.
+
+        Args:
+            region_code (str): Only request stories located in this specific region.
+            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+            RegionError: API does not support the requested region code.
+
+        Returns:
+            List[Story]: List of Story objects
+        """
+        request = self._prepare_public_service_specific_region(
+            region_code, media, start, limit, teaser
+        )
+        if request is None:
+            return []
 
-        return office_info
+        # Query API and map results
+        url, params, headers = request
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_story_data(json_data)
+
+    def get_stories(
+        self, media: str = None, start: int = 0, limit: int = 50, teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for most recent press releases.
+
+        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/all.
+
+        Args:
+            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+
+        Returns:
+            List[Story]: List of Story objects
+        """
+        request = self._prepare_stories(media, start, limit, teaser)
+        if request is None:
+            return []
+
+        # Query API and map results
+        url, params, headers = request
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_story_data(json_data)
+
+    def get_stories_specific_company(
+        self,
+        id: str,
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for press releases of a specific company.
+
+        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/en/doc/article/company/id
+
+        Args:
+            id (str): id of company (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+
+        Returns:
+            List[Story]: List of Story objects
+        """
+        request = self._prepare_stories_specific_company(
+            id, media, start, limit, teaser
+        )
+        if request is None:
+            return []
+
+        # Query API and map results
+        url, params, headers = request
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_story_data(json_data)
+
+    def get_stories_topic(
+        self,
+        topic: str,
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for most recent press releases assigned to a specific topic.
+
+        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/topic/ident
+
+        Args:
+            topic (str): One specific topic from https://api.presseportal.de/doc/value/topic
+            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+            TopicError: API does not support the requested topic.
+
+        Returns:
+            List[Story]: List of Story objects
+        """
+        request = self._prepare_stories_topic(topic, media, start, limit, teaser)
+        if request is None:
+            return []
+
+        # Query API and map results
+        url, params, headers = request
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_story_data(json_data)
+
+    def get_stories_keywords(
+        self,
+        keywords: List[str],
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for most recent press releases assigned to specific keywords.
+
+        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/article/keyword/ident
+
+        Args:
+            keywords (List[str]):  A list of one ore more keywords from https://api.presseportal.de/doc/value/keyword
+            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+            KeywordError: API does not support the requested keyword(s).
+
+        Returns:
+            List[Story]: List of Story objects
+        """
+        request = self._prepare_stories_keywords(keywords, media, start, limit, teaser)
+        if request is None:
+            return []
+
+        # Query API and map results
+        url, params, headers = request
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_story_data(json_data)
+
+    def get_investor_relations_news(
+        self,
+        news_type: str = "all",
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for most recent investor relations press releases.
+
+        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/ir/list
+
+        Args:
+            news_type (str, optional): Investor relations news type (https://api.presseportal.de/doc/value/ir_type). Defaults to "all".
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            NewsTypeError: API does not support the requested news type.
+
+        Returns:
+            List[Story]: List of Story objects
+        """
+        request = self._prepare_investor_relations_news(news_type, start, limit, teaser)
+        if request is None:
+            return []
+
+        # Query API and map results
+        url, params, headers = request
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_story_data(json_data)
+
+    def get_investor_relations_news_company(
+        self,
+        id: str,
+        news_type: str = "all",
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Queries API for investor relations press releases of a specific company.
+
+        Returns a list of :class:`pypresseportal.Story` objects. More information: https://api.presseportal.de/doc/ir/company/id/list
+
+        Args:
+            id (str): id of company (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+            news_type (str, optional): Investor relations news type (https://api.presseportal.de/doc/value/ir_type). Defaults to "all".
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            NewsTypeError: API does not support the requested news type.
+
+        Returns:
+            List[Story]: List of Story objects
+        """
+        request = self._prepare_investor_relations_news_company(
+            id, news_type, start, limit, teaser
+        )
+        if request is None:
+            return []
+
+        # Query API and map results
+        url, params, headers = request
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_story_data(json_data)
+
+    def get_entity_search_results(
+        self,
+        search_term: Union[str, List[str]],
+        entity: str = "company",
+        limit: int = 20,
+    ) -> Union[List[Entity], None]:
+        """Search for company or public service office by location or name.
+
+        Returns a list of :class:`pypresseportal.Entity` objects. More information: https://api.presseportal.de/doc/search/company
+
+        Args:
+            search_term (Union[str, List[str]]): One or multiple search terms (min 3 chars.).
+            entity (str, optional): Search for 'office' or 'company'. Defaults to "company".
+            limit (int, optional): Limit number of objects in response (API maximum is 20). Defaults to 20.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            SearchTermError: Api does not support the requested search term.
+            SearchEntityError: Api does not support the requested entity.
+
+        Returns:
+            Union[List[Entity], None]: List of Entity objects. None if nothing found.
+        """
+        url, params, headers = self._prepare_entity_search_results(
+            search_term, entity, limit
+        )
+
+        # Query API and map results
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_search_results(json_data)
+
+    def get_company_information(self, id: str) -> Company:
+        """Queries API for detailed information about a specific company.
+
+        Returns a :class:`pypresseportal.Company` object. More information: https://api.presseportal.de/doc/info/company/id
+
+        Args:
+            id (str): id of company (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+
+        Returns:
+            Company: An object containing details about the requested company.
+        """
+        url, params, headers = self._prepare_company_information(id)
+
+        # Query API and map results
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_company(json_data)
+
+    def get_public_service_office_information(self, id: str) -> Office:
+        """Queries API for detailed information about a specific public service office (police or fire department, etc.).
+
+        Returns a :class:`pypresseportal.Office` object. More information: https://api.presseportal.de/doc/info/office/id
+
+        Args:
+            id (str): id of office (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+
+        Returns:
+            Office: An object containing details about the requested office.
+        """
+        url, params, headers = self._prepare_public_service_office_information(id)
+
+        # Query API and map results
+        json_data = self._get_data(url=url, params=params, headers=headers)
+        return self._parse_office(json_data)
+
+    def get_story_batch(
+        self,
+        endpoint: str = "get_stories",
+        start: int = 0,
+        max_stories: Union[int, None] = STORIES_LIMIT_MAX,
+        page_size: int = STORIES_LIMIT_MAX,
+        **arguments,
+    ) -> StoryBatch:
+        """Queries API for stories and returns them as columns in a :class:`pypresseportal.StoryBatch`.
+
+        Requests pages of a story query method, like the ``iter_*`` methods, and stores
+        the stories of all pages in one batch without creating ``Story`` objects.
+        For example, the 500 most recent finance stories:
+
+        >>> batch = api_object.get_story_batch("get_stories_topic", topic="finanzen", max_stories=500)
+
+        The raw json data is kept in the batch unless the object was created with ``keep_raw_data=False``.
+
+        Args:
+            endpoint (str, optional): Name of a story query method, for example ``"get_stories_topic"``. Defaults to "get_stories".
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (Union[int, None], optional): Maximum number of stories, None for all available stories. Defaults to 50.
+            page_size (int, optional): Number of stories per request (API maximum is 50). Defaults to 50.
+            **arguments: Further arguments of the query method, except ``start`` and ``limit``.
+
+        Raises:
+            ValueError: ``endpoint`` is not a story query method.
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+
+        Returns:
+            StoryBatch: Stories of all requested pages.
+        """
+        batch = StoryBatch.empty(self.keep_raw_data)
+        page_size = max(1, min(page_size, STORIES_LIMIT_MAX))
+        while max_stories is None or len(batch) < max_stories:
+            limit = page_size
+            if max_stories is not None:
+                limit = min(page_size, max_stories - len(batch))
+            request = self._prepare_story_query(endpoint, start, limit, arguments)
+            if request is None:
+                break
+            url, params, headers = request
+            json_data = self._get_data(url=url, params=params, headers=headers)
+            page_length = len(json_data["content"]["story"])
+            if self.metrics is not None:
+                self.metrics.observe(PAGE_STORIES, {}, page_length)
+            batch.extend(json_data["content"]["story"])
+            if self.archive is not None:
+                self.archive.add_items(json_data["content"]["story"])
+            start += page_length
+            if page_length < limit:
+                break
+        return batch
+
+    def stream_stories(
+        self,
+        endpoint: str = "get_stories",
+        start: int = 0,
+        limit: int = STORIES_LIMIT_MAX,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **arguments,
+    ) -> Iterator[Story]:
+        """Queries API for a page of stories and yields each story as soon as it has been received.
+
+        The response is parsed incrementally while it is downloaded (see
+        :mod:`pypresseportal.pypresseportal_stream`), so the first story is available
+        before the whole page has arrived and the page is never held in memory as a
+        whole. This is most useful for pages of full text stories (``teaser=False``):
+
+        >>> for story in api_object.stream_stories("get_stories_topic", topic="finanzen"):
+        ...     process(story)
+
+        Streamed responses are neither cached nor sent as conditional requests, and
+        they are not retried. The rate limiter of the object is used, and each story is
+        stored in the archive of the object, if any, as soon as it has been received.
+        The request metrics, if any, time the whole stream, until the last story has
+        been yielded or the caller stops reading.
+
+        Args:
+            endpoint (str, optional): Name of a story query method, for example ``"get_stories_topic"``. Defaults to "get_stories".
+            start (int, optional): Start/offset of the result article list. Defaults to 0.
+            limit (int, optional): Limit number of articles in response (API maximum is 50). Defaults to 50.
+            chunk_size (int, optional): Number of bytes read from the connection at once. Defaults to 16384.
+            **arguments: Further arguments of the query method, for example ``topic`` or ``teaser``.
+
+        Raises:
+            ValueError: ``endpoint`` is not a story query method.
+            ApiConnectionFail: Could not connect to API, or the connection broke while the response was read.
+            ApiError: API returned an error, or an HTTP error status without an error object.
+            ApiDataError: API returned invalid data.
+
+        Yields:
+            Story: Stories in the order of the response.
+        """
+        request = self._prepare_story_query(endpoint, start, limit, arguments)
+        if request is None:
+            return
+        url, params, headers = request
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        started = time.perf_counter()
+        failure: Union[Exception, None] = None
+        try:
+            with self.session.get(
+                url=url, params=params, headers=headers, stream=True
+            ) as response:
+                self._check_stream_status(response)
+                chunks = response.iter_content(chunk_size=chunk_size)
+                if self.metrics is not None:
+                    chunks = self._counted_chunks(url, chunks)
+                for item in iter_story_items(chunks, self.json_decoder):
+                    if self.archive is not None:
+                        self.archive.add_items([item])
+                    yield self._make_story(item)
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.TooManyRedirects,
+            requests.exceptions.Timeout,
+            # Raised while reading the body, after the connection was established
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ContentDecodingError,
+        ) as error:
+            failure = ApiConnectionFail(error)
+            raise failure
+        except Exception as error:
+            failure = error
+            raise
+        finally:
+            self._record_request(url, started, failure)
+
+    def _check_stream_status(self, response: requests.Response) -> None:
+        # Error responses are small, so they are decoded and checked as a whole
+        if response.status_code < 400:
+            return
+        try:
+            json_data = self.json_decoder(response.content)
+        except ValueError:
+            json_data = None
+        if isinstance(json_data, dict) and "error" in json_data:
+            self._check_json_data(json_data)
+        raise ApiError(str(response.status_code), response.reason)
+
+    def _counted_chunks(self, url: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self._count_bytes(url, len(chunk))
+            yield chunk
+
+    def iter_public_service_news(
+        self,
+        media: str = None,
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_public_service_news`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_public_service_news()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_public_service_news(
+            media=media, teaser=teaser, start=start, limit=page_size
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_public_service_news,
+            start,
+            max_stories,
+            page_size,
+            media=media,
+            teaser=teaser,
+        )
+
+    def iter_public_service_specific_office(
+        self,
+        id: str,
+        media: str = None,
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_public_service_specific_office`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_public_service_specific_office()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            id (str): id of office (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_public_service_specific_office(
+            id=id, media=media, teaser=teaser, start=start, limit=page_size
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_public_service_specific_office,
+            start,
+            max_stories,
+            page_size,
+            id=id,
+            media=media,
+            teaser=teaser,
+        )
+
+    def iter_public_service_specific_region(
+        self,
+        region_code: str,
+        media: str = None,
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_public_service_specific_region`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_public_service_specific_region()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            region_code (str): Only request stories located in this specific region.
+            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+            RegionError: API does not support the requested region code.
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_public_service_specific_region(
+            region_code=region_code,
+            media=media,
+            teaser=teaser,
+            start=start,
+            limit=page_size,
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_public_service_specific_region,
+            start,
+            max_stories,
+            page_size,
+            region_code=region_code,
+            media=media,
+            teaser=teaser,
+        )
+
+    def iter_stories(
+        self,
+        media: str = None,
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_stories`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_stories()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_stories(
+            media=media, teaser=teaser, start=start, limit=page_size
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_stories, start, max_stories, page_size, media=media, teaser=teaser
+        )
+
+    def iter_stories_specific_company(
+        self,
+        id: str,
+        media: str = None,
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_stories_specific_company`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_stories_specific_company()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            id (str): id of company (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_stories_specific_company(
+            id=id, media=media, teaser=teaser, start=start, limit=page_size
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_stories_specific_company,
+            start,
+            max_stories,
+            page_size,
+            id=id,
+            media=media,
+            teaser=teaser,
+        )
+
+    def iter_stories_topic(
+        self,
+        topic: str,
+        media: str = None,
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_stories_topic`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_stories_topic()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            topic (str): One specific topic from https://api.presseportal.de/doc/value/topic
+            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+            TopicError: API does not support the requested topic.
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_stories_topic(
+            topic=topic, media=media, teaser=teaser, start=start, limit=page_size
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_stories_topic,
+            start,
+            max_stories,
+            page_size,
+            topic=topic,
+            media=media,
+            teaser=teaser,
+        )
+
+    def iter_stories_keywords(
+        self,
+        keywords: List[str],
+        media: str = None,
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_stories_keywords`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_stories_keywords()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            keywords (List[str]): A list of one ore more keywords from https://api.presseportal.de/doc/value/keyword
+            media (str, optional): Only request stories containing this specific media type (``image``, ``document``, ``audio`` or ``video``). Defaults to None.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            MediaError: API does not support the requested media type.
+            KeywordError: API does not support the requested keyword(s).
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_stories_keywords(
+            keywords=keywords, media=media, teaser=teaser, start=start, limit=page_size
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_stories_keywords,
+            start,
+            max_stories,
+            page_size,
+            keywords=keywords,
+            media=media,
+            teaser=teaser,
+        )
+
+    def iter_investor_relations_news(
+        self,
+        news_type: str = "all",
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_investor_relations_news`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_investor_relations_news()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            news_type (str, optional): Investor relations news type (https://api.presseportal.de/doc/value/ir_type). Defaults to "all".
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            NewsTypeError: API does not support the requested news type.
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_investor_relations_news(
+            news_type=news_type, teaser=teaser, start=start, limit=page_size
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_investor_relations_news,
+            start,
+            max_stories,
+            page_size,
+            news_type=news_type,
+            teaser=teaser,
+        )
+
+    def iter_investor_relations_news_company(
+        self,
+        id: str,
+        news_type: str = "all",
+        teaser: bool = False,
+        start: int = 0,
+        max_stories: int = None,
+        page_size: int = STORIES_LIMIT_MAX,
+    ) -> Iterator[Story]:
+        """Iterates over all stories of :meth:`get_investor_relations_news_company`, requesting further pages as needed.
+
+        Stories are yielded lazily. Arguments are validated when ``iter_investor_relations_news_company()`` is called,
+        the API is queried once the first story is requested.
+
+        Args:
+            id (str): id of company (read Entity.id of a :meth:`get_entity_search_results()` search for this id).
+            news_type (str, optional): Investor relations news type (https://api.presseportal.de/doc/value/ir_type). Defaults to "all".
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            start (int, optional): Start/offset of the first story. Defaults to 0.
+            max_stories (int, optional): Stop after this many stories. Defaults to None (all available stories).
+            page_size (int, optional): Number of stories requested per page (API maximum is 50). Defaults to 50.
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+            NewsTypeError: API does not support the requested news type.
+
+        Yields:
+            Story: Story objects, most recent first.
+        """
+        request = self._prepare_investor_relations_news_company(
+            id=id, news_type=news_type, teaser=teaser, start=start, limit=page_size
+        )
+        if request is None:
+            return iter([])
+        return self._iter_pages(
+            self.get_investor_relations_news_company,
+            start,
+            max_stories,
+            page_size,
+            id=id,
+            news_type=news_type,
+            teaser=teaser,
+        )
+
+    def _fetch_page(self, job: FetchJob, page: int) -> List[Story]:
+        if job.endpoint not in STORY_ENDPOINTS:
+            raise ValueError(f"'{job.endpoint}' is not a story query method.")
+        method = getattr(self, job.endpoint)
+        arguments = job.arguments or {}
+        return method(start=page * job.page_size, limit=job.page_size, **arguments)
+
+    def fetch_many(
+        self, jobs: Iterable[FetchJob], max_workers: int = None
+    ) -> List[FetchResult]:
+        """Requests many pages of one or more story queries concurrently.
+
+        Every page of every job is requested on a bounded thread pool, so the total time
+        depends on the number of workers rather than on the number of requests. For
+        example, to request 20 pages of each topic:
+
+        >>> from pypresseportal import FetchJob
+        >>> from pypresseportal.pypresseportal_constants import TOPICS
+        >>> jobs = [FetchJob("get_stories_topic", {"topic": topic}, range(20)) for topic in TOPICS]
+        >>> results = api_object.fetch_many(jobs, max_workers=10)
+
+        Errors do not abort the batch. They are returned in the ``error`` attribute of the
+        affected job's :class:`pypresseportal.FetchResult`, all other jobs are still completed.
+
+        Args:
+            jobs (Iterable[FetchJob]): Queries and page ranges to request.
+            max_workers (int, optional): Maximum number of simultaneous requests. Defaults to None (``pool_maxsize`` of this object, so that every worker can keep its connection alive).
+
+        Returns:
+            List[FetchResult]: One result per job, in the order of ``jobs``.
+        """
+        if max_workers is None:
+            max_workers = self.pool_maxsize
+        jobs = list(jobs)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures: List[List[Future]] = [
+                [executor.submit(self._fetch_page, job, page) for page in job.pages]
+                for job in jobs
+            ]
+
+        results = []
+        for job, job_futures in zip(jobs, futures):
+            stories: List[Story] = []
+            error = None
+            for future in job_futures:
+                try:
+                    stories.extend(future.result())
+                except Exception as page_error:
+                    # Keep the first error of the job, collect all other pages
+                    if error is None:
+                        error = page_error
+            results.append(FetchResult(job, stories, error))
+
+        return results
+
+    def _fetch_tagged(
+        self,
+        endpoint: str,
+        argument: str,
+        origins: List[str],
+        media: Union[str, None],
+        limit: int,
+        teaser: bool,
+        max_workers: Union[int, None],
+    ) -> List[TaggedStory]:
+        # Validate all origins before sending the first request
+        prepare = getattr(self, "_prepare_" + endpoint[4:])
+        for origin in origins:
+            if prepare(origin, media, 0, limit, teaser) is None:
+                return []
+        jobs = [
+            FetchJob(
+                endpoint,
+                {argument: origin, "media": media, "teaser": teaser},
+                page_size=limit,
+            )
+            for origin in origins
+        ]
+        results = self.fetch_many(jobs, max_workers)
+        for result in results:
+            if result.error is not None:
+                raise result.error
+        return merge_tagged(
+            (origin, result.stories) for origin, result in zip(origins, results)
+        )
+
+    def get_public_service_regions(
+        self,
+        region_codes: Iterable[str] = PUBLIC_SERVICE_REGIONS,
+        media: str = None,
+        limit: int = 50,
+        teaser: bool = False,
+        max_workers: int = None,
+    ) -> List[TaggedStory]:
+        """Queries API for the most recent stories of many regions at once.
+
+        Requests the first page of :meth:`get_public_service_specific_region` for every
+        region concurrently, see :meth:`fetch_many`, and merges them into one list. Stories
+        returned for more than one region are only included once. For example, all of
+        Germany in one call:
+
+        >>> for tagged in api_object.get_public_service_regions():
+        ...     print(tagged.origin, tagged.story.title)
+
+        Args:
+            region_codes (Iterable[str], optional): Region codes to query. Defaults to all regions in ``PUBLIC_SERVICE_REGIONS``.
+            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
+            limit (int, optional): Limit number of articles per region (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            max_workers (int, optional): Maximum number of simultaneous requests. Defaults to None (``pool_maxsize`` of this object).
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error. The first error, in the order of ``region_codes``, is raised after all requests have finished.
+            MediaError: API does not support the requested media type.
+            RegionError: API does not support a requested region code. Raised before any request is sent.
+
+        Returns:
+            List[TaggedStory]: Stories of all regions, most recent first, each tagged with the regions that returned it.
+        """
+        return self._fetch_tagged(
+            "get_public_service_specific_region",
+            "region_code",
+            list(dict.fromkeys(region_codes)),
+            media,
+            limit,
+            teaser,
+            max_workers,
+        )
+
+    def get_public_service_offices(
+        self,
+        ids: Iterable[str],
+        media: str = None,
+        limit: int = 50,
+        teaser: bool = False,
+        max_workers: int = None,
+    ) -> List[TaggedStory]:
+        """Queries API for the most recent stories of many public service offices at once.
+
+        Like :meth:`get_public_service_regions`, for :meth:`get_public_service_specific_office`.
+
+        Args:
+            ids (Iterable[str]): Ids of the offices to query.
+            media (str, optional): Only request stories containing this specific media type (``image`` or ``document``). Defaults to None.
+            limit (int, optional): Limit number of articles per office (API maximum is 50). Defaults to 50.
+            teaser (bool, optional): Returns stories with ``teaser`` instead of ``body`` (fulltext) if set to True. Defaults to False.
+            max_workers (int, optional): Maximum number of simultaneous requests. Defaults to None (``pool_maxsize`` of this object).
+
+        Raises:
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error. The first error, in the order of ``ids``, is raised after all requests have finished.
+            MediaError: API does not support the requested media type.
+
+        Returns:
+            List[TaggedStory]: Stories of all offices, most recent first, each tagged with the ids of the offices that returned it.
+        """
+        return self._fetch_tagged(
+            "get_public_service_specific_office",
+            "id",
+            list(dict.fromkeys(str(id) for id in ids)),
+            media,
+            limit,
+            teaser,
+            max_workers,
+        )
@@ -0,0 +1,286 @@
+"""Local archive of stories.
+
+A :class:`StoryArchive` stores stories in a SQLite database file: the raw json data
+of every story, together with its id, publishing company or office, keywords and
+publication date in indexed columns. Stories can be looked up by id and queried by
+company, office, keyword and time range without any requests to the API:
+
+>>> from datetime import datetime, timezone
+>>> from pypresseportal.pypresseportal_archive import StoryArchive
+>>> archive = StoryArchive("/var/lib/presseportal/archive.db")
+>>> archive.add_many(api_object.get_stories())
+>>> story = archive.get("4635945")
+>>> june = archive.query(
+...     keyword="Umwelt",
+...     start=datetime(2020, 6, 1, tzinfo=timezone.utc),
+...     end=datetime(2020, 7, 1, tzinfo=timezone.utc),
+... )
+
+Pass an archive to :class:`pypresseportal.PresseportalApi` to store every story
+returned by the API automatically:
+
+>>> api_object = PresseportalApi(YOUR_API_KEY, archive=StoryArchive("archive.db"))
+
+The database uses write-ahead logging, so stories are appended without rewriting
+the file and many processes can read and write the same archive at the same time.
+"""
+
+import json
+
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Tuple, Union
+
+from pypresseportal.pypresseportal_compact import _check_required, _publisher_ids
+from pypresseportal.pypresseportal_constants import STORY_REQUIRED_KEYS
+from pypresseportal.pypresseportal_dates import published_epoch_offset
+from pypresseportal.pypresseportal_sqlite import SqliteConnections
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS stories ("
+    "id TEXT PRIMARY KEY, published INTEGER NOT NULL, "
+    "published_offset INTEGER NOT NULL, company_id TEXT, office_id TEXT, "
+    "title TEXT NOT NULL, data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS stories_published ON stories (published)",
+    "CREATE INDEX IF NOT EXISTS stories_company "
+    "ON stories (company_id, published) WHERE company_id IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS stories_office "
+    "ON stories (office_id, published) WHERE office_id IS NOT NULL",
+    "CREATE TABLE IF NOT EXISTS keywords ("
+    "keyword TEXT NOT NULL, story_id TEXT NOT NULL, published INTEGER NOT NULL, "
+    "PRIMARY KEY (keyword, story_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS keywords_story ON keywords (story_id)",
+    "CREATE INDEX IF NOT EXISTS keywords_published ON keywords (keyword, published)",
+)
+
+
+def _time_range(
+    column: str, start: Union[datetime, int, None], end: Union[datetime, int, None]
+) -> Tuple[List[str], List[int]]:
+    # SQL conditions and parameters for start <= column < end
+    conditions, params = [], []
+    for operator, bound in ((">=", start), ("<", end)):
+        if bound is not None:
+            conditions.append(f"{column} {operator} ?")
+            params.append(
+                int(bound.timestamp()) if isinstance(bound, datetime) else int(bound)
+            )
+    return conditions, params
+
+
+class StoryArchive:
+    """Stores stories in a SQLite database, with indexes for lookups and time ranges.
+
+    Adding a story with an id that is already in the archive replaces it, so the
+    archive always holds the most recent version of every story. Each thread and
+    each process opens its own connection.
+
+    Args:
+        path (str): Path of the database file, created if it does not exist.
+        timeout (float, optional): Seconds to wait for a lock held by another process. Defaults to 30.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """Constructor method."""
+        self.path = path
+        self.timeout = timeout
+        self._connections = SqliteConnections(path, timeout)
+        conn = self._connections.get()
+        for statement in _SCHEMA:
+            conn.execute(statement)
+
+    def close(self) -> None:
+        """Closes the database connection of the calling thread."""
+        self._connections.close()
+
+    def __len__(self) -> int:
+        """Returns the number of archived stories."""
+        return (
+            self._connections.get()
+            .execute("SELECT COUNT(*) FROM stories")
+            .fetchone()[0]
+        )
+
+    def __contains__(self, story_id: Any) -> bool:
+        """Returns True if a story with this id is archived."""
+        row = (
+            self._connections.get()
+            .execute("SELECT 1 FROM stories WHERE id = ?", (story_id,))
+            .fetchone()
+        )
+        return row is not None
+
+    def add_items(self, items: Iterable[dict]) -> int:
+        """Stores the json data of stories, in one transaction.
+
+        Args:
+            items (Iterable[dict]): Json data of the stories, as in ``content.story`` of an API response.
+
+        Raises:
+            ApiDataError: A required key is missing. No story is stored.
+
+        Returns:
+            int: Number of stored stories.
+        """
+        rows: List[tuple] = []
+        keyword_rows: List[Tuple[str, str, int]] = []
+        for item in items:
+            _check_required(item, STORY_REQUIRED_KEYS)
+            epoch, offset = published_epoch_offset(item["published"])
+            company_id, office_id = _publisher_ids(item)
+            rows.append(
+                (
+                    item["id"],
+                    epoch,
+                    offset,
+                    company_id,
+                    office_id,
+                    item["title"],
+                    json.dumps(item, ensure_ascii=False),
+                )
+            )
+            keywords = item.get("keywords")
+            if type(keywords) is dict and "keyword" in keywords:
+                keyword_rows.extend(
+                    (keyword, item["id"], epoch) for keyword in keywords["keyword"]
+                )
+        if not rows:
+            return 0
+
+        with self._connections.write() as conn:
+            conn.executemany(
+                "DELETE FROM keywords WHERE story_id = ?", ((row[0],) for row in rows)
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO stories (id, published, published_offset, "
+                "company_id, office_id, title, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO keywords (keyword, story_id, published) "
+                "VALUES (?, ?, ?)",
+                keyword_rows,
+            )
+        return len(rows)
+
+    def add(self, story: Any) -> None:
+        """Stores a story.
+
+        Args:
+            story (Story): ``Story``, ``LazyStory`` or ``CompactStory`` object that kept its raw data.
+        """
+        self.add_items([story.data])
+
+    def add_many(self, stories: Iterable[Any]) -> int:
+        """Stores stories, in one transaction.
+
+        Args:
+            stories (Iterable[Story]): Story objects that kept their raw data.
+
+        Returns:
+            int: Number of stored stories.
+        """
+        return self.add_items(story.data for story in stories)
+
+    def get(self, story_id: str, model: Callable[[dict], Any] = None) -> Any:
+        """Returns an archived story.
+
+        Args:
+            story_id (str): Id of the story.
+            model (Callable[[dict], Any], optional): Story class, for example :class:`pypresseportal.pypresseportal_lazy.LazyStory`. Defaults to :class:`pypresseportal.Story`.
+
+        Returns:
+            Union[Story, None]: The story, None if it is not archived.
+        """
+        row = (
+            self._connections.get()
+            .execute("SELECT data FROM stories WHERE id = ?", (story_id,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return self._models([row], model)[0]
+
+    def query(
+        self,
+        company_id: str = None,
+        office_id: str = None,
+        keyword: str = None,
+        start: Union[datetime, int, None] = None,
+        end: Union[datetime, int, None] = None,
+        limit: int = None,
+        model: Callable[[dict], Any] = None,
+    ) -> List[Any]:
+        """Returns the archived stories matching all given conditions, most recent first.
+
+        Args:
+            company_id (str, optional): Only stories of this company. Defaults to None.
+            office_id (str, optional): Only stories of this public service office. Defaults to None.
+            keyword (str, optional): Only stories with this keyword. Defaults to None.
+            start (Union[datetime, int], optional): Only stories published at or after this time (aware datetime or seconds since the epoch). Defaults to None.
+            end (Union[datetime, int], optional): Only stories published before this time. Defaults to None.
+            limit (int, optional): Maximum number of stories. Defaults to None (no limit).
+            model (Callable[[dict], Any], optional): Story class. Defaults to :class:`pypresseportal.Story`.
+
+        Returns:
+            List[Story]: Matching stories, most recent first.
+        """
+        conditions = []
+        params: List[Any] = []
+        if keyword is not None:
+            table = "keywords JOIN stories ON stories.id = keywords.story_id"
+            conditions.append("keywords.keyword = ?")
+            params.append(keyword)
+            published = "keywords.published"
+        else:
+            table = "stories"
+            published = "stories.published"
+        for column, value in (
+            ("stories.company_id", company_id),
+            ("stories.office_id", office_id),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(str(value))
+        range_conditions, range_params = _time_range(published, start, end)
+        conditions.extend(range_conditions)
+        params.extend(range_params)
+
+        sql = f"SELECT stories.data FROM {table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {published} DESC, stories.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self._connections.get().execute(sql, params).fetchall()
+        return self._models(rows, model)
+
+    def count(
+        self,
+        start: Union[datetime, int, None] = None,
+        end: Union[datetime, int, None] = None,
+    ) -> int:
+        """Returns the number of stories published in a time range.
+
+        Args:
+            start (Union[datetime, int], optional): Start of the range, inclusive. Defaults to None.
+            end (Union[datetime, int], optional): End of the range, exclusive. Defaults to None.
+
+        Returns:
+            int: Number of stories.
+        """
+        conditions, params = _time_range("published", start, end)
+        sql = "SELECT COUNT(*) FROM stories"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        return self._connections.get().execute(sql, params).fetchone()[0]
+
+    @staticmethod
+    def _models(
+        rows: List[Tuple[str]], model: Union[Callable[[dict], Any], None]
+    ) -> List[Any]:
+        if model is None:
+            from pypresseportal.pypresseportal import Story
+
+            model = Story
+        return [model(json.loads(row[0])) for row in rows]
@@ -0,0 +1,467 @@
+"""Asyncio client for the presseportal.de API.
+
+``AsyncPresseportalApi`` offers the same queries as :class:`pypresseportal.PresseportalApi`
+as coroutines, so that many queries can run concurrently from one event loop.
+It requires the optional ``aiohttp`` package (``pip install pypresseportal[async]``).
+"""
+
+import asyncio
+import time
+
+from typing import Any, Callable, Iterable, List, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+from pypresseportal.pypresseportal import (
+    Company,
+    Entity,
+    Office,
+    PresseportalApiBase,
+    Story,
+)
+from pypresseportal.pypresseportal_bulk import TaggedStory, merge_tagged
+from pypresseportal.pypresseportal_archive import StoryArchive
+from pypresseportal.pypresseportal_cache import BaseCache
+from pypresseportal.pypresseportal_constants import API_URL, PUBLIC_SERVICE_REGIONS
+from pypresseportal.pypresseportal_json import JsonDecoder
+from pypresseportal.pypresseportal_metrics import MetricsSink
+from pypresseportal.pypresseportal_errors import ApiConnectionFail, ApiError
+from pypresseportal.pypresseportal_ratelimit import (
+    RateLimiter,
+    RetryableResponse,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0
+
+
+class AsyncPresseportalApi(PresseportalApiBase):
+    """An asyncio interface into the presseportal.de API.
+
+    All query methods of :class:`pypresseportal.PresseportalApi` are available as
+    coroutines with the same arguments, validation and return values:
+
+    >>> from pypresseportal import AsyncPresseportalApi
+    >>> async with AsyncPresseportalApi(YOUR_API_KEY) as api_object:
+    ...     stories, news = await asyncio.gather(
+    ...         api_object.get_stories(), api_object.get_public_service_news()
+    ...     )
+
+    Queries share one ``aiohttp.ClientSession``, which is created on first use and
+    closed by :meth:`close` or when leaving the ``async with`` block.
+
+    Args:
+        api_key (str): Your API key from presseportal.de.
+        limit (int, optional): Maximum number of simultaneous connections. Defaults to 100.
+        limit_per_host (int, optional): Maximum number of simultaneous connections to one host, 0 for no limit. Defaults to 0.
+        keep_alive (bool, optional): Reuse connections between requests. Defaults to True.
+        cache (BaseCache, optional): Cache for API responses. Caches with ``blocking_io``, such as :class:`pypresseportal.pypresseportal_cache.SqliteCache`, are called from a worker thread. Defaults to None (no caching).
+        conditional_requests (bool, optional): Send conditional requests and reuse the previous result if a response is unchanged. Defaults to False.
+        rate_limiter (RateLimiter, optional): Rate limiter for all requests, waits with ``asyncio.sleep``. Defaults to None (no limit).
+        retry (RetryPolicy, optional): Policy for repeating failed requests. Defaults to None (no retries).
+        compact_models (bool, optional): Return the memory-compact models of :mod:`pypresseportal.pypresseportal_compact`. Defaults to False.
+        keep_raw_data (bool, optional): Keep the raw json data in the ``data`` attribute of compact models. Defaults to True.
+        lazy_models (bool, optional): Return stories that decode each attribute on first access, see :mod:`pypresseportal.pypresseportal_lazy`. Defaults to False.
+        epoch_published (bool, optional): Store the publication date of compact stories as an integer ``published_epoch``, see :class:`pypresseportal.pypresseportal_compact.CompactStory`. Defaults to False.
+        json_decoder (JsonDecoder, optional): Function decoding the raw bytes of a response, see :mod:`pypresseportal.pypresseportal_json`. Defaults to None (``orjson`` if it is installed, otherwise ``json``).
+        archive (StoryArchive, optional): Store every story returned by a query in this archive, see :mod:`pypresseportal.pypresseportal_archive`. Defaults to None.
+        metrics (MetricsSink, optional): Sink for request, parsing and error metrics, see :mod:`pypresseportal.pypresseportal_metrics`. Defaults to None (no metrics).
+        api_url (str, optional): Base URL of the API, for example of the local stand-in of :mod:`pypresseportal.pypresseportal_mockserver`. Defaults to "https://api.presseportal.de/api".
+
+    Raises:
+        ImportError: ``aiohttp`` is not installed.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keep_alive: bool = True,
+        cache: BaseCache = None,
+        conditional_requests: bool = False,
+        rate_limiter: RateLimiter = None,
+        retry: RetryPolicy = None,
+        compact_models: bool = False,
+        keep_raw_data: bool = True,
+        lazy_models: bool = False,
+        epoch_published: bool = False,
+        json_decoder: JsonDecoder = None,
+        archive: StoryArchive = None,
+        metrics: MetricsSink = None,
+        api_url: str = API_URL,
+    ):
+        """Constructor method."""
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncPresseportalApi requires aiohttp (pip install pypresseportal[async])."
+            )
+        super().__init__(
+            api_key,
+            cache,
+            conditional_requests,
+            rate_limiter,
+            retry,
+            compact_models,
+            keep_raw_data,
+            lazy_models,
+            epoch_published,
+            json_decoder,
+            archive,
+            metrics,
+            api_url,
+        )
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keep_alive = keep_alive
+        self._session: Union["aiohttp.ClientSession", None] = None
+
+    async def __aenter__(self) -> "AsyncPresseportalApi":
+        """Enters an ``async with`` block, returns the API object."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Leaves an ``async with`` block and closes the HTTP session."""
+        await self.close()
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """The HTTP session used for all queries, created on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                force_close=not self.keep_alive,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the HTTP session and all of its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_data(self, url: str, params: dict, headers: dict) -> dict:
+        if self.metrics is None:
+            return await self._cached_data(url, params, headers)
+        started = time.perf_counter()
+        try:
+            json_data = await self._cached_data(url, params, headers)
+        except Exception as error:
+            self._record_request(url, started, error)
+            raise
+        self._record_request(url, started)
+        return json_data
+
+    async def _cached_data(self, url: str, params: dict, headers: dict) -> dict:
+        cache = self.cache
+        if cache is None:
+            return await self._request_data(url, params, headers)
+
+        cache_key = cache.key(url, params)
+        json_data = await self._call_cache(cache, cache.get, cache_key)
+        if json_data is not None:
+            return json_data
+        try:
+            json_data = await self._request_data(url, params, headers)
+        except ApiConnectionFail:
+            # Serve the last good response, if there is one
+            json_data = await self._call_cache(cache, cache.get_stale, cache_key)
+            if json_data is None:
+                raise
+            return json_data
+        await self._call_cache(cache, cache.set, cache_key, url, json_data)
+        return json_data
+
+    @staticmethod
+    async def _call_cache(
+        cache: BaseCache, method: Callable[..., Any], *args: Any
+    ) -> Any:
+        # Caches that read files, e.g. SqliteCache, would block the event loop
+        if not cache.blocking_io:
+            return method(*args)
+        return await asyncio.get_event_loop().run_in_executor(None, method, *args)
+
+    async def _request_data(self, url: str, params: dict, headers: dict) -> dict:
+        attempt = 0
+        while True:
+            # The policy, if this attempt may be repeated
+            retry = (
+                self.retry
+                if self.retry is not None and self.retry.can_retry(attempt)
+                else None
+            )
+            try:
+                return await self._send_request(url, params, headers, retry)
+            except (ApiConnectionFail, ApiError, RetryableResponse) as error:
+                if retry is None or not retry.should_retry(error):
+                    raise
+                retry_after = getattr(error, "retry_after", None)
+                if retry_after is not None and self.rate_limiter is not None:
+                    self.rate_limiter.pause(retry_after)
+                await asyncio.sleep(retry.backoff(attempt, retry_after))
+                attempt += 1
+
+    async def _send_request(
+        self, url: str, params: dict, headers: dict, retry: RetryPolicy = None
+    ) -> dict:
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        entry = None
+        if self.conditional is not None:
+            conditional_key = self.conditional.key(url, params)
+            entry = self.conditional.get(conditional_key)
+            if entry is not None:
+                headers = entry.request_headers(headers)
+        try:
+            async with self.session.get(
+                url, params=params, headers=headers
+            ) as response:
+                content = await response.read()
+        except (
+            aiohttp.ClientConnectionError,
+            aiohttp.TooManyRedirects,
+            asyncio.TimeoutError,
+        ) as error:
+            raise ApiConnectionFail(error)
+        if self.metrics is not None:
+            self._count_bytes(url, len(content))
+        if retry is not None and response.status in retry.statuses:
+            raise RetryableResponse(
+                response.status, parse_retry_after(response.headers.get("Retry-After"))
+            )
+        if self.conditional is not None:
+            return self._conditional_json_data(
+                self.conditional,
+                conditional_key,
+                entry,
+                response.status,
+                response.headers,
+                content,
+                lambda: self.json_decoder(content),
+            )
+        json_data = self.json_decoder(content)
+        return self._check_json_data(json_data)
+
+    async def _get_stories(self, request) -> List[Story]:
+        if request is None:
+            return []
+
+        # Query API and map results
+        url, params, headers = request
+        json_data = await self._get_data(url=url, params=params, headers=headers)
+        archive = self._story_archive(json_data)
+        stories = self._parse_stories(json_data)
+        if archive is not None:
+            # The database write would block the event loop
+            await asyncio.get_event_loop().run_in_executor(
+                None, archive.add_items, json_data["content"]["story"]
+            )
+        return stories
+
+    async def get_public_service_news(
+        self, media: str = None, start: int = 0, limit: int = 50, teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_public_service_news`."""
+        return await self._get_stories(
+            self._prepare_public_service_news(media, start, limit, teaser)
+        )
+
+    async def get_public_service_specific_office(
+        self,
+        id: str,
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_public_service_specific_office`."""
+        return await self._get_stories(
+            self._prepare_public_service_specific_office(
+                id, media, start, limit, teaser
+            )
+        )
+
+    async def get_public_service_specific_region(
+        self,
+        region_code: str,
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_public_service_specific_region`."""
+        return await self._get_stories(
+            self._prepare_public_service_specific_region(
+                region_code, media, start, limit, teaser
+            )
+        )
+
+    async def get_stories(
+        self, media: str = None, start: int = 0, limit: int = 50, teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_stories`."""
+        return await self._get_stories(
+            self._prepare_stories(media, start, limit, teaser)
+        )
+
+    async def get_stories_specific_company(
+        self,
+        id: str,
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_stories_specific_company`."""
+        return await self._get_stories(
+            self._prepare_stories_specific_company(id, media, start, limit, teaser)
+        )
+
+    async def get_stories_topic(
+        self,
+        topic: str,
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_stories_topic`."""
+        return await self._get_stories(
+            self._prepare_stories_topic(topic, media, start, limit, teaser)
+        )
+
+    async def get_stories_keywords(
+        self,
+        keywords: List[str],
+        media: str = None,
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_stories_keywords`."""
+        return await self._get_stories(
+            self._prepare_stories_keywords(keywords, media, start, limit, teaser)
+        )
+
+    async def get_investor_relations_news(
+        self,
+        news_type: str = "all",
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_investor_relations_news`."""
+        return await self._get_stories(
+            self._prepare_investor_relations_news(news_type, start, limit, teaser)
+        )
+
+    async def get_investor_relations_news_company(
+        self,
+        id: str,
+        news_type: str = "all",
+        start: int = 0,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[Story]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_investor_relations_news_company`."""
+        return await self._get_stories(
+            self._prepare_investor_relations_news_company(
+                id, news_type, start, limit, teaser
+            )
+        )
+
+    async def get_entity_search_results(
+        self,
+        search_term: Union[str, List[str]],
+        entity: str = "company",
+        limit: int = 20,
+    ) -> Union[List[Entity], None]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_entity_search_results`."""
+        url, params, headers = self._prepare_entity_search_results(
+            search_term, entity, limit
+        )
+
+        # Query API and map results
+        json_data = await self._get_data(url=url, params=params, headers=headers)
+        return self._parse_search_results(json_data)
+
+    async def get_company_information(self, id: str) -> Company:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_company_information`."""
+        url, params, headers = self._prepare_company_information(id)
+
+        # Query API and map results
+        json_data = await self._get_data(url=url, params=params, headers=headers)
+        return self._parse_company(json_data)
+
+    async def get_public_service_office_information(self, id: str) -> Office:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_public_service_office_information`."""
+        url, params, headers = self._prepare_public_service_office_information(id)
+
+        # Query API and map results
+        json_data = await self._get_data(url=url, params=params, headers=headers)
+        return self._parse_office(json_data)
+
+    async def _get_tagged(
+        self,
+        endpoint: str,
+        origins: List[str],
+        media: Union[str, None],
+        limit: int,
+        teaser: bool,
+    ) -> List[TaggedStory]:
+        # Validate all origins before sending the first request
+        prepare = getattr(self, "_prepare_" + endpoint[4:])
+        requests = [prepare(origin, media, 0, limit, teaser) for origin in origins]
+        if any(request is None for request in requests):
+            return []
+        pages = await asyncio.gather(
+            *(self._get_stories(request) for request in requests),
+            return_exceptions=True,
+        )
+        stories: List[List[Story]] = []
+        for page in pages:
+            if isinstance(page, BaseException):
+                raise page
+            stories.append(page)
+        return merge_tagged(zip(origins, stories))
+
+    async def get_public_service_regions(
+        self,
+        region_codes: Iterable[str] = PUBLIC_SERVICE_REGIONS,
+        media: str = None,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[TaggedStory]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_public_service_regions`, all regions are requested at once."""
+        return await self._get_tagged(
+            "get_public_service_specific_region",
+            list(dict.fromkeys(region_codes)),
+            media,
+            limit,
+            teaser,
+        )
+
+    async def get_public_service_offices(
+        self,
+        ids: Iterable[str],
+        media: str = None,
+        limit: int = 50,
+        teaser: bool = False,
+    ) -> List[TaggedStory]:
+        """Coroutine version of :meth:`pypresseportal.PresseportalApi.get_public_service_offices`, all offices are requested at once."""
+        return await self._get_tagged(
+            "get_public_service_specific_office",
+            list(dict.fromkeys(str(id) for id in ids)),
+            media,
+            limit,
+            teaser,
+        )
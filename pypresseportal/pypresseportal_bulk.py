@@ -0,0 +1,101 @@
+"""Job and result types for concurrent bulk queries.
+
+See :meth:`pypresseportal.PresseportalApi.fetch_many` and
+:meth:`pypresseportal.PresseportalApi.get_public_service_regions`.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypresseportal.pypresseportal import Story
+
+# Methods of PresseportalApi that return a page of stories
+STORY_ENDPOINTS = (
+    "get_public_service_news",
+    "get_public_service_specific_office",
+    "get_public_service_specific_region",
+    "get_stories",
+    "get_stories_specific_company",
+    "get_stories_topic",
+    "get_stories_keywords",
+    "get_investor_relations_news",
+    "get_investor_relations_news_company",
+)
+
+
+class FetchJob(NamedTuple):
+    """Describes a range of pages to request from one story query.
+
+    For example, the first 20 pages of a topic:
+
+    >>> FetchJob("get_stories_topic", {"topic": "auto"}, range(20))
+
+    Args:
+        endpoint (str): Name of a story query method of ``PresseportalApi``, for example ``"get_stories_topic"``.
+        arguments (dict, optional): Keyword arguments for the query method, except ``start`` and ``limit``. Defaults to None.
+        pages (range, optional): Page numbers to request, page ``n`` starts at story ``n * page_size``. Defaults to the first page.
+        page_size (int, optional): Number of stories per page (API maximum is 50). Defaults to 50.
+    """
+
+    endpoint: str
+    arguments: Union[Dict[str, Any], None] = None
+    pages: range = range(1)
+    page_size: int = 50
+
+
+class FetchResult(NamedTuple):
+    """Result of a :class:`FetchJob`.
+
+    Args:
+        job (FetchJob): The job this result belongs to.
+        stories (List[Story]): Stories of all pages that were retrieved, in page order.
+        error (Exception, optional): First error raised while requesting the pages of this job, None if all pages were retrieved.
+    """
+
+    job: FetchJob
+    stories: List["Story"]
+    error: Union[Exception, None] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if all pages of the job were retrieved."""
+        return self.error is None
+
+
+class TaggedStory(NamedTuple):
+    """A story of a merged result, tagged with the queries that returned it.
+
+    Args:
+        story (Story): The story.
+        origins (Tuple[str, ...]): Region codes or office ids of all queries that returned the story, in the order they were requested.
+    """
+
+    story: "Story"
+    origins: Tuple[str, ...]
+
+    @property
+    def origin(self) -> str:
+        """Region code or office id of the first query that returned the story."""
+        return self.origins[0]
+
+
+def merge_tagged(pages: Iterable[Tuple[str, List["Story"]]]) -> List[TaggedStory]:
+    """Merges pages of stories into one list without duplicates.
+
+    Args:
+        pages (Iterable[Tuple[str, List[Story]]]): Origin (region code or office id) and stories of each page.
+
+    Returns:
+        List[TaggedStory]: Each story once, most recent first. Stories published at the same time keep the order of ``pages``.
+    """
+    merged: Dict[str, TaggedStory] = {}
+    for origin, stories in pages:
+        for story in stories:
+            tagged = merged.get(story.id)
+            if tagged is None:
+                merged[story.id] = TaggedStory(story, (origin,))
+            elif origin not in tagged.origins:
+                merged[story.id] = tagged._replace(origins=tagged.origins + (origin,))
+    return sorted(
+        merged.values(), key=lambda tagged: tagged.story.published, reverse=True
+    )
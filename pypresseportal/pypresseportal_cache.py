@@ -0,0 +1,330 @@
+"""Response caches for PyPresseportal.
+
+A cache stores the json data of successful API responses. It is keyed on the
+query URL and parameters (without the API key) and every entry expires after a
+time to live that depends on the endpoint: feeds of stories change quickly,
+company and office information rarely changes. Expired entries are kept as long
+as there is room for them, so the last good response can be served if the API
+can not be reached.
+
+Pass a cache to :class:`pypresseportal.PresseportalApi` to use it:
+
+>>> from pypresseportal.pypresseportal_cache import ResponseCache
+>>> api_object = PresseportalApi(YOUR_API_KEY, cache=ResponseCache(max_entries=500))
+
+:class:`ResponseCache` lives in memory. :class:`SqliteCache` stores responses in a
+SQLite database, which can be shared by many processes and survives restarts:
+
+>>> from pypresseportal.pypresseportal_cache import SqliteCache
+>>> api_object = PresseportalApi(YOUR_API_KEY, cache=SqliteCache("/var/cache/presseportal.db"))
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+from urllib.parse import urlencode, urlparse
+
+from pypresseportal.pypresseportal_sqlite import SqliteConnections
+
+# Time to live in seconds per endpoint, i.e. first path component after /api/
+DEFAULT_TTLS = {"article": 60, "ir": 60, "search": 3600, "info": 86400}
+DEFAULT_TTL = 60
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_DISK_ENTRIES = 100000
+
+
+class BaseCache:
+    """Base class for response caches.
+
+    Subclasses store entries by implementing :meth:`_load`, :meth:`_store` and :meth:`clear`.
+    ``BaseCache`` provides keys, time to live per endpoint, stale lookups and hit/miss counters.
+
+    Attributes:
+        blocking_io (bool): Lookups read files or the network. :class:`pypresseportal.AsyncPresseportalApi` then calls the cache from a worker thread, so that it does not block the event loop. Class attribute, True unless a subclass sets it to False.
+
+    Args:
+        ttls (Dict[str, float], optional): Time to live in seconds per endpoint (``"article"``, ``"ir"``, ``"search"``, ``"info"``). Overrides the defaults for the given endpoints. Defaults to None.
+        default_ttl (float, optional): Time to live for endpoints without an entry in ``ttls``. Defaults to 60.
+        stale_if_error (bool, optional): Serve expired entries if the API can not be reached. Defaults to True.
+    """
+
+    blocking_io = True
+
+    def __init__(
+        self,
+        ttls: Dict[str, float] = None,
+        default_ttl: float = DEFAULT_TTL,
+        stale_if_error: bool = True,
+    ):
+        """Constructor method."""
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.stale_if_error = stale_if_error
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: dict) -> str:
+        """Returns the cache key of a query.
+
+        Args:
+            url (str): Query URL.
+            params (dict): Query parameters. The API key is not part of the cache key.
+
+        Returns:
+            str: Cache key.
+        """
+        query = sorted((k, v) for k, v in params.items() if k != "api_key")
+        return f"{url}?{urlencode(query)}"
+
+    def ttl(self, url: str) -> float:
+        """Returns the time to live for responses from an URL.
+
+        Args:
+            url (str): Query URL.
+
+        Returns:
+            float: Time to live in seconds.
+        """
+        path = urlparse(url).path.split("/")
+        # Path is /api/<endpoint>/...
+        endpoint = path[2] if len(path) > 2 else ""
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key: str) -> Union[dict, None]:
+        """Returns the cached json data for a key, if it has not expired.
+
+        Args:
+            key (str): Cache key, see :meth:`key`.
+
+        Returns:
+            Union[dict, None]: Json data, None if there is no valid entry.
+        """
+        entry = self._load(key)
+        if entry is None or entry[0] < time.time():
+            with self._stats_lock:
+                self.misses += 1
+            return None
+        with self._stats_lock:
+            self.hits += 1
+        return entry[1]
+
+    def get_stale(self, key: str) -> Union[dict, None]:
+        """Returns the cached json data for a key, even if it has expired.
+
+        Used if the API can not be reached. Always returns None if ``stale_if_error`` is False.
+
+        Args:
+            key (str): Cache key, see :meth:`key`.
+
+        Returns:
+            Union[dict, None]: Json data, None if there is no entry.
+        """
+        if not self.stale_if_error:
+            return None
+        entry = self._load(key)
+        if entry is None:
+            return None
+        with self._stats_lock:
+            self.stale_hits += 1
+        return entry[1]
+
+    def set(self, key: str, url: str, json_data: dict) -> None:
+        """Stores json data, it expires after the time to live of the URL's endpoint.
+
+        Args:
+            key (str): Cache key, see :meth:`key`.
+            url (str): Query URL.
+            json_data (dict): Json data returned by the API.
+        """
+        ttl = self.ttl(url)
+        if ttl > 0:
+            self._store(key, time.time() + ttl, json_data)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        raise NotImplementedError
+
+    def _load(self, key: str) -> Union[Tuple[float, dict], None]:
+        raise NotImplementedError
+
+    def _store(self, key: str, expires: float, json_data: dict) -> None:
+        raise NotImplementedError
+
+
+class ResponseCache(BaseCache):
+    """In-memory response cache with a bounded number of entries.
+
+    The least recently used entry is removed when the cache is full. The cache can be
+    shared between threads and between API objects.
+
+    Args:
+        max_entries (int, optional): Maximum number of cached responses. Defaults to 1024.
+        ttls (Dict[str, float], optional): Time to live in seconds per endpoint. Defaults to None.
+        default_ttl (float, optional): Time to live for endpoints without an entry in ``ttls``. Defaults to 60.
+        stale_if_error (bool, optional): Serve expired entries if the API can not be reached. Defaults to True.
+    """
+
+    blocking_io = False
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: Dict[str, float] = None,
+        default_ttl: float = DEFAULT_TTL,
+        stale_if_error: bool = True,
+    ):
+        """Constructor method."""
+        super().__init__(ttls, default_ttl, stale_if_error)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached responses."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, key: str) -> Union[Tuple[float, dict], None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: str, expires: float, json_data: dict) -> None:
+        with self._lock:
+            self._entries[key] = (expires, json_data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SqliteCache(BaseCache):
+    """Response cache in a SQLite database file.
+
+    The database uses write-ahead logging, so many processes (for example cron jobs or
+    web server workers) can read and write the same cache file at the same time. Each
+    thread and each process opens its own connection. When the cache exceeds
+    ``max_entries`` or ``max_bytes``, the entries that expire first are removed.
+
+    Args:
+        path (str): Path of the database file, created if it does not exist.
+        max_entries (int, optional): Maximum number of cached responses. Defaults to 100000.
+        max_bytes (int, optional): Maximum total size of the cached json data in bytes. Defaults to None (no limit).
+        ttls (Dict[str, float], optional): Time to live in seconds per endpoint. Defaults to None.
+        default_ttl (float, optional): Time to live for endpoints without an entry in ``ttls``. Defaults to 60.
+        stale_if_error (bool, optional): Serve expired entries if the API can not be reached. Defaults to True.
+        timeout (float, optional): Seconds to wait for a lock held by another process. Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+        max_bytes: int = None,
+        ttls: Dict[str, float] = None,
+        default_ttl: float = DEFAULT_TTL,
+        stale_if_error: bool = True,
+        timeout: float = 30.0,
+    ):
+        """Constructor method."""
+        super().__init__(ttls, default_ttl, stale_if_error)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._connections = SqliteConnections(path, timeout)
+        conn = self._connections.get()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires REAL NOT NULL, "
+            "size INTEGER NOT NULL, data TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)"
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of cached responses."""
+        return (
+            self._connections.get()
+            .execute("SELECT COUNT(*) FROM responses")
+            .fetchone()[0]
+        )
+
+    def close(self) -> None:
+        """Closes the database connection of the calling thread."""
+        self._connections.close()
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        self._connections.get().execute("DELETE FROM responses")
+
+    def purge_expired(self) -> int:
+        """Removes all expired entries, they can no longer be served if the API fails.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        cursor = self._connections.get().execute(
+            "DELETE FROM responses WHERE expires < ?", (time.time(),)
+        )
+        return cursor.rowcount
+
+    def _load(self, key: str) -> Union[Tuple[float, dict], None]:
+        row = (
+            self._connections.get()
+            .execute("SELECT expires, data FROM responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _store(self, key: str, expires: float, json_data: dict) -> None:
+        data = json.dumps(json_data)
+        with self._connections.write() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, size, data) "
+                "VALUES (?, ?, ?, ?)",
+                (key, expires, len(data), data),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        # Remove the entries that expire first until the cache fits its limits
+        count = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY expires LIMIT ?)",
+                (excess,),
+            )
+        if self.max_bytes is None:
+            return
+        size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[
+            0
+        ]
+        victims = []
+        for victim_key, victim_size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY expires"
+        ):
+            if size <= self.max_bytes:
+                break
+            victims.append((victim_key,))
+            size -= victim_size
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
@@ -0,0 +1,259 @@
+"""Memory-compact models for PyPresseportal.
+
+The classes in this module have the same attributes as :class:`pypresseportal.Story`,
+:class:`pypresseportal.Company`, :class:`pypresseportal.Office` and
+:class:`pypresseportal.Entity`, but store them in ``__slots__`` instead of an instance
+dictionary. Strings that repeat between stories (company and office names and URLs,
+language, ressort, keywords) are interned, keywords are stored as tuples, and media
+lists are kept only once, in the media dictionary of the raw data. The raw ``data``
+dictionary itself can be dropped after parsing (the memory is only freed if no
+in-memory cache or conditional request store holds on to the response).
+
+Let an API object return compact models with ``compact_models=True``:
+
+>>> api_object = PresseportalApi(YOUR_API_KEY, compact_models=True, keep_raw_data=False)
+
+``benchmarks/bench_memory.py`` measures the memory used per story by each model.
+"""
+
+import sys
+
+from typing import Iterable, Tuple, Union
+
+from pypresseportal.pypresseportal_constants import STORY_REQUIRED_KEYS
+from pypresseportal.pypresseportal_dates import (
+    epoch_to_datetime,
+    parse_published,
+    published_epoch_offset,
+)
+from pypresseportal.pypresseportal_errors import ApiDataError
+
+
+def _check_required(data: dict, required_keys: Iterable[str]) -> None:
+    for required_key in required_keys:
+        if required_key not in data:
+            raise ApiDataError(f"Required key {required_key} missing.")
+
+
+def _intern(value):
+    # Only strings can be interned, the API sometimes returns other types
+    return sys.intern(value) if type(value) is str else value
+
+
+def _publisher_ids(data: dict) -> Tuple[Union[str, None], Union[str, None]]:
+    # Ids of the publishing company and office of a story, only one of them is set
+    company, office = data.get("company"), data.get("office")
+    publisher = company or office
+    if publisher and "id" not in publisher:
+        raise ApiDataError("Required key id missing in company or office.")
+    if company:
+        return _intern(company["id"]), None
+    if office:
+        return None, _intern(office["id"])
+    return None, None
+
+
+class _CompactInfo:
+    # Attributes shared by company and office information
+    __slots__ = (
+        "data",
+        "id",
+        "url",
+        "name",
+        "shortname",
+        "rss",
+        "logo",
+        "web",
+        "homepage",
+    )
+
+    _required_keys = ("id", "url", "name")
+    _optional_keys: Tuple[str, ...] = ()
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        _check_required(data, self._required_keys)
+        if keep_data:
+            self.data = data
+        for key in self._required_keys:
+            setattr(self, key, data[key])
+        for key in self._optional_keys:
+            if key in data:
+                setattr(self, key, data[key])
+
+
+class CompactCompany(_CompactInfo):
+    """Compact version of :class:`pypresseportal.Company`.
+
+    Args:
+        data (dict): Raw data from API request.
+        keep_data (bool, optional): Keep the raw data in the ``data`` attribute. Defaults to True.
+    """
+
+    __slots__ = ("isin", "wkn")
+
+    _optional_keys = ("isin", "wkn", "shortname", "rss", "logo", "web", "homepage")
+
+
+class CompactOffice(_CompactInfo):
+    """Compact version of :class:`pypresseportal.Office`.
+
+    Args:
+        data (dict): Raw data from API request.
+        keep_data (bool, optional): Keep the raw data in the ``data`` attribute. Defaults to True.
+    """
+
+    __slots__ = ()
+
+    _optional_keys = ("shortname", "rss", "logo", "web", "homepage")
+
+
+class CompactEntity:
+    """Compact version of :class:`pypresseportal.Entity`.
+
+    Args:
+        data (dict): Raw data from API request.
+        keep_data (bool, optional): Keep the raw data in the ``data`` attribute. Defaults to True.
+    """
+
+    __slots__ = ("data", "id", "url", "name", "type")
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        """Constructor method."""
+        _check_required(data, ("id", "url", "name", "type"))
+        if keep_data:
+            self.data = data
+        self.id = data["id"]
+        self.url = data["url"]
+        self.name = data["name"]
+        self.type = _intern(data["type"])
+
+
+class CompactStory:
+    """Compact version of :class:`pypresseportal.Story`.
+
+    Optional attributes that are not part of the API response are not set, exactly as
+    for ``Story``. The media attributes ``image``, ``document``, ``audio`` and ``video``
+    are read from the media information of the response, ``keywords`` is a tuple.
+
+    With ``epoch_published``, the publication date is stored as an integer
+    ``published_epoch`` (seconds since the epoch, convenient for sorting) and its UTC
+    offset ``published_offset``. ``published`` is then created from them on every access.
+
+    Args:
+        data (dict): Raw data from API request.
+        keep_data (bool, optional): Keep the raw data in the ``data`` attribute. Defaults to True.
+        epoch_published (bool, optional): Store the publication date as an integer instead of a datetime. Defaults to False.
+    """
+
+    __slots__ = (
+        "data",
+        "id",
+        "url",
+        "title",
+        "body",
+        "teaser",
+        "published",
+        "published_epoch",
+        "published_offset",
+        "highlight",
+        "short",
+        "language",
+        "ressort",
+        "company_id",
+        "company_url",
+        "company_name",
+        "office_id",
+        "office_url",
+        "office_name",
+        "keywords",
+        "_media",
+    )
+
+    def __init__(
+        self, data: dict, keep_data: bool = True, epoch_published: bool = False
+    ):
+        """Constructor method."""
+        _check_required(data, STORY_REQUIRED_KEYS)
+        if keep_data:
+            self.data = data
+
+        self.id = data["id"]
+        self.url = data["url"]
+        self.title = data["title"]
+        if epoch_published:
+            self.published_epoch, self.published_offset = published_epoch_offset(
+                data["published"]
+            )
+        else:
+            self.published = parse_published(data["published"])
+        self.highlight = _intern(data["highlight"])
+        self.short = data["short"]
+
+        # Check whether data contains body or teaser
+        if "body" in data:
+            self.body = data["body"]
+        elif "teaser" in data:
+            self.teaser = data["teaser"]
+        else:
+            raise ApiDataError("'body' or 'teaser' not included in response.")
+
+        if "language" in data:
+            self.language = _intern(data["language"])
+        if "ressort" in data:
+            self.ressort = _intern(data["ressort"])
+
+        if "company" in data:
+            self.company_id = _intern(data["company"]["id"])
+            self.company_url = _intern(data["company"]["url"])
+            self.company_name = _intern(data["company"]["name"])
+        elif "office" in data:
+            self.office_id = _intern(data["office"]["id"])
+            self.office_url = _intern(data["office"]["url"])
+            self.office_name = _intern(data["office"]["name"])
+
+        if type(data["keywords"]) is dict and "keyword" in data["keywords"]:
+            self.keywords: Tuple[str, ...] = tuple(
+                _intern(keyword) for keyword in data["keywords"]["keyword"]
+            )
+
+        # The media lists are shared with the raw data, not copied
+        if "media" in data and data["media"]:
+            self._media = data["media"]
+
+    def __getattr__(self, name: str):
+        """Creates ``published`` from ``published_epoch`` if the date is stored as an integer."""
+        # Only called for attributes that are not set
+        if name == "published":
+            try:
+                epoch, offset = self.published_epoch, self.published_offset
+            except AttributeError:
+                pass
+            else:
+                return epoch_to_datetime(epoch, offset)
+        raise AttributeError(name)
+
+    def _media_list(self, media_type: str) -> list:
+        media = getattr(self, "_media", None)
+        if media is None or media_type not in media:
+            raise AttributeError(media_type)
+        return media[media_type]
+
+    @property
+    def image(self) -> list:
+        """Images attached to the story."""
+        return self._media_list("image")
+
+    @property
+    def document(self) -> list:
+        """Documents attached to the story."""
+        return self._media_list("document")
+
+    @property
+    def audio(self) -> list:
+        """Audio files attached to the story."""
+        return self._media_list("audio")
+
+    @property
+    def video(self) -> list:
+        """Videos attached to the story."""
+        return self._media_list("video")
@@ -0,0 +1,188 @@
+"""Conditional requests for unchanged API responses.
+
+A :class:`ConditionalStore` remembers the validators (``ETag`` and ``Last-Modified``
+headers) and a digest of the last response of every query. Queries are sent with
+``If-None-Match`` and ``If-Modified-Since`` headers. If the API answers
+"304 Not Modified", or returns exactly the same payload as before, the json data
+and the list of :class:`pypresseportal.Story` objects parsed from the previous
+response are reused instead of decoding and parsing the payload again.
+
+>>> api_object = PresseportalApi(YOUR_API_KEY, conditional_requests=True)
+"""
+
+import hashlib
+import threading
+
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Union
+
+from pypresseportal.pypresseportal_cache import BaseCache
+
+DEFAULT_MAX_CONDITIONAL_ENTRIES = 256
+
+
+def content_digest(content: bytes) -> bytes:
+    """Returns a digest of a response payload.
+
+    Args:
+        content (bytes): Response payload.
+
+    Returns:
+        bytes: 16 byte digest.
+    """
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+class ConditionalEntry:
+    """Validators, digest and decoded data of the last response to a query."""
+
+    __slots__ = ("etag", "last_modified", "digest", "json_data", "parsed")
+
+    def __init__(
+        self,
+        etag: Union[str, None],
+        last_modified: Union[str, None],
+        digest: bytes,
+        json_data: dict,
+    ):
+        """Constructor method."""
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.json_data = json_data
+        self.parsed: Union[List, None] = None
+
+    def request_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """Returns a copy of ``headers`` with the conditional request headers added.
+
+        Args:
+            headers (Dict[str, str]): Request headers.
+
+        Returns:
+            Dict[str, str]: Request headers including validators.
+        """
+        headers = dict(headers)
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalStore:
+    """Bounded store of :class:`ConditionalEntry` objects, one per query.
+
+    The least recently used query is forgotten when the store is full. The store can be
+    shared between threads.
+
+    Args:
+        max_entries (int, optional): Maximum number of queries to remember. Defaults to 256.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_CONDITIONAL_ENTRIES):
+        """Constructor method."""
+        self.max_entries = max_entries
+        self.not_modified = 0
+        self.unchanged = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, ConditionalEntry]" = OrderedDict()
+        # Entries by id() of their json data, to find the stories parsed from it
+        self._by_data: Dict[int, ConditionalEntry] = {}
+
+    key = staticmethod(BaseCache.key)
+
+    def __len__(self) -> int:
+        """Returns the number of remembered queries."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Union[ConditionalEntry, None]:
+        """Returns the entry of a query.
+
+        Args:
+            key (str): Query key, see :meth:`pypresseportal.pypresseportal_cache.BaseCache.key`.
+
+        Returns:
+            Union[ConditionalEntry, None]: Entry of the last response, None if unknown.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def update(
+        self,
+        key: str,
+        entry: Union[ConditionalEntry, None],
+        response_headers: Mapping[str, str],
+        digest: bytes,
+        json_data: dict,
+    ) -> None:
+        """Stores the validators and data of a new response to a query.
+
+        Args:
+            key (str): Query key.
+            entry (Union[ConditionalEntry, None]): Previous entry of the query, as returned by :meth:`get`.
+            response_headers (Mapping[str, str]): Headers of the response.
+            digest (bytes): Digest of the response payload, see :func:`content_digest`.
+            json_data (dict): Json data of the response.
+        """
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        with self._lock:
+            if entry is not None and entry.json_data is json_data:
+                # Payload unchanged, keep the stories parsed from it
+                entry.etag = etag
+                entry.last_modified = last_modified
+            else:
+                entry = ConditionalEntry(etag, last_modified, digest, json_data)
+                old_entry = self._entries.get(key)
+                if old_entry is not None:
+                    self._by_data.pop(id(old_entry.json_data), None)
+                self._by_data[id(json_data)] = entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._by_data.pop(id(evicted.json_data), None)
+
+    def count_reuse(self, not_modified: bool) -> None:
+        """Counts a response that reused the data of the previous response.
+
+        Args:
+            not_modified (bool): True if the API answered "304 Not Modified", False if the payload was unchanged.
+        """
+        with self._lock:
+            if not_modified:
+                self.not_modified += 1
+            else:
+                self.unchanged += 1
+
+    def parsed(self, json_data: dict) -> Union[List, None]:
+        """Returns the objects parsed from json data stored in this object.
+
+        Args:
+            json_data (dict): Json data returned for a query.
+
+        Returns:
+            Union[List, None]: Copy of the list of parsed objects, None if ``json_data`` has not been parsed yet.
+        """
+        with self._lock:
+            entry = self._by_data.get(id(json_data))
+            if entry is None or entry.json_data is not json_data:
+                return None
+            if entry.parsed is None:
+                return None
+            return list(entry.parsed)
+
+    def set_parsed(self, json_data: dict, parsed: List) -> None:
+        """Remembers the objects parsed from json data stored in this object.
+
+        Args:
+            json_data (dict): Json data returned for a query.
+            parsed (List): Objects parsed from ``json_data``.
+        """
+        with self._lock:
+            entry = self._by_data.get(id(json_data))
+            if entry is not None and entry.json_data is json_data:
+                entry.parsed = list(parsed)
@@ -1,6 +1,10 @@
 """Constants for pypresseportal."""
 
+STORIES_LIMIT_MAX = 50
+STREAM_CHUNK_SIZE = 16384
+API_URL = "https://api.presseportal.de/api"
 MEDIA_TYPES = ("image", "document", "audio", "video")
+STORY_REQUIRED_KEYS = ("id", "url", "title", "published", "highlight", "short")
 PUBLIC_SERVICE_MEDIA_TYPES = ("image", "document")
 RESSORTS = ("wirtschaft", "politik", "sport", "kultur", "vermischtes", "finanzen")
 SECTORS = (
@@ -0,0 +1,219 @@
+"""Fast parsing of the publication dates returned by the API.
+
+The API returns dates in one fixed format, for example ``2020-07-02T04:30:00+0200``.
+:func:`parse_published` reads the fields from their fixed positions instead of running
+``datetime.strptime``, and reuses one ``tzinfo`` object per UTC offset. The results are
+identical to ``datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")``, including
+``timezone.utc`` for a zero offset. Values in any other format are passed on to
+``strptime``, so they parse (or fail) exactly as before.
+
+:func:`published_epoch` converts a date to seconds since the epoch without creating a
+``datetime`` at all, and :func:`published_epochs` converts a whole page into a
+compact ``array``.
+"""
+
+from array import array
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Dict, Iterable, List, Tuple
+
+PUBLISHED_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+# tzinfo objects by offset string, e.g. "+0200"
+_timezones: Dict[str, tzinfo] = {"+0000": timezone.utc, "-0000": timezone.utc}
+# Offsets in seconds by offset string
+_offsets: Dict[str, int] = {"+0000": 0, "-0000": 0}
+
+
+def _is_fixed_format(value: str) -> bool:
+    return (
+        len(value) == 24
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+        and value[19] in "+-"
+        and (
+            value[0:4]
+            + value[5:7]
+            + value[8:10]
+            + value[11:13]
+            + value[14:16]
+            + value[17:19]
+            + value[20:24]
+        ).isdigit()
+    )
+
+
+def _offset(value: str) -> int:
+    # Offset in seconds of an offset string like "+0200"
+    offset = _offsets.get(value)
+    if offset is None:
+        hours, minutes = int(value[1:3]), int(value[3:5])
+        if hours >= 24 or minutes >= 60:
+            raise ValueError(f"invalid UTC offset {value!r}")
+        offset = hours * 3600 + minutes * 60
+        if value[0] == "-":
+            offset = -offset
+        if len(_offsets) < 1024:
+            _offsets[value] = offset
+    return offset
+
+
+def _timezone(value: str) -> tzinfo:
+    # Shared tzinfo of an offset string like "+0200"
+    tz = _timezones.get(value)
+    if tz is None:
+        tz = timezone(timedelta(seconds=_offset(value)))
+        if len(_timezones) < 1024:
+            _timezones[value] = tz
+    return tz
+
+
+def parse_published(value: str) -> datetime:
+    """Parses a publication date of the API into an aware datetime.
+
+    Args:
+        value (str): Date as returned by the API, e.g. ``2020-07-02T04:30:00+0200``.
+
+    Raises:
+        ValueError: ``value`` is not a valid date.
+
+    Returns:
+        datetime: Date with the UTC offset of ``value``.
+    """
+    if not _is_fixed_format(value):
+        return datetime.strptime(value, PUBLISHED_FORMAT)
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        tzinfo=_timezone(value[19:24]),
+    )
+
+
+def parse_published_batch(values: Iterable[str]) -> List[datetime]:
+    """Parses many publication dates, see :func:`parse_published`.
+
+    Args:
+        values (Iterable[str]): Dates as returned by the API.
+
+    Raises:
+        ValueError: A value is not a valid date.
+
+    Returns:
+        List[datetime]: Parsed dates, in the order of ``values``.
+    """
+    return [parse_published(value) for value in values]
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 2:
+        return 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
+    return 30 if month in (4, 6, 9, 11) else 31
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    # Days since 1970-01-01 of a proleptic Gregorian date
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def published_epoch(value: str) -> int:
+    """Converts a publication date of the API to seconds since the epoch.
+
+    Args:
+        value (str): Date as returned by the API, e.g. ``2020-07-02T04:30:00+0200``.
+
+    Raises:
+        ValueError: ``value`` is not a valid date.
+
+    Returns:
+        int: Seconds since 1970-01-01 00:00:00 UTC.
+    """
+    if not _is_fixed_format(value):
+        return int(datetime.strptime(value, PUBLISHED_FORMAT).timestamp())
+    year, month, day = int(value[0:4]), int(value[5:7]), int(value[8:10])
+    hour, minute, second = int(value[11:13]), int(value[14:16]), int(value[17:19])
+    if not (
+        1 <= month <= 12
+        and 1 <= day <= _days_in_month(year, month)
+        and hour < 24
+        and minute < 60
+        and second < 60
+    ):
+        raise ValueError(f"time data {value!r} is not a valid date")
+    return (
+        _days_from_civil(year, month, day) * 86400
+        + hour * 3600
+        + minute * 60
+        + second
+        - _offset(value[19:24])
+    )
+
+
+def published_epochs(values: Iterable[str]) -> "array[int]":
+    """Converts many publication dates to seconds since the epoch.
+
+    Args:
+        values (Iterable[str]): Dates as returned by the API.
+
+    Raises:
+        ValueError: A value is not a valid date.
+
+    Returns:
+        array[int]: Signed 64 bit seconds since the epoch, in the order of ``values``.
+    """
+    return array("q", [published_epoch(value) for value in values])
+
+
+def published_epoch_offset(value: str) -> Tuple[int, int]:
+    """Converts a publication date to seconds since the epoch and its UTC offset.
+
+    The pair can be turned back into the exact datetime with :func:`epoch_to_datetime`.
+
+    Args:
+        value (str): Date as returned by the API.
+
+    Raises:
+        ValueError: ``value`` is not a valid date.
+
+    Returns:
+        Tuple[int, int]: Seconds since the epoch and UTC offset in seconds.
+    """
+    if not _is_fixed_format(value):
+        published = datetime.strptime(value, PUBLISHED_FORMAT)
+        offset = published.utcoffset()
+        return (
+            int(published.timestamp()),
+            int(offset.total_seconds()) if offset is not None else 0,
+        )
+    return published_epoch(value), _offset(value[19:24])
+
+
+def epoch_to_datetime(epoch: int, offset: int = 0) -> datetime:
+    """Converts seconds since the epoch to an aware datetime.
+
+    Args:
+        epoch (int): Seconds since the epoch.
+        offset (int, optional): UTC offset of the result in seconds. Defaults to 0 (``timezone.utc``).
+
+    Returns:
+        datetime: Date with the given UTC offset, equal to the result of :func:`parse_published` for the same date.
+    """
+    if offset == 0:
+        tz: tzinfo = timezone.utc
+    elif offset % 60:
+        tz = timezone(timedelta(seconds=offset))
+    else:
+        sign = "-" if offset < 0 else "+"
+        minutes = abs(offset) // 60
+        tz = _timezone(f"{sign}{minutes // 60:02d}{minutes % 60:02d}")
+    return datetime.fromtimestamp(epoch, tz)
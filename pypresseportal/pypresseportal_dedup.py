@@ -0,0 +1,322 @@
+"""Deduplication of stories with a fixed memory budget.
+
+Overlapping queries return the same stories many times. A :class:`SeenStories`
+filter remembers the ids of the stories it has let through and drops stories it has
+seen before. Instead of a set of all ids ever seen, which grows without bound, it uses
+Bloom filters of a fixed size: an id that has been seen is always recognized, an id
+that has not been seen is mistaken for a seen one with a small, configurable
+probability (the false positive rate).
+
+>>> from pypresseportal.pypresseportal_dedup import SeenStories
+>>> seen = SeenStories(capacity=200000, error_rate=0.0001)
+>>> for story in seen.filter(api_object.iter_stories_topic("finanzen", max_stories=500)):
+...     process(story)
+>>> seen.save("/var/lib/presseportal/seen.bin")
+
+The filter can be saved to and restored from disk with :meth:`SeenStories.save` and
+:meth:`SeenStories.load`, so it survives restarts of a long-running consumer.
+"""
+
+import hashlib
+import math
+import os
+import struct
+import threading
+
+from typing import Any, BinaryIO, Iterable, Iterator, List
+
+DEFAULT_CAPACITY = 100000
+DEFAULT_ERROR_RATE = 0.001
+
+_MAGIC = b"PPSEEN"
+_VERSION = 1
+# Header of a saved SeenStories: magic, version, capacity, error rate, generations
+_HEADER = struct.Struct("<6sHQdI")
+# Header of each saved BloomFilter: number of bits, number of hashes, count
+_FILTER_HEADER = struct.Struct("<QIQ")
+
+
+class BloomFilter:
+    """Probabilistic set of strings with a fixed size.
+
+    The size and the number of hash functions are chosen so that the false positive
+    rate stays below ``error_rate`` as long as at most ``capacity`` keys are added.
+
+    Args:
+        capacity (int, optional): Number of keys the filter is sized for. Defaults to 100000.
+        error_rate (float, optional): False positive rate at ``capacity`` keys. Defaults to 0.001.
+
+    Raises:
+        ValueError: ``capacity`` is not positive or ``error_rate`` is not between 0 and 1.
+    """
+
+    def __init__(
+        self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE
+    ):
+        """Constructor method."""
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        # Number of keys added that were not in the filter yet
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterator[int]:
+        # Double hashing: position i is h1 + i * h2, from one 128 bit digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, key: str) -> bool:
+        """Adds a key to the filter.
+
+        Args:
+            key (str): Key to add.
+
+        Returns:
+            bool: True if the key was not in the filter before, False if it (probably) was.
+        """
+        bits = self.bits
+        new = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, key: Any) -> bool:
+        """Returns True if the key has (probably) been added."""
+        bits = self.bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of keys added, not counting false positives."""
+        return self.count
+
+    @property
+    def full(self) -> bool:
+        """True if ``capacity`` keys have been added."""
+        return self.count >= self.capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the filter in bytes."""
+        return len(self.bits)
+
+    def clear(self) -> None:
+        """Removes all keys."""
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+    def write(self, out_file: BinaryIO) -> None:
+        """Writes the filter to a binary file, see :meth:`read`.
+
+        Args:
+            out_file (BinaryIO): File opened for binary writing.
+        """
+        out_file.write(_FILTER_HEADER.pack(self.num_bits, self.num_hashes, self.count))
+        out_file.write(self.bits)
+
+    @classmethod
+    def read(cls, in_file: BinaryIO, capacity: int, error_rate: float) -> "BloomFilter":
+        """Reads a filter written by :meth:`write`.
+
+        Args:
+            in_file (BinaryIO): File opened for binary reading.
+            capacity (int): Capacity the filter was created with.
+            error_rate (float): False positive rate the filter was created with.
+
+        Raises:
+            ValueError: The data is incomplete or does not match ``capacity`` and ``error_rate``.
+
+        Returns:
+            BloomFilter: Restored filter.
+        """
+        bloom_filter = cls(capacity, error_rate)
+        header = in_file.read(_FILTER_HEADER.size)
+        if len(header) != _FILTER_HEADER.size:
+            raise ValueError("Incomplete filter data.")
+        num_bits, num_hashes, count = _FILTER_HEADER.unpack(header)
+        if (num_bits, num_hashes) != (bloom_filter.num_bits, bloom_filter.num_hashes):
+            raise ValueError("Filter data does not match capacity and error rate.")
+        bits = in_file.read(len(bloom_filter.bits))
+        if len(bits) != len(bloom_filter.bits):
+            raise ValueError("Incomplete filter data.")
+        bloom_filter.bits = bytearray(bits)
+        bloom_filter.count = count
+        return bloom_filter
+
+
+class SeenStories:
+    """Remembers the ids of recently seen stories in a fixed amount of memory.
+
+    Ids are stored in ``generations`` Bloom filters. New ids go to the newest filter.
+    When it is full, the oldest filter is dropped and a new, empty one is started, so
+    the filter never fills up: at least the last ``capacity`` ids are always
+    remembered, older ids are eventually forgotten. The false positive rate stays
+    below ``error_rate``. Memory use is about
+    ``generations / (generations - 1) * capacity * -ln(error_rate / generations) / ln(2)²``
+    bits, 400 kB for the defaults, see :attr:`nbytes`.
+
+    Args:
+        capacity (int, optional): Number of most recent ids that are always remembered. Defaults to 100000.
+        error_rate (float, optional): Maximum probability that an unseen id is reported as seen. Defaults to 0.001.
+        generations (int, optional): Number of Bloom filters, at least 2. More generations use less memory, but forget old ids sooner. Defaults to 2.
+
+    Raises:
+        ValueError: Invalid ``capacity``, ``error_rate`` or ``generations``.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        generations: int = 2,
+    ):
+        """Constructor method."""
+        if generations < 2:
+            raise ValueError("generations must be at least 2.")
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.generations = generations
+        # A key is reported as seen if any filter reports it
+        self._filter_capacity = math.ceil(capacity / (generations - 1))
+        self._filter_error_rate = error_rate / generations
+        # Oldest filter first
+        self.filters: List[BloomFilter] = [self._new_filter()]
+        self._lock = threading.Lock()
+
+    def _new_filter(self) -> BloomFilter:
+        return BloomFilter(self._filter_capacity, self._filter_error_rate)
+
+    def add(self, story_id: str) -> bool:
+        """Marks a story id as seen.
+
+        Args:
+            story_id (str): Id of the story.
+
+        Returns:
+            bool: True if the id had not been seen before, False if it (probably) had.
+        """
+        with self._lock:
+            if any(story_id in bloom_filter for bloom_filter in self.filters[:-1]):
+                return False
+            newest = self.filters[-1]
+            if not newest.add(story_id):
+                return False
+            if newest.full:
+                self.filters.append(self._new_filter())
+                if len(self.filters) > self.generations:
+                    del self.filters[0]
+            return True
+
+    def __contains__(self, story_id: Any) -> bool:
+        """Returns True if the story id has (probably) been seen."""
+        return any(story_id in bloom_filter for bloom_filter in self.filters)
+
+    def __len__(self) -> int:
+        """Returns the number of remembered ids."""
+        return sum(len(bloom_filter) for bloom_filter in self.filters)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of all filters in bytes, once all generations exist."""
+        return self.generations * self.filters[-1].nbytes
+
+    def filter(self, stories: Iterable[Any]) -> Iterator[Any]:
+        """Yields the stories that have not been seen before and marks them as seen.
+
+        Works with any story objects that have an ``id``, for example the stories of
+        ``PresseportalApi.iter_stories()`` or ``StoryPoller.poll()``.
+
+        Args:
+            stories (Iterable[Story]): Stories to filter.
+
+        Yields:
+            Story: Stories with ids that have not been seen, in order.
+        """
+        for story in stories:
+            if self.add(story.id):
+                yield story
+
+    def clear(self) -> None:
+        """Forgets all ids."""
+        with self._lock:
+            self.filters = [self._new_filter()]
+
+    def save(self, path: str) -> None:
+        """Saves the filter to a file, replacing it atomically.
+
+        Args:
+            path (str): Path of the file.
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with self._lock:
+            with open(temp_path, "wb") as out_file:
+                out_file.write(
+                    _HEADER.pack(
+                        _MAGIC,
+                        _VERSION,
+                        self.capacity,
+                        self.error_rate,
+                        self.generations,
+                    )
+                )
+                out_file.write(struct.pack("<I", len(self.filters)))
+                for bloom_filter in self.filters:
+                    bloom_filter.write(out_file)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SeenStories":
+        """Loads a filter saved with :meth:`save`.
+
+        Args:
+            path (str): Path of the file.
+
+        Raises:
+            OSError: The file can not be read.
+            ValueError: The file is not a saved filter or it is incomplete.
+
+        Returns:
+            SeenStories: Restored filter.
+        """
+        with open(path, "rb") as in_file:
+            header = in_file.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError("Not a saved SeenStories filter.")
+            magic, version, capacity, error_rate, generations = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("Not a saved SeenStories filter.")
+            seen = cls(capacity, error_rate, generations)
+            count_data = in_file.read(4)
+            if len(count_data) != 4:
+                raise ValueError("Incomplete filter data.")
+            (count,) = struct.unpack("<I", count_data)
+            if not 1 <= count <= generations:
+                raise ValueError("Invalid number of filters.")
+            seen.filters = [
+                BloomFilter.read(
+                    in_file, seen._filter_capacity, seen._filter_error_rate
+                )
+                for _ in range(count)
+            ]
+        return seen
@@ -41,15 +41,17 @@ class ApiError(Exception):
 
     def __init__(self, error_code: str, error_msg: str):
 
+        self.error_code = error_code
+        self.error_msg = error_msg
         self.message = f"The API returned error code {error_code} ({error_msg})."
         super().__init__(self.message)
 
 
 class ApiConnectionFail(Exception):
-    """Raised if ``requests`` raises an error.
+    """Raised if ``requests`` (or ``aiohttp``, for the asyncio client) raises an error.
 
     Args:
-        error_msg (Union[ requests.exceptions.ConnectionError, requests.exceptions.TooManyRedirects, requests.exceptions.Timeout, ]): Error raised by requests package.
+        error_msg (Union[ requests.exceptions.ConnectionError, requests.exceptions.TooManyRedirects, requests.exceptions.Timeout, Exception ]): Error raised by the HTTP client.
     """
 
     def __init__(
@@ -58,6 +60,7 @@ class ApiConnectionFail(Exception):
             requests.exceptions.ConnectionError,
             requests.exceptions.TooManyRedirects,
             requests.exceptions.Timeout,
+            Exception,
         ],
     ):
         self.message = f"The API could not be reached ({str(error_msg)})."
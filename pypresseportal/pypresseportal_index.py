@@ -0,0 +1,421 @@
+"""Local full-text index of stories.
+
+A :class:`StoryIndex` keeps an inverted index of the stories added to it: for every
+normalized word, the stories that contain it and the positions of the word in each
+of them. Queries are answered from the index without scanning the stories and
+without any requests to the API:
+
+>>> from pypresseportal.pypresseportal_index import StoryIndex
+>>> index = StoryIndex()
+>>> index.add_many(api_object.iter_stories(max_stories=1000))
+>>> for hit in index.search('"erneuerbare Energien" OR keyword:Klimaschutz -Kohle'):
+...     print(hit.id, hit.score)
+
+Words are lowercased and German umlauts are folded (``ä`` to ``ae``, ``ß`` to
+``ss``, accents are removed), so ``Müller``, ``MUELLER`` and ``müller`` all match.
+
+Query syntax:
+
+    * ``word`` - Stories containing the word in the title, text or keywords.
+    * ``"a phrase"`` - Stories containing the words in this order.
+    * ``title:word``, ``text:word``, ``keyword:word`` - Only search one field, also for phrases.
+    * ``a b`` or ``a AND b`` - Both must match.
+    * ``a OR b`` - Either must match.
+    * ``-a`` or ``NOT a`` - Must not match.
+    * ``(a OR b) c`` - Parentheses group expressions.
+
+Results are ranked with BM25. Matches in titles count more than matches in keywords,
+which count more than matches in the text.
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+# Field name in queries and the prefix of its terms in the index
+FIELDS = {"title": "t", "text": "b", "keyword": "k"}
+FIELD_WEIGHTS = {"t": 2.0, "k": 1.5, "b": 1.0}
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+_WORD = re.compile(r"\w+")
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+_FOLD = (("ä", "ae"), ("ö", "oe"), ("ü", "ue"))
+_QUERY_TOKEN = re.compile(
+    r"\s*(?:(?P<open>\()|(?P<close>\))|(?P<negate>-)(?=[^\s)])"
+    r"|(?:(?P<field>title|text|keyword):)?"
+    r'(?:"(?P<phrase>[^"]*)"?|(?P<word>[^\s()"]+)))'
+)
+
+
+def _fold_umlauts(text: str) -> str:
+    # Much faster than str.translate() for the few umlauts of a text
+    for umlaut, replacement in _FOLD:
+        text = text.replace(umlaut, replacement)
+    return text
+
+
+def fold(text: str) -> str:
+    """Lowercases text and folds German umlauts and accents.
+
+    Args:
+        text (str): Text to normalize.
+
+    Returns:
+        str: Normalized text.
+    """
+    if _NON_ASCII.search(text) is None:
+        return text.lower()
+    # casefold() also replaces ß with ss
+    text = _fold_umlauts(text.casefold())
+    if _NON_ASCII.search(text) is None:
+        return text
+    # Compose umlauts written as a letter and a combining diaeresis before folding
+    text = _fold_umlauts(unicodedata.normalize("NFC", text))
+    return "".join(
+        char
+        for char in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(char)
+    )
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into normalized words, see :func:`fold`.
+
+    Args:
+        text (str): Text to split.
+
+    Returns:
+        List[str]: Normalized words, in order.
+    """
+    return _WORD.findall(fold(text))
+
+
+class SearchHit(NamedTuple):
+    """A story matching a query.
+
+    Args:
+        id (str): Id of the story.
+        score (float): Relevance, higher is better.
+        story (Story, optional): The story, if the index keeps stories. Defaults to None.
+    """
+
+    id: str
+    score: float
+    story: Any = None
+
+
+class _Postings:
+    """Stories containing one term, with the positions of the term in each story."""
+
+    __slots__ = ("docs", "starts", "positions")
+
+    def __init__(self):
+        # Documents in ascending order, the positions of document docs[i] are
+        # positions[starts[i]:starts[i + 1]]
+        self.docs = array("I")
+        self.starts = array("I", [0])
+        self.positions = array("I")
+
+    def add(self, doc: int, positions: List[int]) -> None:
+        self.docs.append(doc)
+        self.positions.extend(positions)
+        self.starts.append(len(self.positions))
+
+    def frequencies(self) -> Dict[int, int]:
+        starts = self.starts
+        return {doc: starts[i + 1] - starts[i] for i, doc in enumerate(self.docs)}
+
+    def positions_of(self, doc: int) -> "array[int]":
+        # Documents are sorted, so a binary search finds their positions
+        i = bisect_left(self.docs, doc)
+        return self.positions[self.starts[i] : self.starts[i + 1]]
+
+
+# Parsed queries are nested tuples: ("and" | "or", [nodes]), ("not", node) and
+# ("terms", field, [words]) for a word or phrase, field None for all fields
+_Node = Tuple[Any, ...]
+
+
+class StoryIndex:
+    """Inverted index of stories for ranked full-text queries.
+
+    Stories are added with :meth:`add` or :meth:`add_many`, one at a time, and can be
+    searched at any time with :meth:`search`. Adding a story with an id that is
+    already in the index has no effect.
+
+    Args:
+        keep_stories (bool, optional): Keep the added story objects and return them in the ``story`` attribute of search hits. Defaults to False (only ids are kept).
+    """
+
+    def __init__(self, keep_stories: bool = False):
+        """Constructor method."""
+        self.keep_stories = keep_stories
+        self.ids: List[str] = []
+        self.stories: Union[List[Any], None] = [] if keep_stories else None
+        self._docs: Dict[str, int] = {}
+        self._postings: Dict[str, _Postings] = {}
+        # Number of words of each story, per field prefix
+        self._lengths = {prefix: array("I") for prefix in FIELD_WEIGHTS}
+        self._total_lengths = dict.fromkeys(FIELD_WEIGHTS, 0)
+
+    def __len__(self) -> int:
+        """Returns the number of indexed stories."""
+        return len(self.ids)
+
+    def __contains__(self, story_id: Any) -> bool:
+        """Returns True if a story with this id has been added."""
+        return story_id in self._docs
+
+    @property
+    def term_count(self) -> int:
+        """Number of distinct terms in the index, per field."""
+        return len(self._postings)
+
+    def add(self, story: Any) -> bool:
+        """Adds a story to the index.
+
+        Args:
+            story (Story): ``Story``, ``LazyStory`` or ``CompactStory`` object.
+
+        Returns:
+            bool: True if the story was added, False if its id was already in the index.
+        """
+        if story.id in self._docs:
+            return False
+        doc = len(self.ids)
+        self._docs[story.id] = doc
+        self.ids.append(story.id)
+        if self.stories is not None:
+            self.stories.append(story)
+
+        text = getattr(story, "body", None)
+        if text is None:
+            text = getattr(story, "teaser", None)
+        keywords = getattr(story, "keywords", None) or []
+        fields = (
+            ("t", tokenize(story.title or "")),
+            ("b", tokenize(text or "")),
+            # A position gap keeps phrases from matching across two keywords
+            ("k", [word for keyword in keywords for word in tokenize(keyword) + [""]]),
+        )
+        for prefix, words in fields:
+            positions: Dict[str, List[int]] = {}
+            for position, word in enumerate(words):
+                if word:
+                    positions.setdefault(word, []).append(position)
+            for word, word_positions in positions.items():
+                postings = self._postings.get(prefix + word)
+                if postings is None:
+                    postings = self._postings[prefix + word] = _Postings()
+                postings.add(doc, word_positions)
+            length = len(words) - words.count("")
+            self._lengths[prefix].append(length)
+            self._total_lengths[prefix] += length
+        return True
+
+    def add_many(self, stories: Iterable[Any]) -> int:
+        """Adds stories to the index, see :meth:`add`.
+
+        Args:
+            stories (Iterable[Story]): Stories to add.
+
+        Returns:
+            int: Number of stories that were added.
+        """
+        return sum(self.add(story) for story in stories)
+
+    def search(self, query: str, limit: Union[int, None] = 10) -> List[SearchHit]:
+        """Returns the stories matching a query, best match first.
+
+        See :mod:`pypresseportal.pypresseportal_index` for the query syntax.
+
+        Args:
+            query (str): The query.
+            limit (int, optional): Maximum number of results, None for all. Defaults to 10.
+
+        Raises:
+            ValueError: The query is invalid.
+
+        Returns:
+            List[SearchHit]: Matching stories, highest score first.
+        """
+        node = _QueryParser(query).parse()
+        if node is None:
+            return []
+        scores = self._evaluate(node)
+        if limit is None:
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        else:
+            ranked = heapq.nsmallest(
+                limit, scores.items(), key=lambda item: (-item[1], item[0])
+            )
+        stories = self.stories
+        return [
+            SearchHit(self.ids[doc], score, stories[doc] if stories else None)
+            for doc, score in ranked
+        ]
+
+    def _evaluate(self, node: _Node) -> Dict[int, float]:
+        kind = node[0]
+        if kind == "terms":
+            return self._match(node[1], node[2])
+        if kind == "not":
+            excluded = self._evaluate(node[1])
+            return {doc: 0.0 for doc in range(len(self.ids)) if doc not in excluded}
+        # Negated parts of an AND only remove stories
+        parts = node[1]
+        if kind == "and":
+            positive = [part for part in parts if part[0] != "not"]
+            negative = [part for part in parts if part[0] == "not"]
+            if not positive:
+                positive, negative = negative[:1], negative[1:]
+            results = sorted((self._evaluate(part) for part in positive), key=len)
+            scores = results[0]
+            for other in results[1:]:
+                scores = {
+                    doc: score + other[doc]
+                    for doc, score in scores.items()
+                    if doc in other
+                }
+            for part in negative:
+                excluded = self._evaluate(part[1])
+                scores = {
+                    doc: score for doc, score in scores.items() if doc not in excluded
+                }
+            return scores
+        scores = {}
+        for part in parts:
+            for doc, score in self._evaluate(part).items():
+                scores[doc] = scores.get(doc, 0.0) + score
+        return scores
+
+    def _match(self, field: Union[str, None], words: List[str]) -> Dict[int, float]:
+        # Sum of the BM25 scores of a word or phrase in the requested fields
+        prefixes = [FIELDS[field]] if field else list(FIELD_WEIGHTS)
+        scores: Dict[int, float] = {}
+        for prefix in prefixes:
+            postings = [self._postings.get(prefix + word) for word in words]
+            if any(posting is None for posting in postings):
+                continue
+            if len(postings) == 1:
+                frequencies = postings[0].frequencies()  # type: ignore
+            else:
+                frequencies = self._phrase_frequencies(postings)  # type: ignore
+            if not frequencies:
+                continue
+            self._score(prefix, frequencies, scores)
+        return scores
+
+    @staticmethod
+    def _phrase_frequencies(postings: List[_Postings]) -> Dict[int, int]:
+        # Start positions of the first word, shifted back for every later word
+        docs = set(postings[0].docs)
+        for posting in postings[1:]:
+            docs.intersection_update(posting.docs)
+        frequencies = {}
+        for doc in sorted(docs):
+            starts = set(postings[0].positions_of(doc))
+            for offset, posting in enumerate(postings[1:], 1):
+                starts.intersection_update(
+                    position - offset for position in posting.positions_of(doc)
+                )
+                if not starts:
+                    break
+            if starts:
+                frequencies[doc] = len(starts)
+        return frequencies
+
+    def _score(
+        self, prefix: str, frequencies: Dict[int, int], scores: Dict[int, float]
+    ) -> None:
+        count = len(self.ids)
+        idf = math.log(1 + (count - len(frequencies) + 0.5) / (len(frequencies) + 0.5))
+        lengths = self._lengths[prefix]
+        average = self._total_lengths[prefix] / count or 1.0
+        weight = FIELD_WEIGHTS[prefix] * idf
+        for doc, frequency in frequencies.items():
+            norm = K1 * (1 - B + B * lengths[doc] / average)
+            score = weight * frequency * (K1 + 1) / (frequency + norm)
+            scores[doc] = scores.get(doc, 0.0) + score
+
+
+class _QueryParser:
+    """Recursive descent parser for the query syntax."""
+
+    def __init__(self, query: str):
+        self.tokens: List[Tuple[str, Any]] = []
+        position = 0
+        query = query.strip()
+        while position < len(query):
+            match = _QUERY_TOKEN.match(query, position)
+            if match is None or match.end() == position:  # pragma: no cover
+                raise ValueError(f"Invalid query at position {position}.")
+            position = match.end()
+            if match.group("open"):
+                self.tokens.append(("(", None))
+            elif match.group("close"):
+                self.tokens.append((")", None))
+            elif match.group("negate"):
+                self.tokens.append(("NOT", None))
+            elif match.group("word") in ("AND", "OR", "NOT"):
+                self.tokens.append((match.group("word"), None))
+            else:
+                text = match.group("phrase")
+                words = tokenize(match.group("word") if text is None else text)
+                # Words without letters or digits, like "&", are ignored
+                if words:
+                    self.tokens.append(("terms", (match.group("field"), words)))
+        self.index = 0
+
+    def peek(self) -> Union[str, None]:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][0]
+        return None
+
+    def parse(self) -> Union[_Node, None]:
+        if not self.tokens:
+            return None
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise ValueError("Invalid query, unexpected ')'.")
+        return node
+
+    def parse_or(self) -> _Node:
+        parts = [self.parse_and()]
+        while self.peek() == "OR":
+            self.index += 1
+            parts.append(self.parse_and())
+        return parts[0] if len(parts) == 1 else ("or", parts)
+
+    def parse_and(self) -> _Node:
+        parts = [self.parse_unary()]
+        while self.peek() not in (None, ")", "OR"):
+            if self.peek() == "AND":
+                self.index += 1
+            parts.append(self.parse_unary())
+        return parts[0] if len(parts) == 1 else ("and", parts)
+
+    def parse_unary(self) -> _Node:
+        kind = self.peek()
+        if kind is None:
+            raise ValueError("Invalid query, incomplete expression.")
+        self.index += 1
+        if kind == "NOT":
+            return ("not", self.parse_unary())
+        if kind == "(":
+            node = self.parse_or()
+            if self.peek() != ")":
+                raise ValueError("Invalid query, missing ')'.")
+            self.index += 1
+            return node
+        if kind == "terms":
+            field, words = self.tokens[self.index - 1][1]
+            return ("terms", field, words)
+        raise ValueError(f"Invalid query, unexpected '{kind}'.")
@@ -0,0 +1,70 @@
+"""JSON decoders for API responses.
+
+Responses are decoded directly from the raw bytes, without decoding them to a ``str``
+first. If the optional ``orjson`` package is installed (``pip install
+pypresseportal[fast]``), it is used automatically, otherwise the standard library
+``json`` module. Any other function that decodes bytes can be used instead:
+
+>>> import simdjson
+>>> api_object = PresseportalApi(YOUR_API_KEY, json_decoder=simdjson.loads)
+"""
+
+import json
+
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+JsonDecoder = Callable[[Union[bytes, str]], Any]
+
+
+def stdlib_decoder(data: Union[bytes, str]) -> Any:
+    """Decodes json data with the standard library ``json`` module.
+
+    Args:
+        data (Union[bytes, str]): Json data, bytes in UTF-8, UTF-16 or UTF-32.
+
+    Raises:
+        ValueError: ``data`` is not valid json.
+
+    Returns:
+        Any: Decoded data.
+    """
+    return json.loads(data)
+
+
+def orjson_decoder(data: Union[bytes, str]) -> Any:
+    """Decodes json data with ``orjson``.
+
+    Data rejected by ``orjson`` but accepted by the ``json`` module (for example
+    escaped lone surrogates) is decoded with the ``json`` module, so both decoders
+    accept the same responses.
+
+    Args:
+        data (Union[bytes, str]): Json data, bytes in UTF-8.
+
+    Raises:
+        ImportError: ``orjson`` is not installed.
+        ValueError: ``data`` is not valid json.
+
+    Returns:
+        Any: Decoded data.
+    """
+    if orjson is None:
+        raise ImportError("orjson_decoder requires orjson (pip install orjson).")
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def default_decoder() -> JsonDecoder:
+    """Returns the fastest available decoder.
+
+    Returns:
+        JsonDecoder: :func:`orjson_decoder` if ``orjson`` is installed, otherwise :func:`stdlib_decoder`.
+    """
+    return orjson_decoder if orjson is not None else stdlib_decoder
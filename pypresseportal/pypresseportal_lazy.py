@@ -0,0 +1,138 @@
+"""Lazily decoded stories for PyPresseportal.
+
+A :class:`LazyStory` has the same attributes as :class:`pypresseportal.Story`, but
+only decodes a field when it is read for the first time, and then keeps the decoded
+value. Consumers that only read a few attributes, for example ``id`` and ``title`` to
+route stories, skip the costly parts of parsing, such as converting ``published``
+to a datetime.
+
+The structure of the story is validated when the ``LazyStory`` is created, so
+missing required keys raise :class:`pypresseportal.pypresseportal_errors.ApiDataError`
+at the same point as for ``Story``. Errors in a field value (for example a malformed
+publication date) are raised when the field is first read, every time it is read.
+
+Let an API object return lazy stories with ``lazy_models=True``:
+
+>>> api_object = PresseportalApi(YOUR_API_KEY, lazy_models=True)
+"""
+
+from typing import Any, Callable, Dict, List
+
+from pypresseportal.pypresseportal_constants import STORY_REQUIRED_KEYS
+from pypresseportal.pypresseportal_dates import parse_published
+from pypresseportal.pypresseportal_errors import ApiDataError
+
+
+class _LazyField:
+    """Decodes an attribute on first access and stores it in the instance dictionary.
+
+    As a non-data descriptor, it is not consulted again once the instance dictionary
+    holds the value. ``decode`` raises AttributeError for absent optional fields.
+    """
+
+    def __init__(self, decode: Callable[[Dict[str, Any]], Any]):
+        self.decode = decode
+        self.name = decode.__name__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.decode(instance.data)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _optional(data: Dict[str, Any], key: str) -> Any:
+    if key not in data:
+        raise AttributeError(key)
+    return data[key]
+
+
+def _publisher(data: Dict[str, Any], publisher: str, key: str) -> Any:
+    # Stories are published by either a company or an office
+    if publisher == "office" and "company" in data:
+        raise AttributeError(f"{publisher}_{key}")
+    return _optional(data, publisher)[key]
+
+
+def _media(data: Dict[str, Any], media_type: str) -> List[dict]:
+    media = data.get("media")
+    if not media or media_type not in media:
+        raise AttributeError(media_type)
+    return media[media_type]
+
+
+def _teaser(data: Dict[str, Any]) -> str:
+    # A story has either a body or a teaser, never both
+    if "body" in data:
+        raise AttributeError("teaser")
+    return data["teaser"]
+
+
+def _keywords(data: Dict[str, Any]) -> List[str]:
+    keywords = data.get("keywords")
+    if type(keywords) is dict and "keyword" in keywords:
+        return keywords["keyword"]
+    raise AttributeError("keywords")
+
+
+class LazyStory:
+    """Represents a story retrieved through the API, decoded on first access.
+
+    See :class:`pypresseportal.Story` for the available attributes. Like for ``Story``,
+    optional attributes that are not part of the API response are not set.
+
+    Args:
+        data (dict): Raw data from API request.
+
+    Raises:
+        ApiDataError: A required key is missing, or neither ``body`` nor ``teaser`` are included.
+    """
+
+    def __init__(self, data: dict):
+        """Constructor method."""
+        for required_key in STORY_REQUIRED_KEYS:
+            if required_key not in data:
+                raise ApiDataError(f"Required key {required_key} missing.")
+        if "body" not in data and "teaser" not in data:
+            raise ApiDataError("'body' or 'teaser' not included in response.")
+        self.data = data
+
+    id = _LazyField(lambda data: data["id"])
+    url = _LazyField(lambda data: data["url"])
+    title = _LazyField(lambda data: data["title"])
+    published = _LazyField(lambda data: parse_published(data["published"]))
+    highlight = _LazyField(lambda data: data["highlight"])
+    short = _LazyField(lambda data: data["short"])
+    body = _LazyField(lambda data: _optional(data, "body"))
+    teaser = _LazyField(_teaser)
+    language = _LazyField(lambda data: _optional(data, "language"))
+    ressort = _LazyField(lambda data: _optional(data, "ressort"))
+    company_id = _LazyField(lambda data: _publisher(data, "company", "id"))
+    company_url = _LazyField(lambda data: _publisher(data, "company", "url"))
+    company_name = _LazyField(lambda data: _publisher(data, "company", "name"))
+    office_id = _LazyField(lambda data: _publisher(data, "office", "id"))
+    office_url = _LazyField(lambda data: _publisher(data, "office", "url"))
+    office_name = _LazyField(lambda data: _publisher(data, "office", "name"))
+    keywords = _LazyField(_keywords)
+    image = _LazyField(lambda data: _media(data, "image"))
+    document = _LazyField(lambda data: _media(data, "document"))
+    audio = _LazyField(lambda data: _media(data, "audio"))
+    video = _LazyField(lambda data: _media(data, "video"))
+
+    def decode(self) -> "LazyStory":
+        """Decodes all fields at once, raising any error in a field value now.
+
+        Returns:
+            LazyStory: The story itself.
+        """
+        for name, field in type(self).__dict__.items():
+            if isinstance(field, _LazyField):
+                try:
+                    getattr(self, name)
+                except AttributeError:
+                    pass
+        return self
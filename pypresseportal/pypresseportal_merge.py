@@ -0,0 +1,77 @@
+"""Lazy merging of story feeds.
+
+:func:`merge_feeds` combines several story iterators, each most recent first as the
+API returns them, into one stream that is also most recent first. It only takes the
+next story from a feed when that story is needed, so the lazy ``iter_*`` methods of
+:class:`pypresseportal.PresseportalApi` request their next page only when the merged
+stream reaches it:
+
+>>> from itertools import islice
+>>> from pypresseportal.pypresseportal_merge import merge_feeds
+>>> feeds = [
+...     api_object.iter_stories_topic("finanzen"),
+...     api_object.iter_stories_keywords(["Umwelt"]),
+...     api_object.iter_stories_specific_company("1234"),
+... ]
+>>> latest = list(islice(merge_feeds(*feeds), 100))
+"""
+
+import heapq
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Set, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypresseportal.pypresseportal_dedup import SeenStories
+
+
+def _published(story: Any) -> datetime:
+    return story.published
+
+
+def _ordered(feed: Iterable[Any]) -> Iterator[Any]:
+    # A paged feed returns stories again if new stories are published while it is
+    # read, which pushes older stories to the next page. Skipping every story newer
+    # than the last one keeps the feed ordered, and the skipped stories have either
+    # been returned already or are newer than the merged stream's position.
+    last = None
+    for story in feed:
+        published = story.published
+        if last is None or published <= last:
+            last = published
+            yield story
+
+
+def merge_feeds(*feeds: Iterable[Any], seen: "SeenStories" = None) -> Iterator[Any]:
+    """Merges story feeds into one stream, most recent first, without duplicates.
+
+    Stories with the same id are only yielded once. Duplicates always have the same
+    publication date, so only the ids of the stories published at the current
+    position of the stream are kept in memory. Memory use therefore does not grow
+    with the length of the stream.
+
+    Args:
+        *feeds (Iterable[Story]): Story iterators, each most recent first, for example ``PresseportalApi.iter_*()`` results or lists of stories.
+        seen (SeenStories, optional): Also drop stories already seen in earlier streams, see :mod:`pypresseportal.pypresseportal_dedup`. Defaults to None.
+
+    Raises:
+        ApiConnectionFail: Could not connect to API, while reading one of the feeds.
+        ApiError: API returned an error, while reading one of the feeds.
+
+    Yields:
+        Story: Stories of all feeds, most recent first.
+    """
+    current: Union[datetime, None] = None
+    current_ids: Set[str] = set()
+    for story in heapq.merge(
+        *(_ordered(feed) for feed in feeds), key=_published, reverse=True
+    ):
+        if story.published != current:
+            current = story.published
+            current_ids.clear()
+        if story.id in current_ids:
+            continue
+        current_ids.add(story.id)
+        if seen is not None and not seen.add(story.id):
+            continue
+        yield story
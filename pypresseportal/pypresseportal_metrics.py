@@ -0,0 +1,305 @@
+"""Metrics of API requests, parsing and errors.
+
+Pass a metrics sink to :class:`pypresseportal.PresseportalApi` to measure where time
+goes in the client. :class:`PrometheusMetrics` keeps the metrics in memory and
+renders them in the Prometheus text format, for a ``/metrics`` handler of your
+application or from its own HTTP server:
+
+>>> from pypresseportal.pypresseportal_metrics import PrometheusMetrics
+>>> metrics = PrometheusMetrics()
+>>> api_object = PresseportalApi(YOUR_API_KEY, metrics=metrics)
+>>> stories = api_object.get_stories()
+>>> print(metrics.render())
+>>> server = metrics.serve(9464)
+
+The clients record the following metrics:
+
+    * ``presseportal_requests_total`` (counter, label ``endpoint``): Calls of ``_get_data``, including cache hits.
+    * ``presseportal_request_seconds`` (histogram, label ``endpoint``): Duration of these calls, including retries.
+    * ``presseportal_response_bytes_total`` (counter, label ``endpoint``): Bytes of response bodies received.
+    * ``presseportal_parse_seconds`` (histogram, label ``parser``): Duration of mapping json data to stories (``stories``) or search results (``search_results``).
+    * ``presseportal_page_stories`` (histogram): Number of stories per page.
+    * ``presseportal_errors_total`` (counter, labels ``operation`` and ``error``): Exceptions by class name, for example ``ApiError``, ``ApiConnectionFail`` or ``ApiDataError``. ``operation`` is an endpoint or a parser.
+
+Endpoints are the paths below ``/api/`` without ids, topics, keywords and media
+types, for example ``article/company``, so the number of time series stays small.
+Streamed responses (``stream_stories``) are not measured.
+
+Other monitoring systems are connected by subclassing :class:`MetricsSink`. Without
+a sink, the clients skip all measurements.
+"""
+
+import threading
+
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+
+REQUESTS = "presseportal_requests_total"
+REQUEST_SECONDS = "presseportal_request_seconds"
+RESPONSE_BYTES = "presseportal_response_bytes_total"
+PARSE_SECONDS = "presseportal_parse_seconds"
+PAGE_STORIES = "presseportal_page_stories"
+ERRORS = "presseportal_errors_total"
+
+DESCRIPTIONS = {
+    REQUESTS: "API queries by endpoint, including cache hits.",
+    REQUEST_SECONDS: "Duration of API queries in seconds, including retries.",
+    RESPONSE_BYTES: "Bytes of API response bodies received.",
+    PARSE_SECONDS: "Duration of mapping json data to objects in seconds.",
+    PAGE_STORIES: "Number of stories per page.",
+    ERRORS: "Exceptions by operation and class name.",
+}
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS = {
+    PARSE_SECONDS: (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1),
+    PAGE_STORIES: (0, 1, 5, 10, 20, 30, 40, 49, 50),
+}
+
+# Paths below /api/ that are reported as endpoints, most specific first
+_ENDPOINTS = (
+    "article/publicservice/office",
+    "article/publicservice/region",
+    "article/publicservice",
+    "article/all",
+    "article/company",
+    "article/topic",
+    "article/keyword",
+    "ir/company",
+    "ir",
+    "search/company",
+    "search/office",
+    "info/company",
+    "info/office",
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def endpoint_label(url: str) -> str:
+    """Returns the endpoint of a query URL, as reported in metrics.
+
+    Args:
+        url (str): Query URL, for example ``https://api.presseportal.de/api/article/company/1234/image``.
+
+    Returns:
+        str: Endpoint, for example ``article/company``, or ``other`` for unknown URLs.
+    """
+    path = url.split("/api/", 1)[-1] + "/"
+    for endpoint in _ENDPOINTS:
+        if path.startswith(endpoint + "/"):
+            return endpoint
+    return "other"
+
+
+class MetricsSink:
+    """Base class for metrics sinks.
+
+    The clients report counters with :meth:`inc` and observations for histograms with
+    :meth:`observe`. Both do nothing here, subclasses forward the values to a
+    monitoring system. Sinks must be safe to call from many threads.
+    """
+
+    def inc(self, name: str, labels: Mapping[str, str], value: float = 1.0) -> None:
+        """Increases a counter.
+
+        Args:
+            name (str): Name of the metric, for example ``presseportal_requests_total``.
+            labels (Mapping[str, str]): Labels of the time series.
+            value (float, optional): Amount to add. Defaults to 1.
+        """
+
+    def observe(self, name: str, labels: Mapping[str, str], value: float) -> None:
+        """Records an observation of a histogram.
+
+        Args:
+            name (str): Name of the metric, for example ``presseportal_request_seconds``.
+            labels (Mapping[str, str]): Labels of the time series.
+            value (float): Observed value.
+        """
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, bucket_count: int):
+        self.counts = [0] * bucket_count
+        self.total = 0.0
+        self.count = 0
+
+
+def _format_labels(labels: LabelKey, extra: str = "") -> str:
+    parts = [
+        '{}="{}"'.format(
+            name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        for name, value in labels
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class PrometheusMetrics(MetricsSink):
+    """Keeps metrics in memory and renders them in the Prometheus text format.
+
+    Counters and histograms are created when they are first reported. Histograms use
+    the buckets of :data:`BUCKETS` for the metrics of the clients and
+    :data:`DEFAULT_BUCKETS` otherwise.
+
+    Args:
+        buckets (Dict[str, Sequence[float]], optional): Upper bounds of the histogram buckets per metric. Overrides the defaults for the given metrics. Defaults to None.
+    """
+
+    def __init__(self, buckets: Dict[str, Sequence[float]] = None):
+        """Constructor method."""
+        self.buckets: Dict[str, Sequence[float]] = dict(BUCKETS)
+        if buckets:
+            self.buckets.update(buckets)
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, labels: Mapping[str, str], value: float = 1.0) -> None:
+        """Increases a counter, see :meth:`MetricsSink.inc`."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, labels: Mapping[str, str], value: float) -> None:
+        """Records an observation of a histogram, see :meth:`MetricsSink.observe`."""
+        key = tuple(sorted(labels.items()))
+        bounds = self.buckets.get(name, DEFAULT_BUCKETS)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(len(bounds))
+            position = bisect_left(bounds, value)
+            if position < len(bounds):
+                histogram.counts[position] += 1
+            histogram.total += value
+            histogram.count += 1
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Returns the value of a counter.
+
+        Args:
+            name (str): Name of the metric.
+            **labels (str): Labels of the time series.
+
+        Returns:
+            float: Value of the counter, 0 if it has not been increased.
+        """
+        with self._lock:
+            return self._counters.get(name, {}).get(tuple(sorted(labels.items())), 0.0)
+
+    def histogram(self, name: str, **labels: str) -> Tuple[int, float]:
+        """Returns the number and the sum of the observations of a histogram.
+
+        Args:
+            name (str): Name of the metric.
+            **labels (str): Labels of the time series.
+
+        Returns:
+            Tuple[int, float]: Number of observations and their sum.
+        """
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(
+                tuple(sorted(labels.items()))
+            )
+            if histogram is None:
+                return 0, 0.0
+            return histogram.count, histogram.total
+
+    def clear(self) -> None:
+        """Removes all metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        """Returns all metrics in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            str: Metrics, one sample per line.
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                self._header(lines, name, "counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(
+                        f"{name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+            for name in sorted(self._histograms):
+                self._header(lines, name, "histogram")
+                bounds = self.buckets.get(name, DEFAULT_BUCKETS)
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(bounds, histogram.counts):
+                        cumulative += count
+                        le = _format_labels(labels, f'le="{_format_value(bound)}"')
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    le = _format_labels(labels, 'le="+Inf"')
+                    lines.append(f"{name}_bucket{le} {histogram.count}")
+                    lines.append(
+                        f"{name}_sum{_format_labels(labels)} "
+                        f"{_format_value(histogram.total)}"
+                    )
+                    lines.append(
+                        f"{name}_count{_format_labels(labels)} {histogram.count}"
+                    )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    @staticmethod
+    def _header(lines: List[str], name: str, metric_type: str) -> None:
+        if name in DESCRIPTIONS:
+            lines.append(f"# HELP {name} {DESCRIPTIONS[name]}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+    def serve(self, port: int, host: str = "") -> HTTPServer:
+        """Serves the metrics over HTTP from a background thread.
+
+        Every path returns the output of :meth:`render`. Call ``shutdown()`` on the
+        returned server to stop it.
+
+        Args:
+            port (int): TCP port, 0 for any free port (see ``server.server_port``).
+            host (str, optional): Address to listen on. Defaults to "" (all interfaces).
+
+        Returns:
+            HTTPServer: The running server.
+        """
+        server = _MetricsServer((host, port), _MetricsHandler)
+        server.metrics = self
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server
+
+
+class _MetricsServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    metrics: Union[PrometheusMetrics, None] = None
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = self.server.metrics.render().encode()  # type: ignore
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # Scrapes are not logged to stderr
+        pass
@@ -0,0 +1,664 @@
+"""Local stand-in for the presseportal.de API.
+
+:class:`MockApiServer` answers the queries of :class:`pypresseportal.PresseportalApi`
+from a synthetic feed, so ingestion can be load tested without using up the quota of
+an API key. New stories are published continuously at a fixed rate, and latency,
+jitter and failures can be injected:
+
+>>> from pypresseportal import PresseportalApi
+>>> from pypresseportal.pypresseportal_mockserver import MockApiServer
+>>> with MockApiServer(rate=5, latency=0.05, jitter=0.02, failure_rate=0.01) as server:
+...     api_object = PresseportalApi("ANY_API_KEY", api_url=server.url)
+...     stories = api_object.get_stories_topic("finanzen")
+
+The server can also run on its own:
+
+    python -m pypresseportal.pypresseportal_mockserver --port 8080 --latency 0.05
+
+Supported are the story queries of ``article/all``, ``article/topic``,
+``article/keyword``, ``article/company``, ``article/publicservice`` (including
+``office`` and ``region``) and ``ir``, each with a media type and the ``start``,
+``limit`` and ``teaser`` parameters, as well as ``search`` and ``info``.
+Invalid queries are answered with the error envelope of the API,
+``{"success": "0", "error": {"code": ..., "msg": ...}}``. Error codes other than
+``101`` are specific to the stand-in, see :data:`ERRORS`.
+
+The feed is deterministic: story ``n`` always has the same id, publisher, topic,
+keywords and text, so feeds of several servers with the same arguments match.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+from pypresseportal.pypresseportal_constants import (
+    INVESTOR_RELATIONS_NEWS_TYPES,
+    KEYWORDS,
+    MEDIA_TYPES,
+    PUBLIC_SERVICE_MEDIA_TYPES,
+    PUBLIC_SERVICE_REGIONS,
+    STORIES_LIMIT_MAX,
+    TOPICS,
+)
+
+# Error code and message per error of the stand-in, "101" is that of the API
+ERRORS = {
+    "authentification": ("101", "authentification failed"),
+    "parameter": ("102", "invalid parameter"),
+    "not_found": ("404", "not found"),
+    "internal": ("500", "internal error"),
+    "unavailable": ("503", "service unavailable"),
+}
+DEFAULT_PORT = 8080
+TIMEZONE = timezone(timedelta(hours=2))
+WORDS = (
+    "Polizei Feuerwehr Einsatz Unfall Verkehr Kreisstraße Zeugen gesucht Brand "
+    "Wohnhaus Umwelt Klimaschutz Unternehmen Quartal Umsatz Wachstum Bürger "
+    "Straßensperrung Ermittlungen Präsidium Pressestelle Mitteilung Gemeinde"
+).split()
+_NAME_PARTS = (
+    ("Nord", "Süd", "West", "Ost", "Berlin", "Hamburg", "Rhein", "Main", "Alpen"),
+    ("Energie", "Bank", "Auto", "Medien", "Logistik", "Pharma", "Bau", "Handel"),
+    ("GmbH", "AG", "SE", "KG"),
+)
+_OFFICE_TYPES = ("Polizei", "Feuerwehr", "Hauptzollamt", "Landratsamt")
+_MASK = (1 << 64) - 1
+_MEDIA_TYPES = frozenset(MEDIA_TYPES)
+_IR_TYPES = tuple(t for t in INVESTOR_RELATIONS_NEWS_TYPES if t != "all")
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words))
+
+
+def _mix(value: int) -> int:
+    # splitmix64, spreads consecutive story numbers over all bits
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+class StoryAttributes(NamedTuple):
+    """Attributes of a synthetic story that queries select by.
+
+    Args:
+        office (bool): Published by a public service office instead of a company.
+        publisher (int): Number of the company or office.
+        topic (str): Topic of a company story, empty for offices.
+        keywords (Tuple[str, ...]): Keywords.
+        media (str): Media type of the attached file, empty if there is none.
+        ir_type (str): Investor relations news type, empty for other stories.
+    """
+
+    office: bool
+    publisher: int
+    topic: str
+    keywords: Tuple[str, ...]
+    media: str
+    ir_type: str
+
+
+class MockFeed:
+    """Deterministic, continuously advancing feed of synthetic stories.
+
+    Story ``n`` is published ``1 / rate`` seconds after story ``n - 1``. When the feed
+    is created, stories ``0`` to ``history - 1`` have been published, the newest one
+    just now. The attributes and json data of recently requested stories are cached.
+
+    Args:
+        rate (float, optional): New stories per second. Defaults to 1.
+        history (int, optional): Number of stories published before the feed started. Defaults to 10000.
+        companies (int, optional): Number of publishing companies. Defaults to 200.
+        offices (int, optional): Number of publishing public service offices. Defaults to 60.
+        seed (int, optional): Seed of the synthetic attributes and texts. Defaults to 0.
+        cache_size (int, optional): Number of stories whose json data is cached. Defaults to 4096.
+        clock (Callable[[], float], optional): Current time in seconds since the epoch. Defaults to ``time.time``.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        history: int = 10000,
+        companies: int = 200,
+        offices: int = 60,
+        seed: int = 0,
+        cache_size: int = 4096,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Constructor method."""
+        self.rate = rate
+        self.history = history
+        self.companies = companies
+        self.offices = offices
+        self.seed = seed
+        self.clock = clock
+        self.started = clock()
+        self._attributes = lru_cache(maxsize=16 * cache_size)(self._make_attributes)
+        self._item = lru_cache(maxsize=cache_size)(self._make_item)
+
+    def newest(self) -> int:
+        """Returns the number of the most recently published story."""
+        return self.history - 1 + int((self.clock() - self.started) * self.rate)
+
+    def published(self, number: int) -> datetime:
+        """Returns the publication date of a story."""
+        seconds = (number - self.history + 1) / self.rate if self.rate else 0
+        return datetime.fromtimestamp(self.started + seconds, TIMEZONE)
+
+    def attributes(self, number: int) -> StoryAttributes:
+        """Returns the attributes of a story, without generating its texts."""
+        return self._attributes(number)
+
+    def _make_attributes(self, number: int) -> StoryAttributes:
+        bits = _mix(number ^ (self.seed << 32))
+        office = bits % 4 == 0
+        bits >>= 2
+        publisher = bits % (self.offices if office else self.companies)
+        bits >>= 16
+        topic = "" if office else TOPICS[bits % len(TOPICS)]
+        bits >>= 8
+        keywords = tuple(
+            sorted({KEYWORDS[(bits >> shift) % len(KEYWORDS)] for shift in (0, 7, 14)})
+        )
+        bits >>= 21
+        media = MEDIA_TYPES[bits % 8] if bits % 8 < len(MEDIA_TYPES) else ""
+        if office and media and media not in PUBLIC_SERVICE_MEDIA_TYPES:
+            media = PUBLIC_SERVICE_MEDIA_TYPES[0]
+        bits >>= 3
+        ir_type = ""
+        if not office and bits % 10 == 0:
+            ir_type = _IR_TYPES[(bits >> 4) % len(_IR_TYPES)]
+        return StoryAttributes(office, publisher, topic, keywords, media, ir_type)
+
+    def company(self, number: int) -> dict:
+        """Returns the json data of a company, as in ``info/company`` responses."""
+        first, second, form = _NAME_PARTS
+        company_id = str(100000 + number)
+        name = (
+            f"{first[number % len(first)]} {second[number // len(first) % len(second)]} "
+            f"{form[number % len(form)]}"
+        )
+        if number >= len(first) * len(second):
+            name += f" {number}"
+        return {
+            "id": company_id,
+            "url": f"https://www.presseportal.de/nr/{company_id}",
+            "name": name,
+            "shortname": name.split()[0],
+            "rss": f"https://www.presseportal.de/rss/pm_{company_id}.rss2",
+            "logo": f"https://cache.pressmailing.net/thumbnail/big/{company_id}/logo",
+            "web": [{"link": [{"title": name, "url": f"https://{company_id}.test"}]}],
+            "homepage": f"https://{company_id}.test",
+        }
+
+    def office(self, number: int) -> dict:
+        """Returns the json data of a public service office, as in ``info/office`` responses."""
+        office_id = str(110000 + number)
+        region = self.region(number)
+        name = f"{_OFFICE_TYPES[number % len(_OFFICE_TYPES)]} {region.upper()} {number}"
+        return {
+            "id": office_id,
+            "url": f"https://www.presseportal.de/blaulicht/nr/{office_id}",
+            "name": name,
+            "shortname": name.split()[0][:3].upper() + f"-{number}",
+            "rss": f"https://www.presseportal.de/rss/dienststelle_{office_id}.rss2",
+            "logo": f"https://cache.pressmailing.net/thumbnail/big/{office_id}/logo",
+            "web": [
+                {"link": [{"title": "Homepage", "url": f"https://{office_id}.test"}]}
+            ],
+            "homepage": f"https://{office_id}.test",
+        }
+
+    @staticmethod
+    def region(office_number: int) -> str:
+        """Returns the region code of a public service office."""
+        return PUBLIC_SERVICE_REGIONS[office_number % len(PUBLIC_SERVICE_REGIONS)]
+
+    def item(self, number: int, teaser: bool = False) -> dict:
+        """Returns the json data of a story, as in ``content.story`` of a response.
+
+        Args:
+            number (int): Number of the story.
+            teaser (bool, optional): Return a teaser instead of the full text. Defaults to False.
+
+        Returns:
+            dict: Json data of the story. The dictionary is shared with other requests of the story, copy it before changing it.
+        """
+        return self._item(number, teaser)
+
+    def _make_item(self, number: int, teaser: bool) -> dict:
+        attributes = self.attributes(number)
+        rng = random.Random(number ^ (self.seed << 32))
+        story_id = str(5000000 + number)
+        if attributes.office:
+            publisher = self.office(attributes.publisher)
+            path = f"blaulicht/pm/{publisher['id']}/{story_id}"
+        else:
+            publisher = self.company(attributes.publisher)
+            path = f"pm/{publisher['id']}/{story_id}"
+        item: dict = {
+            "id": story_id,
+            "url": f"https://www.presseportal.de/{path}",
+            "title": _text(rng, 8),
+            "published": self.published(number).strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "language": "de",
+            "ressort": attributes.topic or "blaulicht",
+            "keywords": {"keyword": list(attributes.keywords)},
+            "highlight": "0",
+            "short": f"http://ots.de/{number:06x}",
+        }
+        if teaser:
+            item["teaser"] = _text(rng, 40)
+        else:
+            item["body"] = _text(rng, 350)
+        publisher_key = "office" if attributes.office else "company"
+        item[publisher_key] = {key: publisher[key] for key in ("id", "url", "name")}
+        if attributes.media:
+            item["media"] = {
+                attributes.media: [
+                    {
+                        "id": str(900000 + number),
+                        "url": f"https://cache.pressmailing.net/{attributes.media}/{number}",
+                        "name": f"{number}.{attributes.media}",
+                        "type": attributes.media,
+                        "caption": _text(rng, 6),
+                    }
+                ]
+            }
+        return item
+
+    def select(
+        self, predicate: Callable[[StoryAttributes], bool], start: int, limit: int
+    ) -> List[int]:
+        """Returns the numbers of a page of matching stories, most recent first.
+
+        Args:
+            predicate (Callable[[StoryAttributes], bool]): Selects the stories of a query.
+            start (int): Number of matching stories to skip.
+            limit (int): Maximum number of stories.
+
+        Returns:
+            List[int]: Story numbers.
+        """
+        numbers: List[int] = []
+        skipped = 0
+        number = self.newest()
+        while number >= 0 and len(numbers) < limit:
+            if predicate(self.attributes(number)):
+                if skipped < start:
+                    skipped += 1
+                else:
+                    numbers.append(number)
+            number -= 1
+        return numbers
+
+
+class ApiFault(Exception):
+    """Raised while answering a query that the API answers with an error envelope.
+
+    Args:
+        error (str): Key of :data:`ERRORS`.
+        status (int, optional): HTTP status code. Defaults to 200, like the API.
+    """
+
+    def __init__(self, error: str, status: int = 200):
+        """Constructor method."""
+        super().__init__(error)
+        self.code, self.msg = ERRORS[error]
+        self.status = status
+
+    def envelope(self) -> dict:
+        """Returns the json data of the error response."""
+        return {"success": "0", "error": {"code": self.code, "msg": self.msg}}
+
+
+def _int_param(query: Dict[str, List[str]], name: str, default: int) -> int:
+    try:
+        return int(query[name][0]) if name in query else default
+    except ValueError:
+        raise ApiFault("parameter")
+
+
+class MockApiServer(ThreadingMixIn, HTTPServer):
+    """HTTP server answering presseportal.de API queries from a :class:`MockFeed`.
+
+    Each request is delayed by ``latency`` plus a random part of up to ``jitter``
+    seconds. Then it fails with the given probabilities, in this order: the connection
+    is closed without a response (``disconnect_rate``), the server answers with HTTP
+    ``failure_status`` (``failure_rate``), or with an API error envelope
+    (``error_rate``).
+
+    Use the server as a context manager, or call :meth:`start` and :meth:`stop`.
+
+    Args:
+        host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+        port (int, optional): TCP port, 0 for any free port. Defaults to 0.
+        feed (MockFeed, optional): Feed of stories. Defaults to None (a new :class:`MockFeed` with ``rate``).
+        rate (float, optional): New stories per second of the default feed. Defaults to 1.
+        latency (float, optional): Minimum delay of each response in seconds. Defaults to 0.
+        jitter (float, optional): Maximum additional random delay in seconds. Defaults to 0.
+        failure_rate (float, optional): Share of requests answered with HTTP ``failure_status``. Defaults to 0.
+        failure_status (int, optional): HTTP status code of failed requests. Defaults to 503.
+        error_rate (float, optional): Share of requests answered with an internal error envelope. Defaults to 0.
+        disconnect_rate (float, optional): Share of requests whose connection is closed without response. Defaults to 0.
+        api_keys (Iterable[str], optional): Accepted API keys. Defaults to None (any key).
+        seed (int, optional): Seed of the injected delays and failures. Defaults to None (random).
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        feed: MockFeed = None,
+        rate: float = 1.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_status: int = 503,
+        error_rate: float = 0.0,
+        disconnect_rate: float = 0.0,
+        api_keys: Iterable[str] = None,
+        seed: int = None,
+    ):
+        """Constructor method."""
+        super().__init__((host, port), _MockApiHandler)
+        self.host = host
+        self.feed = MockFeed(rate) if feed is None else feed
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.error_rate = error_rate
+        self.disconnect_rate = disconnect_rate
+        self.api_keys = None if api_keys is None else frozenset(api_keys)
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Union[threading.Thread, None] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the API, for the ``api_url`` argument of the clients."""
+        return f"http://{self.host}:{self.server_port}/api"
+
+    def __enter__(self) -> "MockApiServer":
+        """Enters a ``with`` block, starts the server and returns it."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Leaves a ``with`` block and stops the server."""
+        self.stop()
+
+    def start(self) -> None:
+        """Serves requests from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops serving and closes the listening socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def fault(self) -> Tuple[float, str]:
+        """Returns the delay of the next response and the injected failure, if any.
+
+        Returns:
+            Tuple[float, str]: Delay in seconds, and ``"disconnect"``, ``"failure"``, ``"error"`` or ``""``.
+        """
+        with self._lock:
+            self.request_count += 1
+            delay = self.latency + self._random.random() * self.jitter
+            draw = self._random.random()
+        for fault, rate in (
+            ("disconnect", self.disconnect_rate),
+            ("failure", self.failure_rate),
+            ("error", self.error_rate),
+        ):
+            if draw < rate:
+                return delay, fault
+            draw -= rate
+        return delay, ""
+
+    def respond(self, path: str, query: Dict[str, List[str]]) -> dict:
+        """Returns the json data answering a query.
+
+        Args:
+            path (str): Path of the query URL, for example ``/api/article/topic/finanzen/image``.
+            query (Dict[str, List[str]]): Query parameters, as returned by ``urllib.parse.parse_qs``.
+
+        Raises:
+            ApiFault: The query is invalid.
+
+        Returns:
+            dict: Json data of the response.
+        """
+        api_key = query.get("api_key", [""])[0]
+        if not api_key or (self.api_keys is not None and api_key not in self.api_keys):
+            raise ApiFault("authentification")
+        if query.get("format", ["json"])[0] != "json":
+            raise ApiFault("parameter")
+        parts = [part for part in path.split("/") if part]
+        if parts[:1] != ["api"] or len(parts) < 2:
+            raise ApiFault("not_found")
+        section, arguments = parts[1], parts[2:]
+        request = {"uri": path, "format": "json"}
+        if section == "info" and len(arguments) == 2:
+            return self._info(request, *arguments)
+        if section == "search" and len(arguments) == 1:
+            return self._search(request, arguments[0], query)
+        if section in ("article", "ir"):
+            return self._stories(request, section, arguments, query)
+        raise ApiFault("not_found")
+
+    def _info(self, request: dict, entity: str, id: str) -> dict:
+        if entity == "company":
+            number = self._number(id, 100000, self.feed.companies)
+        elif entity == "office":
+            number = self._number(id, 110000, self.feed.offices)
+        else:
+            raise ApiFault("not_found")
+        data = (
+            self.feed.company(number)
+            if entity == "company"
+            else self.feed.office(number)
+        )
+        request[entity] = id
+        return {"success": "1", "request": request, entity: data}
+
+    def _search(self, request: dict, entity: str, query: Dict[str, List[str]]) -> dict:
+        if entity not in ("company", "office"):
+            raise ApiFault("not_found")
+        terms = [t for t in query.get("q", [""])[0].lower().split(",") if t]
+        if not terms:
+            raise ApiFault("parameter")
+        limit = _int_param(query, "limit", 20)
+        if entity == "company":
+            candidates = [self.feed.company(n) for n in range(self.feed.companies)]
+        else:
+            candidates = [self.feed.office(n) for n in range(self.feed.offices)]
+        hits = [
+            {key: data[key] for key in ("id", "url", "name")}
+            for data in candidates
+            if any(term in data["name"].lower() for term in terms)
+        ]
+        for hit in hits:
+            hit["type"] = entity
+        request.update(
+            {"search": entity, "term": ",".join(terms), "hits": str(len(hits))}
+        )
+        return {"success": "1", "request": request, "content": {"result": hits[:limit]}}
+
+    def _stories(
+        self,
+        request: dict,
+        section: str,
+        arguments: List[str],
+        query: Dict[str, List[str]],
+    ) -> dict:
+        start = _int_param(query, "start", 0)
+        limit = _int_param(query, "limit", STORIES_LIMIT_MAX)
+        if start < 0 or not 0 < limit <= STORIES_LIMIT_MAX:
+            raise ApiFault("parameter")
+        teaser = query.get("teaser", ["0"])[0] == "1"
+        media = ""
+        if section == "article" and arguments and arguments[-1] in _MEDIA_TYPES:
+            media = arguments.pop()
+        predicate = self._predicate(section, arguments)
+        numbers = self.feed.select(
+            lambda a: predicate(a) and (not media or a.media == media), start, limit
+        )
+        request.update({"start": str(start), "limit": str(limit)})
+        return {
+            "success": "1",
+            "request": request,
+            "content": {"story": [self.feed.item(n, teaser) for n in numbers]},
+        }
+
+    def _predicate(
+        self, section: str, arguments: List[str]
+    ) -> Callable[[StoryAttributes], bool]:
+        # Selection of the stories of a story query
+        if section == "ir":
+            if arguments[:1] == ["company"] and len(arguments) == 3:
+                company, news_type = (
+                    self._number(arguments[1], 100000, self.feed.companies),
+                    arguments[2],
+                )
+            elif len(arguments) == 1:
+                company, news_type = None, arguments[0]
+            else:
+                raise ApiFault("not_found")
+            if news_type not in INVESTOR_RELATIONS_NEWS_TYPES:
+                raise ApiFault("parameter")
+            return lambda a: (
+                bool(a.ir_type)
+                and (news_type == "all" or a.ir_type == news_type)
+                and (company is None or a.publisher == company)
+            )
+        endpoint = arguments[:1]
+        if endpoint == ["all"] and len(arguments) == 1:
+            return lambda a: True
+        if endpoint == ["topic"] and len(arguments) == 2:
+            topic = arguments[1]
+            if topic not in TOPICS:
+                raise ApiFault("parameter")
+            return lambda a: a.topic == topic
+        if endpoint == ["keyword"] and len(arguments) == 2:
+            keywords = set(arguments[1].split(","))
+            if not keywords <= set(KEYWORDS):
+                raise ApiFault("parameter")
+            return lambda a: not keywords.isdisjoint(a.keywords)
+        if endpoint == ["company"] and len(arguments) == 2:
+            company = self._number(arguments[1], 100000, self.feed.companies)
+            return lambda a: not a.office and a.publisher == company
+        if endpoint == ["publicservice"]:
+            if len(arguments) == 1:
+                return lambda a: a.office
+            if len(arguments) == 3 and arguments[1] == "office":
+                office = self._number(arguments[2], 110000, self.feed.offices)
+                return lambda a: a.office and a.publisher == office
+            if len(arguments) == 3 and arguments[1] == "region":
+                region = arguments[2]
+                if region not in PUBLIC_SERVICE_REGIONS:
+                    raise ApiFault("parameter")
+                return lambda a: a.office and self.feed.region(a.publisher) == region
+        raise ApiFault("not_found")
+
+    @staticmethod
+    def _number(id: str, first: int, count: int) -> int:
+        # Number of a company or office from its id
+        if not id.isdigit() or not 0 <= int(id) - first < count:
+            raise ApiFault("not_found")
+        return int(id) - first
+
+
+class _MockApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: MockApiServer
+
+    def do_GET(self) -> None:
+        delay, fault = self.server.fault()
+        if delay > 0:
+            time.sleep(delay)
+        if fault == "disconnect":
+            self.close_connection = True
+            return
+        status = 200
+        try:
+            if fault == "failure":
+                raise ApiFault("unavailable", self.server.failure_status)
+            if fault == "error":
+                raise ApiFault("internal")
+            url = urlparse(self.path)
+            data = self.server.respond(url.path, parse_qs(url.query))
+        except ApiFault as error:
+            status, data = error.status, error.envelope()
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status in (429, 503):
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # Requests are not logged to stderr
+        pass
+
+
+def main() -> None:
+    """Runs a stand-in server until it is interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--rate", type=float, default=1.0, help="stories per second")
+    parser.add_argument("--history", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=503)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = MockApiServer(
+        args.host,
+        args.port,
+        MockFeed(args.rate, args.history),
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        error_rate=args.error_rate,
+        disconnect_rate=args.disconnect_rate,
+    )
+    print(f"Serving the presseportal.de API stand-in at {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""Incremental polling of story queries.
+
+A :class:`StoryPoller` remembers the most recent story it has returned for each
+query (the watermark) and only returns stories that were published since. If a
+poll stops at ``max_pages`` before it reaches the watermark, the stories it did not
+fetch are recorded as a :class:`Gap` and returned by the next polls.
+"""
+
+import json
+
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Tuple,
+    Union,
+)
+
+from pypresseportal.pypresseportal_bulk import STORY_ENDPOINTS
+from pypresseportal.pypresseportal_constants import STORIES_LIMIT_MAX
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypresseportal.pypresseportal import PresseportalApi, Story
+    from pypresseportal.pypresseportal_dedup import SeenStories
+
+
+class Watermark(NamedTuple):
+    """Most recent position of a polled query.
+
+    Args:
+        published (datetime): Publication date of the most recent story returned so far.
+        ids (FrozenSet[str]): Ids of all returned stories with exactly this publication date.
+    """
+
+    published: datetime
+    ids: FrozenSet[str]
+
+
+class Gap(NamedTuple):
+    """Stories of a polled query that a poll stopped before fetching.
+
+    The gap lies between the oldest story returned above it (``resume``) and the
+    watermark the query had before (``floor``). The next poll looks for the first
+    unread story ``skip`` stories below the watermark (or the floor of the gap) above
+    the gap. Stories published while a poll is paging move all stories to later
+    positions, so ``skip`` is only a hint: reading continues below the last story
+    that is not older than ``resume``, going back a page at a time to find it.
+
+    Args:
+        resume (Watermark): Publication date and ids of the oldest stories returned above the gap.
+        floor (Watermark): Watermark below the gap, the gap ends there.
+        skip (int): Approximate position of the first unread story, counted from the most recent story not newer than the watermark above the gap.
+    """
+
+    resume: Watermark
+    floor: Watermark
+    skip: int
+
+
+def _is_newer(story: "Story", watermark: Watermark) -> bool:
+    # Published after the watermark, or in its second but not returned yet
+    if story.published == watermark.published:
+        return story.id not in watermark.ids
+    return story.published > watermark.published
+
+
+def _is_older(story: "Story", watermark: Watermark) -> bool:
+    if story.published == watermark.published:
+        return story.id not in watermark.ids
+    return story.published < watermark.published
+
+
+def _with_returned(watermark: Watermark, stories: List["Story"]) -> Watermark:
+    # Watermark that also holds the stories returned in its second
+    ids = {story.id for story in stories if story.published == watermark.published}
+    if not ids:
+        return watermark
+    return Watermark(watermark.published, watermark.ids | ids)
+
+
+def _lower(watermark: Union[Watermark, None], story: "Story") -> Watermark:
+    # Watermark of the oldest stories, after story has been returned below watermark
+    if watermark is None or story.published < watermark.published:
+        return Watermark(story.published, frozenset((story.id,)))
+    return Watermark(watermark.published, watermark.ids | {story.id})
+
+
+class _Scan(NamedTuple):
+    # Position of the first story not newer than the floor, None if the pages ran out
+    boundary: Union[int, None]
+    # Stories newer than the floor, most recent first
+    stories: List["Story"]
+    # Position of the first unread story
+    end: int
+    # Oldest stories returned so far
+    resume: Union[Watermark, None]
+
+
+class _PageReader:
+    # Reads stories of a query from any position, fetching up to max_pages pages.
+    # Stories published while paging move all others to later positions, so pages
+    # that continue a scan overlap with the story read last and are aligned to it
+
+    def __init__(
+        self,
+        method: Callable[..., List["Story"]],
+        arguments: Dict[str, Any],
+        page_size: int,
+        max_pages: int,
+    ):
+        self.method = method
+        self.arguments = arguments
+        self.page_size = page_size
+        self.pages_left = max_pages
+        # Stories by position, all read since the feed last moved
+        self.stories: Dict[int, "Story"] = {}
+        # Number of stories of the query, once a short page has been read
+        self.length: Union[int, None] = None
+
+    def scan(
+        self, start: int, floor: Watermark, resume: Union[Watermark, None] = None
+    ) -> _Scan:
+        # Stories from start down to floor, skipping those not older than resume
+        stories: List["Story"] = []
+        position = start
+        last = self.stories.get(start - 1)
+        while True:
+            story = self.stories.get(position)
+            if story is None:
+                if self.length is not None and position >= self.length:
+                    return _Scan(position, stories, position, resume)
+                if self.pages_left <= 0:
+                    return _Scan(None, stories, position, resume)
+                position = self._read(position, last)
+                continue
+            position += 1
+            last = story
+            if resume is not None and not _is_older(story, resume):
+                continue
+            # Stories published later in the second of the floor come before it
+            if not _is_newer(story, floor):
+                return _Scan(position - 1, stories, position - 1, resume)
+            stories.append(story)
+            resume = _lower(resume, story)
+
+    def locate(self, lowest: int, position: int, resume: Watermark) -> Tuple[int, bool]:
+        # Position at or above the first story older than resume, searched from
+        # position back to lowest. If the pages ran out, False and the position to
+        # search from by the next poll
+        lowest = max(lowest, 1)
+        while position >= lowest:
+            story = self.stories.get(position - 1)
+            if story is None:
+                if self.length is not None and position > self.length:
+                    position = max(lowest, self.length)
+                    continue
+                if self.pages_left <= 0:
+                    return position, False
+                self._read(position - 1)
+                continue
+            if not _is_older(story, resume):
+                return position, True
+            if position == lowest:
+                break
+            # Stories published since the gap was recorded pushed it further down
+            position = max(lowest, position - self.page_size)
+        return 0, True
+
+    def _read(self, position: int, last: Union["Story", None] = None) -> int:
+        # Reads the page at position and returns the position of the story after
+        # last in it, position itself without last
+        if last is None:
+            self.stories.clear()
+            self._store(position, self._fetch(position))
+            return position
+        start = position - 1
+        while True:
+            page = self._fetch(start)
+            for index, story in enumerate(page):
+                if story.id == last.id:
+                    if index > 0:
+                        # The feed moved, positions read before are outdated
+                        self.stories.clear()
+                    self._store(start, page)
+                    return start + index + 1
+            if len(page) < self.page_size or self.pages_left <= 0:
+                # Last story not found, it has moved beyond this page
+                self.stories.clear()
+                self._store(start, page)
+                return start + len(page)
+            start += len(page)
+
+    def _fetch(self, start: int) -> List["Story"]:
+        self.pages_left -= 1
+        return self.method(start=start, limit=self.page_size, **self.arguments)
+
+    def _store(self, start: int, page: List["Story"]) -> None:
+        for index, story in enumerate(page, start):
+            self.stories[index] = story
+        self.length = start + len(page) if len(page) < self.page_size else None
+
+
+class StoryPoller:
+    """Returns only stories that are newer than those returned by earlier polls.
+
+    Every query (method name and arguments) has its own watermark. The first poll of a
+    query returns its first page. Later polls request pages, moving backwards with
+    ``start``, until they reach the watermark, so stories published in a burst between
+    two polls are neither missed nor returned twice. A poll requests at most
+    ``max_pages`` pages. If they run out before the watermark, the rest of the burst
+    is returned by the next polls, after the stories published in the meantime:
+
+    >>> poller = StoryPoller(api_object)
+    >>> stories = poller.poll("get_public_service_news")
+    >>> new_stories = poller.poll("get_public_service_news")
+    >>> new_ir_news = poller.poll("get_investor_relations_news", news_type="adhoc")
+
+    Args:
+        api (PresseportalApi): API object used for the queries.
+        max_pages (int, optional): Maximum number of pages requested by one poll. Pages left after the new stories are used for gaps, so at least 2 are needed to fill them. Defaults to 20.
+        page_size (int, optional): Number of stories per page, between 2 (pages overlap by one story) and 50 (the API maximum). Defaults to 50.
+        seen (SeenStories, optional): Drop stories already returned for another query, see :mod:`pypresseportal.pypresseportal_dedup`. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        api: "PresseportalApi",
+        max_pages: int = 20,
+        page_size: int = STORIES_LIMIT_MAX,
+        seen: "SeenStories" = None,
+    ):
+        """Constructor method."""
+        self.api = api
+        self.max_pages = max_pages
+        self.page_size = max(2, min(page_size, STORIES_LIMIT_MAX))
+        self.seen = seen
+        self.watermarks: Dict[str, Watermark] = {}
+        # Unfetched stories per query, most recent first
+        self.gaps: Dict[str, List[Gap]] = {}
+        # False if the last poll stopped at max_pages before fetching all new stories
+        self.last_poll_complete = True
+
+    @staticmethod
+    def _feed_key(endpoint: str, arguments: Dict[str, Any]) -> str:
+        return json.dumps([endpoint, arguments], sort_keys=True, default=str)
+
+    def watermark(self, endpoint: str, **arguments) -> Union[Watermark, None]:
+        """Returns the watermark of a query, None if it has not been polled yet.
+
+        Args:
+            endpoint (str): Name of a story query method of ``PresseportalApi``.
+            **arguments: Arguments of the query, except ``start`` and ``limit``.
+
+        Returns:
+            Union[Watermark, None]: Watermark of the query.
+        """
+        return self.watermarks.get(self._feed_key(endpoint, arguments))
+
+    def reset(self, endpoint: str, **arguments) -> None:
+        """Forgets the watermark and the gaps of a query, the next poll starts from scratch.
+
+        Args:
+            endpoint (str): Name of a story query method of ``PresseportalApi``.
+            **arguments: Arguments of the query, except ``start`` and ``limit``.
+        """
+        key = self._feed_key(endpoint, arguments)
+        self.watermarks.pop(key, None)
+        self.gaps.pop(key, None)
+
+    def poll(self, endpoint: str = "get_stories", **arguments) -> List["Story"]:
+        """Returns all stories of a query published since its last poll.
+
+        Args:
+            endpoint (str, optional): Name of a story query method of ``PresseportalApi``. Defaults to "get_stories".
+            **arguments: Arguments of the query, except ``start`` and ``limit``.
+
+        Raises:
+            ValueError: ``endpoint`` is not a story query method.
+            ApiConnectionFail: Could not connect to API.
+            ApiError: API returned an error.
+
+        Returns:
+            List[Story]: New stories, most recent first. Without stories in ``seen``, if given.
+        """
+        if endpoint not in STORY_ENDPOINTS:
+            raise ValueError(f"'{endpoint}' is not a story query method.")
+        method = getattr(self.api, endpoint)
+        key = self._feed_key(endpoint, arguments)
+        watermark = self.watermarks.get(key)
+
+        if watermark is None:
+            # The first poll of a query only returns the first page
+            found = method(start=0, limit=self.page_size, **arguments)
+            self.last_poll_complete = True
+        else:
+            found = self._poll_gaps(key, method, arguments, watermark)
+
+        # Stories move to the next page if new stories arrive while paging
+        new_stories: List["Story"] = []
+        new_ids = set()
+        for story in found:
+            if story.id not in new_ids:
+                new_ids.add(story.id)
+                new_stories.append(story)
+        if new_stories:
+            self.watermarks[key] = self._advance(watermark, new_stories)
+        if self.seen is not None:
+            return list(self.seen.filter(new_stories))
+        return new_stories
+
+    def _poll_gaps(
+        self,
+        key: str,
+        method: Callable[..., List["Story"]],
+        arguments: Dict[str, Any],
+        watermark: Watermark,
+    ) -> List["Story"]:
+        # New stories down to the watermark, then the stories of earlier gaps
+        reader = _PageReader(method, arguments, self.page_size, self.max_pages)
+        gaps = self.gaps.pop(key, [])
+        scan = reader.scan(0, watermark)
+        found = list(scan.stories)
+        gaps = self._without_returned(gaps, found)
+        if scan.boundary is None:
+            # The unread stories above the old watermark form a new gap, below the
+            # most recent story
+            if scan.resume is not None:
+                gaps.insert(0, Gap(scan.resume, watermark, scan.end))
+            self.last_poll_complete = False
+            if gaps:
+                self.gaps[key] = gaps
+            return found
+
+        # Position of the next watermark, which the first remaining gap is counted from
+        anchor = 0 if scan.stories else scan.boundary
+        start = scan.boundary
+        for number, gap in enumerate(gaps):
+            position, found_resume = reader.locate(start, start + gap.skip, gap.resume)
+            if found_resume:
+                gap_scan = reader.scan(position, gap.floor, gap.resume)
+            else:
+                gap_scan = _Scan(None, [], position, gap.resume)
+            found.extend(gap_scan.stories)
+            rest = self._without_returned(gaps[number + 1 :], gap_scan.stories)
+            if gap_scan.boundary is None:
+                gap = Gap(
+                    gap_scan.resume or gap.resume, gap.floor, gap_scan.end - anchor
+                )
+                self.gaps[key] = [gap] + rest
+                self.last_poll_complete = False
+                return found
+            # The next gap is counted from the floor of this one
+            start = gap_scan.boundary
+            gaps[number + 1 :] = rest
+        self.last_poll_complete = True
+        return found
+
+    @staticmethod
+    def _without_returned(gaps: List[Gap], stories: List["Story"]) -> List[Gap]:
+        # Stories returned in the second a gap resumes at are not part of the gap
+        return [
+            Gap(_with_returned(gap.resume, stories), gap.floor, gap.skip)
+            for gap in gaps
+        ]
+
+    @staticmethod
+    def _advance(
+        watermark: Union[Watermark, None], new_stories: List["Story"]
+    ) -> Watermark:
+        published = max(story.published for story in new_stories)
+        # Stories of gaps are older than the watermark
+        if watermark is not None and watermark.published > published:
+            return watermark
+        ids = {story.id for story in new_stories if story.published == published}
+        if watermark is not None and watermark.published == published:
+            ids |= watermark.ids
+        return Watermark(published, frozenset(ids))
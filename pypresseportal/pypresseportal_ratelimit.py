@@ -0,0 +1,214 @@
+"""Client-side rate limiting and retries for PyPresseportal.
+
+A :class:`RateLimiter` spaces out the requests of one or more API objects, so they
+stay below the request quota of the API. A :class:`RetryPolicy` repeats requests
+that failed for transient reasons, waiting longer after each attempt:
+
+>>> from pypresseportal.pypresseportal_ratelimit import RateLimiter, RetryPolicy
+>>> api_object = PresseportalApi(
+...     YOUR_API_KEY,
+...     rate_limiter=RateLimiter(rate=5, burst=10),
+...     retry=RetryPolicy(max_retries=4),
+... )
+"""
+
+import random
+import threading
+import time
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Union
+
+from pypresseportal.pypresseportal_errors import ApiConnectionFail, ApiError
+
+# HTTP status codes that are worth retrying
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryableResponse(Exception):
+    """Raised internally for a response with a status code listed in :attr:`RetryPolicy.statuses`.
+
+    Args:
+        status (int): HTTP status code of the response.
+        retry_after (Union[float, None]): Seconds to wait as requested by a ``Retry-After`` header.
+    """
+
+    def __init__(self, status: int, retry_after: Union[float, None]):
+        self.status = status
+        self.retry_after = retry_after
+        self.message = f"The API responded with HTTP status {status}."
+        super().__init__(self.message)
+
+
+class RateLimiter:
+    """Token bucket rate limiter, shared by all threads using it.
+
+    The bucket holds up to ``burst`` tokens and is refilled with ``rate`` tokens per
+    second. Every request takes one token and waits if the bucket is empty.
+
+    Args:
+        rate (float): Sustained number of requests per second.
+        burst (int, optional): Number of requests that may be sent at once after an idle period. Defaults to 1.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Constructor method."""
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long the caller has to wait before using it.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._paused_until - now)
+
+    def acquire(self) -> float:
+        """Takes a token, waits until it may be used.
+
+        Returns:
+            float: Seconds waited.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """Holds back all requests for some time, for example as requested by a ``Retry-After`` header.
+
+        Args:
+            seconds (float): Seconds from now until requests may be sent again.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    """Parses the value of a ``Retry-After`` header.
+
+    Args:
+        value (Union[str, None]): Header value, either seconds or a HTTP date.
+
+    Returns:
+        Union[float, None]: Seconds to wait, None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Decides whether and when to repeat failed requests.
+
+    Requests are repeated if the API can not be reached, if it answers with one of
+    ``statuses``, or if it returns one of ``api_error_codes``. The n-th retry waits up to
+    ``backoff_factor * 2 ** n`` seconds (at most ``max_backoff``). With ``jitter``, the
+    wait is chosen randomly up to that value, so that many clients do not retry at the
+    same time. A ``Retry-After`` header of the response takes precedence.
+
+    Args:
+        max_retries (int, optional): Maximum number of retries per request. Defaults to 3.
+        backoff_factor (float, optional): Wait before the first retry, doubled for each further retry. Defaults to 0.5.
+        max_backoff (float, optional): Maximum wait between two attempts. Defaults to 30.
+        jitter (bool, optional): Randomize the wait. Defaults to True.
+        statuses (Iterable[int], optional): HTTP status codes to retry. Defaults to 429, 500, 502, 503 and 504.
+        api_error_codes (Iterable[str], optional): Error codes returned by the API (see :class:`pypresseportal.pypresseportal_errors.ApiError`) to retry. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        statuses: Iterable[int] = RETRY_STATUSES,
+        api_error_codes: Iterable[str] = None,
+    ):
+        """Constructor method."""
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.api_error_codes = frozenset(str(code) for code in api_error_codes or ())
+
+    def can_retry(self, attempt: int) -> bool:
+        """Returns True if another attempt is allowed.
+
+        Args:
+            attempt (int): Number of retries so far.
+
+        Returns:
+            bool: True if the request may be repeated.
+        """
+        return attempt < self.max_retries
+
+    def should_retry(self, error: Exception) -> bool:
+        """Returns True if a request that failed with ``error`` should be repeated.
+
+        Args:
+            error (Exception): Error raised by the request.
+
+        Returns:
+            bool: True for connection failures, retryable status codes and listed API error codes.
+        """
+        if isinstance(error, (ApiConnectionFail, RetryableResponse)):
+            return True
+        if isinstance(error, ApiError):
+            return str(error.error_code) in self.api_error_codes
+        return False
+
+    def backoff(self, attempt: int, retry_after: Union[float, None] = None) -> float:
+        """Returns the time to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of retries so far.
+            retry_after (Union[float, None], optional): Wait requested by the API. Defaults to None.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def wait(self, attempt: int, retry_after: Union[float, None] = None) -> None:
+        """Waits before the next attempt, see :meth:`backoff`.
+
+        Args:
+            attempt (int): Number of retries so far.
+            retry_after (Union[float, None], optional): Wait requested by the API. Defaults to None.
+        """
+        delay = self.backoff(attempt, retry_after)
+        if delay > 0:
+            time.sleep(delay)
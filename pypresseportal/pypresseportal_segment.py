@@ -0,0 +1,477 @@
+"""Compressed segment files of stories.
+
+A segment stores the json data of many stories in compressed blocks. For every block,
+a small index holds the range of publication dates, the range of story ids and the
+ids of the publishing companies and offices. Scans only decompress the blocks that
+can contain matching stories (predicate pushdown), so time range and company scans
+of large archives read a fraction of the file:
+
+>>> from datetime import datetime, timezone
+>>> from pypresseportal.pypresseportal_segment import Segment, SegmentWriter
+>>> with SegmentWriter("2020-07.ppseg") as writer:
+...     writer.write_items(items)
+>>> with Segment("2020-07.ppseg") as segment:
+...     print(f"{segment.ratio:.1f}x compressed")
+...     for story in segment.scan(
+...         start=datetime(2020, 7, 1, tzinfo=timezone.utc), company_id="1234"
+...     ):
+...         process(story)
+
+Blocks are compressed with zstd if the optional ``zstandard`` package is installed
+(``pip install pypresseportal[zstd]``), otherwise with zlib. Pushdown works best if
+stories are written in the order of their publication, as the API returns them.
+"""
+
+import json
+import struct
+import zlib
+
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Iterable,
+    List,
+    NamedTuple,
+    Tuple,
+    Union,
+)
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+from pypresseportal.pypresseportal_dates import published_epoch
+from pypresseportal.pypresseportal_errors import ApiDataError
+from pypresseportal.pypresseportal_json import JsonDecoder, default_decoder
+
+MAGIC = b"PPSEG001"
+# Length of the block index and magic, at the end of the file
+_FOOTER = struct.Struct("<Q8s")
+DEFAULT_BLOCK_SIZE = 256 * 1024
+DEFAULT_LEVELS = {"zstd": 9, "zlib": 6, "none": 0}
+
+Codec = Tuple[Callable[[bytes, int], bytes], Callable[[bytes], bytes]]
+
+
+def _codecs() -> Dict[str, Codec]:
+    codecs: Dict[str, Codec] = {
+        "none": (lambda data, level: data, lambda data: data),
+        "zlib": (zlib.compress, zlib.decompress),
+    }
+    if zstandard is not None:
+        codecs["zstd"] = (
+            lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data),
+        )
+    return codecs
+
+
+CODECS = _codecs()
+
+
+def default_codec() -> str:
+    """Returns the best available codec.
+
+    Returns:
+        str: ``"zstd"`` if ``zstandard`` is installed, otherwise ``"zlib"``.
+    """
+    return "zstd" if "zstd" in CODECS else "zlib"
+
+
+class BlockInfo(NamedTuple):
+    """Index entry of a compressed block.
+
+    Args:
+        offset (int): Position of the block in the file.
+        size (int): Compressed size in bytes.
+        raw_size (int): Uncompressed size in bytes.
+        stories (int): Number of stories.
+        published (Tuple[int, int]): Earliest and latest publication date of the stories, in seconds since the epoch.
+        ids (Tuple[str, str]): Smallest and largest story id, compared as strings.
+        company_ids (Tuple[str, ...]): Ids of all companies that published a story of the block, sorted.
+        office_ids (Tuple[str, ...]): Ids of all offices that published a story of the block, sorted.
+    """
+
+    offset: int
+    size: int
+    raw_size: int
+    stories: int
+    published: Tuple[int, int]
+    ids: Tuple[str, str]
+    company_ids: Tuple[str, ...]
+    office_ids: Tuple[str, ...]
+
+
+def _epoch(value: Union[datetime, int, None]) -> Union[int, None]:
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return value
+
+
+def _publisher_ids(item: dict) -> Tuple[Union[str, None], Union[str, None]]:
+    company, office = item.get("company"), item.get("office")
+    return (
+        company["id"] if company else None,
+        office["id"] if office and not company else None,
+    )
+
+
+class SegmentWriter:
+    """Writes stories to a new segment file.
+
+    Stories are collected until their json data reaches ``block_size`` bytes, then the
+    block is compressed and written. The block index is written by :meth:`close`, the
+    file is not readable before. Use the writer as a context manager to close it.
+
+    Args:
+        path (str): Path of the file, replaced if it exists.
+        codec (str, optional): ``"zstd"``, ``"zlib"`` or ``"none"``. Defaults to None (:func:`default_codec`).
+        level (int, optional): Compression level. Defaults to None (9 for zstd, 6 for zlib).
+        block_size (int, optional): Uncompressed size of a block in bytes. Larger blocks compress better, smaller blocks are skipped more precisely. Defaults to 262144.
+
+    Raises:
+        ValueError: The codec is not available.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        codec: str = None,
+        level: int = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        """Constructor method."""
+        if codec is None:
+            codec = default_codec()
+        if codec not in CODECS:
+            raise ValueError(f"Codec '{codec}' is not available.")
+        self.path = path
+        self.codec = codec
+        self.level = DEFAULT_LEVELS[codec] if level is None else level
+        self.block_size = block_size
+        self.blocks: List[BlockInfo] = []
+        self._compress = CODECS[codec][0]
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._records: List[bytes] = []
+        self._items: List[Tuple[int, str, Union[str, None], Union[str, None]]] = []
+        self._pending_size = 0
+
+    def __enter__(self) -> "SegmentWriter":
+        """Enters a ``with`` block, returns the writer."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Leaves a ``with`` block, writes the block index and closes the file."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Returns the number of stories written so far."""
+        return sum(block.stories for block in self.blocks) + len(self._records)
+
+    def write_item(self, item: dict) -> None:
+        """Appends the json data of a story.
+
+        Args:
+            item (dict): Json data of a story, as in ``content.story`` of an API response.
+
+        Raises:
+            ApiDataError: The story has no id or publication date.
+        """
+        for required_key in ("id", "published"):
+            if required_key not in item:
+                raise ApiDataError(f"Required key {required_key} missing.")
+        # Json text never contains a raw line break, so records are separated by one
+        record = json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode()
+        self._records.append(record)
+        self._items.append(
+            (published_epoch(item["published"]), item["id"]) + _publisher_ids(item)
+        )
+        self._pending_size += len(record) + 1
+        if self._pending_size >= self.block_size:
+            self._flush()
+
+    def write(self, story: Any) -> None:
+        """Appends a story.
+
+        Args:
+            story (Story): ``Story``, ``LazyStory`` or ``CompactStory`` object that kept its raw data.
+        """
+        self.write_item(story.data)
+
+    def write_items(self, items: Iterable[dict]) -> int:
+        """Appends the json data of stories, see :meth:`write_item`.
+
+        Args:
+            items (Iterable[dict]): Json data of the stories.
+
+        Returns:
+            int: Number of written stories.
+        """
+        count = 0
+        for item in items:
+            self.write_item(item)
+            count += 1
+        return count
+
+    def _flush(self) -> None:
+        if not self._records:
+            return
+        raw = b"\n".join(self._records)
+        data = self._compress(raw, self.level)
+        epochs = [entry[0] for entry in self._items]
+        ids = [entry[1] for entry in self._items]
+        self.blocks.append(
+            BlockInfo(
+                self._file.tell(),
+                len(data),
+                len(raw),
+                len(self._records),
+                (min(epochs), max(epochs)),
+                (min(ids), max(ids)),
+                tuple(sorted({entry[2] for entry in self._items if entry[2]})),
+                tuple(sorted({entry[3] for entry in self._items if entry[3]})),
+            )
+        )
+        self._file.write(data)
+        self._records, self._items, self._pending_size = [], [], 0
+
+    def close(self) -> None:
+        """Writes the last block and the block index, and closes the file."""
+        if self._file.closed:
+            return
+        self._flush()
+        index = zlib.compress(
+            json.dumps(
+                {"codec": self.codec, "blocks": [list(block) for block in self.blocks]}
+            ).encode()
+        )
+        self._file.write(index)
+        self._file.write(_FOOTER.pack(len(index), MAGIC))
+        self._file.close()
+
+
+class Segment:
+    """Read-only access to a segment file.
+
+    Opening a segment only reads its block index. Blocks are read and decompressed
+    when a scan reaches them, one at a time.
+
+    Args:
+        path (str): Path of a file written by :class:`SegmentWriter`.
+        model (Callable[[dict], Any], optional): Story class, for example :class:`pypresseportal.pypresseportal_lazy.LazyStory`. Defaults to :class:`pypresseportal.Story`.
+        json_decoder (JsonDecoder, optional): Function decoding a record, see :mod:`pypresseportal.pypresseportal_json`. Defaults to None (``orjson`` if it is installed, otherwise ``json``).
+
+    Raises:
+        OSError: The file can not be read.
+        ValueError: The file is not a segment, its block index is incomplete or corrupt, or its codec is not available.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: Callable[[dict], Any] = None,
+        json_decoder: JsonDecoder = None,
+    ):
+        """Constructor method."""
+        if model is None:
+            from pypresseportal.pypresseportal import Story
+
+            model = Story
+        self.path = path
+        self.model = model
+        self.json_decoder = default_decoder() if json_decoder is None else json_decoder
+        self._file = open(path, "rb")
+        try:
+            self.file_size, self.codec, self.blocks = self._read_index()
+        except BaseException:
+            self._file.close()
+            raise
+        self._decompress = CODECS[self.codec][1]
+
+    def _read_index(self) -> Tuple[int, str, List[BlockInfo]]:
+        # File size, codec and blocks, ValueError if the file is not a valid segment
+        path = self.path
+        self._file.seek(0, 2)
+        file_size = self._file.tell()
+        self._file.seek(0)
+        if self._file.read(len(MAGIC)) != MAGIC or file_size < 2 * _FOOTER.size:
+            raise ValueError(f"{path} is not a segment file.")
+        self._file.seek(file_size - _FOOTER.size)
+        index_size, magic = _FOOTER.unpack(self._file.read(_FOOTER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is incomplete.")
+        if index_size > file_size - len(MAGIC) - _FOOTER.size:
+            raise ValueError(f"The block index of {path} is corrupt.")
+        self._file.seek(file_size - _FOOTER.size - index_size)
+        try:
+            index = json.loads(zlib.decompress(self._file.read(index_size)))
+            codec = index["codec"]
+            blocks = [
+                BlockInfo(
+                    offset,
+                    size,
+                    raw_size,
+                    count,
+                    tuple(published),  # type: ignore
+                    tuple(ids),  # type: ignore
+                    tuple(company_ids),
+                    tuple(office_ids),
+                )
+                for (
+                    offset,
+                    size,
+                    raw_size,
+                    count,
+                    published,
+                    ids,
+                    company_ids,
+                    office_ids,
+                ) in index["blocks"]
+            ]
+        except (zlib.error, KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"The block index of {path} is corrupt.") from error
+        if not isinstance(codec, str) or codec not in CODECS:
+            raise ValueError(f"Codec '{codec}' of {path} is not available.")
+        return file_size, codec, blocks
+
+    def __enter__(self) -> "Segment":
+        """Enters a ``with`` block, returns the segment."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Leaves a ``with`` block and closes the file."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
+
+    def __len__(self) -> int:
+        """Returns the number of stories."""
+        return sum(block.stories for block in self.blocks)
+
+    @property
+    def raw_size(self) -> int:
+        """Uncompressed size of all records in bytes."""
+        return sum(block.raw_size for block in self.blocks)
+
+    @property
+    def compressed_size(self) -> int:
+        """Compressed size of all blocks in bytes."""
+        return sum(block.size for block in self.blocks)
+
+    @property
+    def ratio(self) -> float:
+        """Compression ratio, uncompressed size divided by compressed size."""
+        return self.raw_size / (self.compressed_size or 1)
+
+    def blocks_for(
+        self,
+        start: Union[datetime, int, None] = None,
+        end: Union[datetime, int, None] = None,
+        company_id: str = None,
+        office_id: str = None,
+        story_id: str = None,
+    ) -> List[int]:
+        """Returns the positions of the blocks that can contain matching stories.
+
+        Args:
+            start (Union[datetime, int], optional): Published at or after this time (aware datetime or seconds since the epoch). Defaults to None.
+            end (Union[datetime, int], optional): Published before this time. Defaults to None.
+            company_id (str, optional): Published by this company. Defaults to None.
+            office_id (str, optional): Published by this office. Defaults to None.
+            story_id (str, optional): Story with this id. Defaults to None.
+
+        Returns:
+            List[int]: Positions in :attr:`blocks`, in file order.
+        """
+        first, last = _epoch(start), _epoch(end)
+        return [
+            position
+            for position, block in enumerate(self.blocks)
+            if (first is None or block.published[1] >= first)
+            and (last is None or block.published[0] < last)
+            and (company_id is None or company_id in block.company_ids)
+            and (office_id is None or office_id in block.office_ids)
+            and (story_id is None or block.ids[0] <= story_id <= block.ids[1])
+        ]
+
+    def _read_block(self, block: BlockInfo) -> bytes:
+        self._file.seek(block.offset)
+        return self._decompress(self._file.read(block.size))
+
+    def items(
+        self,
+        start: Union[datetime, int, None] = None,
+        end: Union[datetime, int, None] = None,
+        company_id: str = None,
+        office_id: str = None,
+        story_id: str = None,
+    ) -> Iterator[dict]:
+        """Yields the json data of the matching stories, in file order.
+
+        Blocks that can not contain a match are skipped without reading them, see
+        :meth:`blocks_for`. Arguments are the same.
+
+        Yields:
+            dict: Json data of the stories matching all given conditions.
+        """
+        first, last = _epoch(start), _epoch(end)
+        for position in self.blocks_for(first, last, company_id, office_id, story_id):
+            for record in self._read_block(self.blocks[position]).split(b"\n"):
+                item = self.json_decoder(record)
+                if story_id is not None and item["id"] != story_id:
+                    continue
+                if company_id is not None or office_id is not None:
+                    company, office = _publisher_ids(item)
+                    if company_id is not None and company != company_id:
+                        continue
+                    if office_id is not None and office != office_id:
+                        continue
+                if first is not None or last is not None:
+                    epoch = published_epoch(item["published"])
+                    if (first is not None and epoch < first) or (
+                        last is not None and epoch >= last
+                    ):
+                        continue
+                yield item
+
+    def scan(
+        self,
+        start: Union[datetime, int, None] = None,
+        end: Union[datetime, int, None] = None,
+        company_id: str = None,
+        office_id: str = None,
+    ) -> Iterator[Any]:
+        """Yields the matching stories as objects of ``model``, in file order.
+
+        Args:
+            start (Union[datetime, int], optional): Published at or after this time (aware datetime or seconds since the epoch). Defaults to None.
+            end (Union[datetime, int], optional): Published before this time. Defaults to None.
+            company_id (str, optional): Published by this company. Defaults to None.
+            office_id (str, optional): Published by this office. Defaults to None.
+
+        Yields:
+            Story: Stories matching all given conditions.
+        """
+        model = self.model
+        for item in self.items(start, end, company_id, office_id):
+            yield model(item)
+
+    def get(self, story_id: str) -> Any:
+        """Returns a story by id, only reading the blocks whose id range includes it.
+
+        Args:
+            story_id (str): Id of the story.
+
+        Returns:
+            Union[Story, None]: Object of ``model``, None if the story is not in the segment.
+        """
+        for item in self.items(story_id=story_id):
+            return self.model(item)
+        return None
@@ -0,0 +1,120 @@
+"""Connection pooling for PyPresseportal.
+
+All ``PresseportalApi`` objects that use the same API key and the same pool
+settings share one ``requests.Session``. The session keeps connections to
+api.presseportal.de alive between queries, so consecutive requests do not pay
+for a new TCP and TLS handshake. Shared sessions are reference counted and
+closed once the last API object using them is closed.
+"""
+
+import threading
+
+from typing import Dict, Tuple
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+_PoolKey = Tuple[str, int, int, bool, bool]
+
+
+class _SharedSession:
+    """A ``requests.Session`` and the number of API objects using it."""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+        self.users = 0
+
+
+class SessionPool:
+    """Registry of pooled, keep-alive sessions shared between API objects.
+
+    Sessions are keyed on the API key and the pool settings. Access to the
+    registry is synchronized, so API objects can be created and closed from
+    several threads.
+    """
+
+    def __init__(self):
+        """Constructor method."""
+        self._lock = threading.Lock()
+        self._sessions: Dict[_PoolKey, _SharedSession] = {}
+
+    @staticmethod
+    def _create_session(
+        pool_connections: int, pool_maxsize: int, keep_alive: bool, pool_block: bool
+    ) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def acquire(
+        self,
+        api_key: str,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        pool_block: bool = False,
+    ) -> requests.Session:
+        """Returns the shared session for an API key, creating it if required.
+
+        Every call to ``acquire()`` must be matched by a call to :meth:`release`.
+
+        Args:
+            api_key (str): API key of the ``PresseportalApi`` object.
+            pool_connections (int, optional): Number of host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of connections kept per host. Defaults to 10.
+            keep_alive (bool, optional): Reuse connections between requests. Defaults to True.
+            pool_block (bool, optional): Block instead of opening extra connections when the pool is exhausted. Defaults to False.
+
+        Returns:
+            requests.Session: Session with a pooled HTTP adapter.
+        """
+        key = (api_key, pool_connections, pool_maxsize, keep_alive, pool_block)
+        with self._lock:
+            shared = self._sessions.get(key)
+            if shared is None:
+                shared = _SharedSession(
+                    self._create_session(
+                        pool_connections, pool_maxsize, keep_alive, pool_block
+                    )
+                )
+                self._sessions[key] = shared
+            shared.users += 1
+            return shared.session
+
+    def release(self, session: requests.Session) -> None:
+        """Releases a session returned by :meth:`acquire`.
+
+        The session is closed once no API object uses it anymore.
+
+        Args:
+            session (requests.Session): Session to release.
+        """
+        with self._lock:
+            for key, shared in self._sessions.items():
+                if shared.session is session:
+                    shared.users -= 1
+                    if shared.users <= 0:
+                        del self._sessions[key]
+                        session.close()
+                    return
+
+    def __len__(self) -> int:
+        """Returns the number of open shared sessions."""
+        with self._lock:
+            return len(self._sessions)
+
+
+# Sessions shared by all PresseportalApi objects in this process
+session_pool = SessionPool()
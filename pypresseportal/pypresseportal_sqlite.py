@@ -0,0 +1,75 @@
+"""SQLite connection handling for PyPresseportal.
+
+:class:`pypresseportal.pypresseportal_cache.SqliteCache` and
+:class:`pypresseportal.pypresseportal_archive.StoryArchive` keep their data in SQLite
+database files that many threads and processes use at the same time. Both open their
+connections through a :class:`SqliteConnections` object.
+"""
+
+import os
+import sqlite3
+import threading
+
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class SqliteConnections:
+    """Connections to a SQLite database file, one per thread and process.
+
+    The database uses write-ahead logging, so readers do not block writers. A
+    connection is opened by the first call of :meth:`get` in each thread, and again
+    after a fork.
+
+    Args:
+        path (str): Path of the database file, created if it does not exist.
+        timeout (float, optional): Seconds to wait for a lock held by another process. Defaults to 30.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """Constructor method."""
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """Returns the connection of the calling thread.
+
+        Returns:
+            sqlite3.Connection: Connection in autocommit mode.
+        """
+        # Connections must neither be shared between threads nor survive a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        """Closes the connection of the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Runs a write transaction, committed when the block ends without an exception.
+
+        Yields:
+            sqlite3.Connection: Connection of the calling thread.
+        """
+        conn = self.get()
+        # Take the write lock up front, so concurrent writers wait instead of failing
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
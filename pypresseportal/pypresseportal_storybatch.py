@@ -0,0 +1,364 @@
+"""Columnar story results.
+
+A :class:`StoryBatch` stores one or many pages of stories as parallel columns
+instead of a list of :class:`pypresseportal.Story` objects: one list or array per
+field, with one entry per story. Columns are cheap to scan, filter and aggregate,
+and they are built directly from the json data without creating ``Story`` objects:
+
+>>> batch = api_object.get_story_batch("get_stories_topic", topic="finanzen", max_stories=500)
+>>> recent = batch.filter(epoch >= cutoff for epoch in batch.published)
+>>> Counter(recent.company_ids).most_common(10)
+
+``Story`` objects are only created on demand, from the raw json data kept in the batch.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Union
+
+from pypresseportal.pypresseportal_compact import (
+    _check_required,
+    _intern,
+    _publisher_ids,
+)
+from pypresseportal.pypresseportal_constants import STORY_REQUIRED_KEYS
+from pypresseportal.pypresseportal_dates import (
+    epoch_to_datetime,
+    published_epoch_offset,
+)
+
+# Columns holding one entry per story, in the order of __init__
+_ROW_COLUMNS = (
+    "ids",
+    "titles",
+    "published",
+    "published_offsets",
+    "company_ids",
+    "office_ids",
+    "ressorts",
+    "languages",
+)
+
+
+class StoryBatch:
+    """A page, or many concatenated pages, of stories stored as parallel columns.
+
+    Entry ``i`` of every column belongs to the ``i``-th story. ``keywords`` holds the
+    keywords of all stories, one after the other. The keywords of story ``i`` are
+    ``keywords[keyword_offsets[i]:keyword_offsets[i + 1]]``, see :meth:`keywords_of`.
+
+    Attributes:
+        ids (List[str]): Story ids.
+        titles (List[str]): Headlines.
+        published (array[int]): Publication dates in seconds since the epoch.
+        published_offsets (array[int]): UTC offsets of the publication dates in seconds.
+        company_ids (List[Union[str, None]]): Ids of the publishing companies, None for stories of an office.
+        office_ids (List[Union[str, None]]): Ids of the publishing offices, None for stories of a company.
+        ressorts (List[Union[str, None]]): Editorial departments.
+        languages (List[Union[str, None]]): Languages.
+        keywords (List[str]): Keywords of all stories.
+        keyword_offsets (array[int]): Start of each story's keywords in ``keywords``, followed by the total number of keywords.
+        items (Union[List[dict], None]): Raw json data of the stories, None if it was not kept.
+
+    Create batches with :meth:`from_json`, :meth:`from_items` or :meth:`from_stories`.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        titles: List[str],
+        published: "array[int]",
+        published_offsets: "array[int]",
+        company_ids: List[Union[str, None]],
+        office_ids: List[Union[str, None]],
+        ressorts: List[Union[str, None]],
+        languages: List[Union[str, None]],
+        keywords: List[str],
+        keyword_offsets: "array[int]",
+        items: Union[List[dict], None] = None,
+    ):
+        """Constructor method."""
+        self.ids = ids
+        self.titles = titles
+        self.published = published
+        self.published_offsets = published_offsets
+        self.company_ids = company_ids
+        self.office_ids = office_ids
+        self.ressorts = ressorts
+        self.languages = languages
+        self.keywords = keywords
+        self.keyword_offsets = keyword_offsets
+        self.items = items
+
+    @classmethod
+    def empty(cls, keep_data: bool = True) -> "StoryBatch":
+        """Returns a batch without stories.
+
+        Args:
+            keep_data (bool, optional): Keep the raw json data of stories added later. Defaults to True.
+
+        Returns:
+            StoryBatch: Empty batch.
+        """
+        return cls(
+            [],
+            [],
+            array("q"),
+            array("i"),
+            [],
+            [],
+            [],
+            [],
+            [],
+            array("q", [0]),
+            [] if keep_data else None,
+        )
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict], keep_data: bool = True) -> "StoryBatch":
+        """Creates a batch from the json data of stories.
+
+        Args:
+            items (Iterable[dict]): Json data of the stories, as in ``content.story`` of an API response.
+            keep_data (bool, optional): Keep the raw json data, required to create ``Story`` objects. Defaults to True.
+
+        Raises:
+            ApiDataError: A required key is missing.
+
+        Returns:
+            StoryBatch: Batch of the stories.
+        """
+        batch = cls.empty(keep_data)
+        batch.extend(items)
+        return batch
+
+    @classmethod
+    def from_json(cls, json_data: dict, keep_data: bool = True) -> "StoryBatch":
+        """Creates a batch from the json data of an API response.
+
+        Args:
+            json_data (dict): Json data of a story query.
+            keep_data (bool, optional): Keep the raw json data, required to create ``Story`` objects. Defaults to True.
+
+        Raises:
+            ApiDataError: A required key is missing.
+
+        Returns:
+            StoryBatch: Batch of the stories in the response.
+        """
+        return cls.from_items(json_data["content"]["story"], keep_data)
+
+    @classmethod
+    def from_stories(cls, stories: Iterable[Any]) -> "StoryBatch":
+        """Creates a batch from story objects with a ``data`` attribute.
+
+        Args:
+            stories (Iterable[Story]): ``Story``, ``LazyStory`` or ``CompactStory`` objects that kept their raw data.
+
+        Returns:
+            StoryBatch: Batch of the stories.
+        """
+        return cls.from_items(story.data for story in stories)
+
+    @classmethod
+    def concat(cls, batches: Iterable["StoryBatch"]) -> "StoryBatch":
+        """Concatenates batches into a new batch.
+
+        Args:
+            batches (Iterable[StoryBatch]): Batches to concatenate.
+
+        Returns:
+            StoryBatch: Batch with the stories of all batches, in order. Raw json data is only kept if all batches kept it.
+        """
+        batches = list(batches)
+        keep_data = all(batch.items is not None for batch in batches)
+        result = cls.empty(keep_data)
+        for batch in batches:
+            result._append_columns(batch)
+        return result
+
+    def extend(self, items: Iterable[dict]) -> None:
+        """Appends the json data of stories to the batch.
+
+        Args:
+            items (Iterable[dict]): Json data of the stories.
+
+        Raises:
+            ApiDataError: A required key is missing, also in the company or office of a story. Stories before the invalid one have been added.
+        """
+        for item in items:
+            # All values are read before the first column changes, so an invalid
+            # story leaves the columns aligned
+            _check_required(item, STORY_REQUIRED_KEYS)
+            epoch, offset = published_epoch_offset(item["published"])
+            company_id, office_id = _publisher_ids(item)
+            keywords = item.get("keywords")
+            if type(keywords) is dict and "keyword" in keywords:
+                keyword_list = [_intern(keyword) for keyword in keywords["keyword"]]
+            else:
+                keyword_list = []
+
+            self.ids.append(item["id"])
+            self.titles.append(item["title"])
+            self.published.append(epoch)
+            self.published_offsets.append(offset)
+            self.company_ids.append(company_id)
+            self.office_ids.append(office_id)
+            self.ressorts.append(_intern(item.get("ressort")))
+            self.languages.append(_intern(item.get("language")))
+            self.keywords.extend(keyword_list)
+            self.keyword_offsets.append(len(self.keywords))
+            if self.items is not None:
+                self.items.append(item)
+
+    def _append_columns(self, other: "StoryBatch") -> None:
+        base = len(self.keywords)
+        for name in _ROW_COLUMNS:
+            getattr(self, name).extend(getattr(other, name))
+        self.keywords.extend(other.keywords)
+        first = other.keyword_offsets[0]
+        self.keyword_offsets.extend(
+            base + offset - first for offset in other.keyword_offsets[1:]
+        )
+        if self.items is not None and other.items is not None:
+            self.items.extend(other.items)
+
+    def __len__(self) -> int:
+        """Returns the number of stories."""
+        return len(self.ids)
+
+    def __add__(self, other: "StoryBatch") -> "StoryBatch":
+        """Returns the concatenation of two batches."""
+        return self.concat((self, other))
+
+    def __getitem__(self, index: Union[int, slice]):
+        """Returns a ``Story`` for an integer index, a ``StoryBatch`` for a slice."""
+        if isinstance(index, slice):
+            return self._slice(index)
+        return self.story(index)
+
+    def _slice(self, index: slice) -> "StoryBatch":
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            return self.take(range(start, stop, step))
+        stop = max(start, stop)
+        first, last = self.keyword_offsets[start], self.keyword_offsets[stop]
+        offsets = self.keyword_offsets[start : stop + 1]
+        result = StoryBatch.empty(keep_data=False)
+        for name in _ROW_COLUMNS:
+            setattr(result, name, getattr(self, name)[start:stop])
+        result.keywords = self.keywords[first:last]
+        result.keyword_offsets = array("q", (offset - first for offset in offsets))
+        if self.items is not None:
+            result.items = self.items[start:stop]
+        return result
+
+    def take(self, indices: Iterable[int]) -> "StoryBatch":
+        """Returns a new batch with the stories at ``indices``.
+
+        Args:
+            indices (Iterable[int]): Positions of the stories, in the order of the result.
+
+        Returns:
+            StoryBatch: Selected stories.
+        """
+        count = len(self)
+        positions = [i + count if i < 0 else i for i in indices]
+        result = StoryBatch.empty(keep_data=False)
+        for name in _ROW_COLUMNS:
+            setattr(result, name, _select(getattr(self, name), positions))
+        offsets = self.keyword_offsets
+        for i in positions:
+            result.keywords.extend(self.keywords[offsets[i] : offsets[i + 1]])
+            result.keyword_offsets.append(len(result.keywords))
+        if self.items is not None:
+            result.items = [self.items[i] for i in positions]
+        return result
+
+    def filter(self, mask: Iterable[bool]) -> "StoryBatch":
+        """Returns a new batch with the stories where ``mask`` is true.
+
+        Args:
+            mask (Iterable[bool]): One value per story, for example computed from a column.
+
+        Returns:
+            StoryBatch: Selected stories.
+        """
+        return self.take(i for i, selected in enumerate(mask) if selected)
+
+    def keywords_of(self, index: int) -> List[str]:
+        """Returns the keywords of a story.
+
+        Args:
+            index (int): Position of the story.
+
+        Returns:
+            List[str]: Keywords of the story.
+        """
+        if index < 0:
+            index += len(self)
+        return self.keywords[
+            self.keyword_offsets[index] : self.keyword_offsets[index + 1]
+        ]
+
+    def published_datetime(self, index: int) -> datetime:
+        """Returns the publication date of a story as an aware datetime.
+
+        Args:
+            index (int): Position of the story.
+
+        Returns:
+            datetime: Publication date, equal to ``Story.published``.
+        """
+        return epoch_to_datetime(self.published[index], self.published_offsets[index])
+
+    def story(self, index: int, model: Callable[[dict], Any] = None) -> Any:
+        """Creates a story object from the raw json data of a story.
+
+        Args:
+            index (int): Position of the story.
+            model (Callable[[dict], Any], optional): Story class, for example :class:`pypresseportal.pypresseportal_lazy.LazyStory`. Defaults to :class:`pypresseportal.Story`.
+
+        Raises:
+            ValueError: The batch did not keep the raw json data.
+
+        Returns:
+            Story: Story object.
+        """
+        if self.items is None:
+            raise ValueError("The batch did not keep the raw json data of its stories.")
+        if model is None:
+            from pypresseportal.pypresseportal import Story
+
+            model = Story
+        return model(self.items[index])
+
+    def stories(self, model: Callable[[dict], Any] = None) -> Iterator[Any]:
+        """Creates story objects for all stories, one at a time, see :meth:`story`.
+
+        Args:
+            model (Callable[[dict], Any], optional): Story class. Defaults to :class:`pypresseportal.Story`.
+
+        Yields:
+            Story: Story objects, in order.
+        """
+        for index in range(len(self)):
+            yield self.story(index, model)
+
+    def to_dict(self) -> Dict[str, Sequence]:
+        """Returns the columns by name, e.g. to create a data frame.
+
+        Returns:
+            Dict[str, Sequence]: One sequence per column, the keywords as one list per story.
+        """
+        columns: Dict[str, Sequence] = {
+            name: getattr(self, name) for name in _ROW_COLUMNS
+        }
+        columns["keywords"] = [self.keywords_of(i) for i in range(len(self))]
+        return columns
+
+
+def _select(column: Sequence, indices: List[int]) -> Sequence:
+    if isinstance(column, array):
+        return array(column.typecode, [column[i] for i in indices])
+    return [column[i] for i in indices]
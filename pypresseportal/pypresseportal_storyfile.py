@@ -0,0 +1,372 @@
+"""Compact story files with an offset index, read through a memory map.
+
+A story file holds the raw json data of many stories, one compact json record after
+the other, followed by two indexes: the offset of every record, and the hashes of the
+story ids sorted for binary search. :class:`StoryFile` memory-maps the file, so
+opening it only reads the header, however many stories it holds. Stories are decoded
+only when they are accessed, by position or by id:
+
+>>> from pypresseportal.pypresseportal_storyfile import StoryFile, StoryFileWriter
+>>> with StoryFileWriter("stories.ppsf") as writer:
+...     for story in api_object.iter_stories(max_stories=10000):
+...         writer.write(story)
+>>> with StoryFile("stories.ppsf") as stories:
+...     latest = stories[0]
+...     story = stories.get("4635945")
+...     titles = [story.title for story in stories.stories(1000, 2000)]
+
+Exported API responses can be converted without loading them as a whole, see
+:func:`convert_json_files`.
+
+File layout (all integers unsigned 64 bit little endian, sections aligned to 8 bytes):
+
+    * Header: magic ``PPSTORY1``, number of stories, offsets of the three indexes.
+    * Records: json data of the stories in UTF-8, in the order they were written.
+    * Record offsets: start of every record, followed by the end of the last one.
+    * Id hashes: 64 bit hashes of all story ids, sorted.
+    * Id positions: position of the story of each hash.
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, Iterator, Sequence, Tuple, Union
+
+from pypresseportal.pypresseportal_errors import ApiDataError
+from pypresseportal.pypresseportal_json import JsonDecoder, default_decoder
+from pypresseportal.pypresseportal_stream import iter_story_items
+
+MAGIC = b"PPSTORY1"
+# Magic, number of stories, offsets of record offsets, id hashes and id positions
+_HEADER = struct.Struct("<8sQQQQ")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+# Bytes read at once when converting json files
+_CHUNK_SIZE = 1 << 20
+
+
+def id_hash(story_id: str) -> int:
+    """Returns the 64 bit hash of a story id used by the id index.
+
+    Args:
+        story_id (str): Id of a story.
+
+    Returns:
+        int: Hash of the id.
+    """
+    digest = hashlib.blake2b(story_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _to_little_endian(values: "array[int]") -> bytes:
+    if not _LITTLE_ENDIAN:  # pragma: no cover
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class StoryFileWriter:
+    """Writes stories to a new story file.
+
+    Records are written as they are added, only their offsets and id hashes are kept in
+    memory (16 bytes per story, more while the id index is sorted). The indexes are
+    written by :meth:`close`, the file is not readable before. Use the writer as a
+    context manager to close it.
+
+    Args:
+        path (str): Path of the file, replaced if it exists.
+    """
+
+    def __init__(self, path: str):
+        """Constructor method."""
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(b"\0" * _HEADER.size)
+        self._offsets = array("Q", [_HEADER.size])
+        self._hashes = array("Q")
+
+    def __enter__(self) -> "StoryFileWriter":
+        """Enters a ``with`` block, returns the writer."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Leaves a ``with`` block, writes the indexes and closes the file."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Returns the number of stories written so far."""
+        return len(self._hashes)
+
+    def write_item(self, item: dict) -> None:
+        """Appends the json data of a story.
+
+        Args:
+            item (dict): Json data of a story, as in ``content.story`` of an API response.
+
+        Raises:
+            ApiDataError: The story has no id.
+        """
+        if "id" not in item:
+            raise ApiDataError("Required key id missing.")
+        record = json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+        self._file.write(record.encode("utf-8"))
+        self._offsets.append(self._file.tell())
+        self._hashes.append(id_hash(item["id"]))
+
+    def write(self, story: Any) -> None:
+        """Appends a story.
+
+        Args:
+            story (Story): ``Story``, ``LazyStory`` or ``CompactStory`` object that kept its raw data.
+        """
+        self.write_item(story.data)
+
+    def write_items(self, items: Iterable[dict]) -> int:
+        """Appends the json data of stories, see :meth:`write_item`.
+
+        Args:
+            items (Iterable[dict]): Json data of the stories.
+
+        Returns:
+            int: Number of written stories.
+        """
+        count = 0
+        for item in items:
+            self.write_item(item)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """Writes the indexes and the header, and closes the file."""
+        if self._file.closed:
+            return
+        out_file = self._file
+        out_file.write(b"\0" * (-out_file.tell() % 8))
+        offsets_start = out_file.tell()
+        out_file.write(_to_little_endian(self._offsets))
+
+        order = sorted(range(len(self._hashes)), key=self._hashes.__getitem__)
+        hashes_start = out_file.tell()
+        out_file.write(_to_little_endian(array("Q", (self._hashes[i] for i in order))))
+        positions_start = out_file.tell()
+        out_file.write(_to_little_endian(array("Q", order)))
+
+        out_file.seek(0)
+        out_file.write(
+            _HEADER.pack(
+                MAGIC, len(self._hashes), offsets_start, hashes_start, positions_start
+            )
+        )
+        out_file.close()
+
+
+class StoryFile:
+    """Read-only, memory-mapped access to a story file.
+
+    Opening a file only reads its header. The indexes and records are paged in by the
+    operating system as they are accessed, so memory use depends on the stories that
+    are read, not on the size of the file. Stories are returned as new objects of
+    ``model`` on every access.
+
+    Args:
+        path (str): Path of a file written by :class:`StoryFileWriter`.
+        model (Callable[[dict], Any], optional): Story class, for example :class:`pypresseportal.pypresseportal_lazy.LazyStory`. Defaults to :class:`pypresseportal.Story`.
+        json_decoder (JsonDecoder, optional): Function decoding a record, see :mod:`pypresseportal.pypresseportal_json`. Defaults to None (``orjson`` if it is installed, otherwise ``json``).
+
+    Raises:
+        OSError: The file can not be read.
+        ValueError: The file is not a story file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: Callable[[dict], Any] = None,
+        json_decoder: JsonDecoder = None,
+    ):
+        """Constructor method."""
+        if model is None:
+            from pypresseportal.pypresseportal import Story
+
+            model = Story
+        self.path = path
+        self.model = model
+        self.json_decoder = default_decoder() if json_decoder is None else json_decoder
+        with open(path, "rb") as in_file:
+            header = in_file.read(_HEADER.size)
+            if len(header) != _HEADER.size or header[:8] != MAGIC:
+                raise ValueError(f"{path} is not a story file.")
+            self._mmap = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, self._count, offsets_start, hashes_start, positions_start = _HEADER.unpack(
+            header
+        )
+        if positions_start + self._count * 8 > len(self._mmap):
+            self._mmap.close()
+            raise ValueError(f"{path} is incomplete.")
+        self._view = memoryview(self._mmap)
+        self.offsets = self._index(offsets_start, self._count + 1)
+        self._hashes = self._index(hashes_start, self._count)
+        self._positions = self._index(positions_start, self._count)
+
+    def _index(self, start: int, count: int) -> Sequence[int]:
+        section = self._view[start : start + count * 8]
+        if _LITTLE_ENDIAN:
+            return section.cast("Q")
+        values = array("Q", section.tobytes())  # pragma: no cover
+        values.byteswap()  # pragma: no cover
+        return values  # pragma: no cover
+
+    def __enter__(self) -> "StoryFile":
+        """Enters a ``with`` block, returns the story file."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Leaves a ``with`` block and unmaps the file."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps the file. Records that have been read stay valid."""
+        for index in (self.offsets, self._hashes, self._positions, self._view):
+            if isinstance(index, memoryview):
+                index.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        """Returns the number of stories."""
+        return self._count
+
+    def raw(self, position: int) -> bytes:
+        """Returns the json record of a story.
+
+        Args:
+            position (int): Position of the story, negative positions count from the end.
+
+        Raises:
+            IndexError: There is no story at this position.
+
+        Returns:
+            bytes: Json data of the story in UTF-8.
+        """
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("story file index out of range")
+        return self._mmap[self.offsets[position] : self.offsets[position + 1]]
+
+    def item(self, position: int) -> dict:
+        """Returns the json data of a story, see :meth:`raw`."""
+        return self.json_decoder(self.raw(position))
+
+    def __getitem__(self, position: int) -> Any:
+        """Returns the story at a position, as an object of ``model``."""
+        return self.model(self.item(position))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yields all stories, in the order they were written."""
+        return self.stories()
+
+    def stories(self, start: int = 0, stop: Union[int, None] = None) -> Iterator[Any]:
+        """Yields the stories from position ``start`` to ``stop``, one at a time.
+
+        Args:
+            start (int, optional): Position of the first story. Defaults to 0.
+            stop (int, optional): Position after the last story. Defaults to None (all stories).
+
+        Yields:
+            Story: Objects of ``model``.
+        """
+        start, stop, _ = slice(start, stop).indices(self._count)
+        decoder, model, offsets, data = (
+            self.json_decoder,
+            self.model,
+            self.offsets,
+            self._mmap,
+        )
+        for position in range(start, stop):
+            yield model(decoder(data[offsets[position] : offsets[position + 1]]))
+
+    def _find(self, story_id: str) -> Union[Tuple[int, dict], None]:
+        # Position and json data of a story, different ids with the same hash are
+        # next to each other in the id index
+        key = id_hash(story_id)
+        hashes, positions = self._hashes, self._positions
+        index = bisect_left(hashes, key)
+        while index < self._count and hashes[index] == key:
+            item = self.item(positions[index])
+            if item.get("id") == story_id:
+                return positions[index], item
+            index += 1
+        return None
+
+    def position(self, story_id: str) -> Union[int, None]:
+        """Returns the position of a story.
+
+        Args:
+            story_id (str): Id of the story.
+
+        Returns:
+            Union[int, None]: Position of the story, None if it is not in the file. If the file holds the story more than once, the position of one of its copies.
+        """
+        found = self._find(story_id)
+        return None if found is None else found[0]
+
+    def get(self, story_id: str) -> Any:
+        """Returns a story by id.
+
+        Args:
+            story_id (str): Id of the story.
+
+        Returns:
+            Union[Story, None]: Object of ``model``, None if the story is not in the file.
+        """
+        found = self._find(story_id)
+        return None if found is None else self.model(found[1])
+
+    def __contains__(self, story_id: Any) -> bool:
+        """Returns True if a story with this id is in the file."""
+        return self.position(story_id) is not None
+
+
+def convert_json_files(json_paths: Iterable[str], path: str) -> int:
+    """Writes the stories of saved API responses to a new story file.
+
+    The json files are parsed incrementally (see
+    :mod:`pypresseportal.pypresseportal_stream`), so files of any size can be converted
+    with little memory.
+
+    Args:
+        json_paths (Iterable[str]): Paths of json files, each holding a story query response with ``content.story``.
+        path (str): Path of the story file.
+
+    Raises:
+        ApiDataError: A json file is not a valid story query response.
+
+    Returns:
+        int: Number of stories written.
+    """
+    with StoryFileWriter(path) as writer:
+        for json_path in json_paths:
+            with open(json_path, "rb") as in_file:
+                chunks = iter(lambda: in_file.read(_CHUNK_SIZE), b"")
+                writer.write_items(iter_story_items(chunks))
+        return len(writer)
+
+
+def write_story_file(path: str, stories: Iterable[Any]) -> int:
+    """Writes stories to a new story file.
+
+    Args:
+        path (str): Path of the file.
+        stories (Iterable[Story]): Story objects that kept their raw data.
+
+    Returns:
+        int: Number of stories written.
+    """
+    with StoryFileWriter(path) as writer:
+        for story in stories:
+            writer.write(story)
+        return len(writer)
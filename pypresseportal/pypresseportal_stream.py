@@ -0,0 +1,189 @@
+"""Incremental parsing of story responses.
+
+:func:`iter_story_items` reads the json response of a story query chunk by chunk and
+yields the json data of each story in ``content.story`` as soon as it is complete.
+Only the current story and the unread rest of the last chunk are held in memory,
+instead of the whole response, its decoded text and all of its stories at once.
+
+The response is checked like a fully decoded response: an ``error`` object raises
+:class:`pypresseportal.pypresseportal_errors.ApiError` and a response without
+``content`` raises :class:`pypresseportal.pypresseportal_errors.ApiDataError`.
+See :meth:`pypresseportal.PresseportalApi.stream_stories`.
+"""
+
+import codecs
+import json
+import re
+
+from typing import Any, Callable, Iterable, Iterator
+
+from pypresseportal.pypresseportal_errors import ApiDataError, ApiError
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that open or close containers or strings
+_STRUCTURE = re.compile(r'[{}\[\]"]')
+# Characters that end a string or start an escape sequence
+_STRING_SPECIAL = re.compile(r'["\\]')
+# Characters that end a number or literal
+_SCALAR_END = re.compile(r"[,}\]\s]")
+
+
+class _Reader:
+    """Buffered text reader over an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes], decode: Callable[[str], Any]):
+        self.chunks = iter(chunks)
+        self.decode = decode
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+
+    def fill(self) -> bool:
+        # Append the next chunk, dropping everything before pos
+        for chunk in self.chunks:
+            text = self.decoder.decode(chunk)
+            if text:
+                self.buffer = self.buffer[self.pos :] + text
+                self.pos = 0
+                return True
+        text = self.decoder.decode(b"", final=True)
+        if text:
+            self.buffer = self.buffer[self.pos :] + text
+            self.pos = 0
+            return True
+        return False
+
+    def peek(self) -> str:
+        # Next character that is not whitespace, "" at the end of the data
+        while True:
+            whitespace = _WHITESPACE.match(self.buffer, self.pos)
+            if whitespace is not None:
+                self.pos = whitespace.end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ApiDataError(f"Invalid json data, expected '{char}'.")
+        self.pos += 1
+
+    def value(self) -> Any:
+        # Decode the json value starting at the next character
+        if self.peek() == "":
+            raise ApiDataError("Incomplete json data.")
+        end = self._value_end()
+        text = self.buffer[self.pos : end]
+        self.pos = end
+        try:
+            return self.decode(text)
+        except ValueError as error:
+            raise ApiDataError(f"Invalid json data ({error}).")
+
+    def _more(self) -> None:
+        if not self.fill():
+            raise ApiDataError("Incomplete json data.")
+
+    # The scanners below keep pos at the start of the value and track their progress
+    # as an offset from pos, since fill() moves the unread data to the buffer start.
+
+    def _value_end(self) -> int:
+        # Index after the end of the value starting at pos, reading chunks as needed
+        first = self.buffer[self.pos]
+        if first == '"':
+            return self._string_end(self.pos + 1)
+        offset = 0
+        if first not in "{[":
+            while True:
+                match = _SCALAR_END.search(self.buffer, self.pos + offset)
+                if match:
+                    return match.start()
+                offset = len(self.buffer) - self.pos
+                if not self.fill():
+                    return len(self.buffer)
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self.buffer, self.pos + offset)
+            if match is None:
+                offset = len(self.buffer) - self.pos
+                self._more()
+            elif match.group() == '"':
+                offset = self._string_end(match.end()) - self.pos
+            else:
+                depth += 1 if match.group() in "{[" else -1
+                if depth == 0:
+                    return match.end()
+                offset = match.end() - self.pos
+
+    def _string_end(self, index: int) -> int:
+        # Index after the closing quote of a string whose content starts at index
+        offset = index - self.pos
+        while True:
+            match = _STRING_SPECIAL.search(self.buffer, self.pos + offset)
+            if match is None:
+                offset = len(self.buffer) - self.pos
+                self._more()
+            elif match.group() == '"':
+                return match.end()
+            elif match.end() >= len(self.buffer):
+                # The escaped character is in the next chunk
+                offset = match.start() - self.pos
+                self._more()
+            else:
+                offset = match.end() + 1 - self.pos
+
+
+def iter_story_items(
+    chunks: Iterable[bytes], decode: Callable[[str], Any] = json.loads
+) -> Iterator[dict]:
+    """Yields the json data of each story of a story query response as it is read.
+
+    Args:
+        chunks (Iterable[bytes]): The response body in chunks of any size.
+        decode (Callable[[str], Any], optional): Function decoding the json text of one value. Defaults to ``json.loads``.
+
+    Raises:
+        ApiError: API returned an error.
+        ApiDataError: The response is not valid json or does not contain ``content``.
+
+    Yields:
+        dict: Json data of a story, as in ``content.story``.
+    """
+    reader = _Reader(chunks, decode)
+    reader.expect("{")
+    has_content = False
+    while reader.peek() != "}":
+        key = reader.value()
+        reader.expect(":")
+        if key == "content" and reader.peek() == "{":
+            has_content = True
+            yield from _iter_content(reader)
+        else:
+            value = reader.value()
+            if key == "error":
+                raise ApiError(value["code"], value["msg"])
+        if reader.peek() == ",":
+            reader.pos += 1
+    reader.pos += 1
+    if not has_content:
+        raise ApiDataError()
+
+
+def _iter_content(reader: _Reader) -> Iterator[dict]:
+    reader.expect("{")
+    while reader.peek() != "}":
+        key = reader.value()
+        reader.expect(":")
+        if key == "story" and reader.peek() == "[":
+            reader.pos += 1
+            while reader.peek() != "]":
+                yield reader.value()
+                if reader.peek() == ",":
+                    reader.pos += 1
+            reader.pos += 1
+        else:
+            reader.value()
+        if reader.peek() == ",":
+            reader.pos += 1
+    reader.pos += 1
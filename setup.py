@@ -42,4 +42,5 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=["requests"],
+    extras_require={"async": ["aiohttp"], "fast": ["orjson"], "zstd": ["zstandard"]},
 )
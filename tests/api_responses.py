@@ -1,3 +1,4 @@
+import json
 import os
 import responses
 
@@ -15,6 +16,14 @@ JSON_RESPONSE = {
         "url": "https://api.presseportal.de/api/article/all?api_key=NO_KEY_NEEDED_DUE_TO_MOCKING_API&format=json&start=0&limit=50&teaser=0",
         "file": "authentification_failed_error.json"
     },
+    "company_info": {
+        "url": "https://api.presseportal.de/api/info/company/100255?api_key=NO_KEY_NEEDED_DUE_TO_MOCKING_API&format=json",
+        "file": "company_info.json"
+    },
+    "office_info": {
+        "url": "https://api.presseportal.de/api/info/office/115876?api_key=NO_KEY_NEEDED_DUE_TO_MOCKING_API&format=json",
+        "file": "office_info.json"
+    },
     # "story_mapping": {
     #     "url": "https://api.presseportal.de/api/article/all?api_key=NO_KEY_NEEDED_DUE_TO_MOCKING_API&format=json&start=0&limit=50&teaser=0",
     #     "file": "get_public_service_news.json"
@@ -43,4 +52,33 @@ class APIReponses(object):
             body=content,
             content_type="application/javascript",
             status=200,
-        )
\ No newline at end of file
+        )
+
+
+def story_template():
+    """Return the json data of the story in get_stories.json."""
+    with open("tests/replies/get_stories.json", "r") as in_file:
+        return json.load(in_file)["content"]["story"][0]
+
+
+def story_items(count, first_id=1000, office_every=0, **fields):
+    """Return stories based on get_stories.json with distinct ids and titles.
+
+    Every ``office_every``-th story is published by an office instead of a company.
+    Each keyword argument is a function returning a field for the index of a story.
+    """
+    template = story_template()
+    items = []
+    for i in range(count):
+        item = dict(template, id=str(first_id + i), title=f"Titel {i} äöü ß")
+        for key, value in fields.items():
+            item[key] = value(i)
+        if office_every and i % office_every == office_every - 1:
+            item["office"] = item.pop("company")
+        items.append(item)
+    return items
+
+
+def ids(stories):
+    """Return the ids of stories."""
+    return [story.id for story in stories]
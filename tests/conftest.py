@@ -0,0 +1,16 @@
+"""Fixtures shared by the tests of PyPresseportal."""
+
+import pytest
+
+
+@pytest.fixture
+def write_stories(tmp_path):
+    """Return a function writing stories to a new file with a writer class."""
+
+    def write(writer_class, file_name, items, **kwargs):
+        file_path = str(tmp_path / file_name)
+        with writer_class(file_path, **kwargs) as writer:
+            writer.write_items(items)
+        return file_path
+
+    return write
@@ -115,6 +115,45 @@ class TestPyPressePortalMethods(unittest.TestCase):
         assert test_object.name == "Feuerwehr Test"
         assert test_object.homepage == "http://www.test.test"
 
+    def test_parse_company_and_office(self):
+        """Test that information responses are mapped to the default models."""
+        with open("tests/replies/company_info.json", "r") as in_file:
+            company = self.api_obj._parse_company(json.load(in_file))
+        with open("tests/replies/office_info.json", "r") as in_file:
+            office = self.api_obj._parse_office(json.load(in_file))
+        assert type(company) is Company
+        assert company.name == "Test GmbH"
+        assert type(office) is Office
+        assert office.name == "Feuerwehr Test"
+
+    @responses.activate
+    def test_get_company_information(self):
+        """Test get_company_information() with an information response."""
+        self.test_response_obj.set_mock_response("company_info")
+        company = self.api_obj.get_company_information("100255")
+
+        assert type(company) is Company
+        assert company.id == "100255"
+        assert company.name == "Test GmbH"
+
+    @responses.activate
+    def test_get_public_service_office_information(self):
+        """Test get_public_service_office_information() with an information response."""
+        self.test_response_obj.set_mock_response("office_info")
+        office = self.api_obj.get_public_service_office_information("115876")
+
+        assert type(office) is Office
+        assert office.id == "115876"
+        assert office.name == "Feuerwehr Test"
+
+    def test_check_json_data(self):
+        """Test that information responses pass and responses without data fail."""
+        with open("tests/replies/company_info.json", "r") as in_file:
+            json_data = json.load(in_file)
+        assert self.api_obj._check_json_data(json_data) is json_data
+        with pytest.raises(ApiDataError):
+            self.api_obj._check_json_data({"success": "1", "request": {}})
+
 
 class TestErrors:
     """Test for PyPresseportal errors."""
@@ -180,3 +219,76 @@ class TestErrors:
                 self.api_obj, search_term=invalid_search_term
             )
         assert error_msg in str(excinfo.value)
+
+
+def story_page(first_id, count):
+    """Build an article/all reply with ``count`` stories, ids counting down."""
+    with open("tests/replies/get_stories.json", "r") as in_file:
+        json_data = json.loads(in_file.read())
+    template = json_data["content"]["story"][0]
+    json_data["content"]["story"] = [
+        dict(template, id=str(first_id - i)) for i in range(count)
+    ]
+    return json.dumps(json_data)
+
+
+def add_story_page(start, limit, first_id, count):
+    """Register a mock reply for one page of get_stories()."""
+    responses.add(
+        responses.GET,
+        "https://api.presseportal.de/api/article/all?api_key=NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+        f"&format=json&start={start}&limit={limit}&teaser=0",
+        body=story_page(first_id, count),
+        content_type="application/javascript",
+        status=200,
+    )
+
+
+class TestIterators:
+    """Tests for the auto-paginating iter_* methods."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup API warpper object."""
+        cls.api_obj = PresseportalApi(API_KEY)
+
+    @responses.activate
+    def test_iter_stories_until_short_page(self):
+        """Test that iteration stops after a short page."""
+        add_story_page(0, 50, 1000, 50)
+        add_story_page(50, 50, 950, 50)
+        add_story_page(100, 50, 900, 20)
+
+        ids = [story.id for story in self.api_obj.iter_stories()]
+
+        assert ids == [str(i) for i in range(1000, 880, -1)]
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_iter_stories_max_stories(self):
+        """Test that the last page is shortened to max_stories."""
+        add_story_page(0, 30, 1000, 30)
+        add_story_page(30, 30, 970, 30)
+        add_story_page(60, 10, 940, 10)
+
+        stories = list(self.api_obj.iter_stories(max_stories=70, page_size=30))
+
+        assert len(stories) == 70
+        assert stories[-1].id == "931"
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_iter_stories_is_lazy(self):
+        """Test that pages are only requested when stories are consumed."""
+        add_story_page(0, 50, 1000, 50)
+
+        iterator = self.api_obj.iter_stories()
+        assert len(responses.calls) == 0
+        assert next(iterator).id == "1000"
+        assert len(responses.calls) == 1
+
+    def test_iter_validation(self):
+        """Test that arguments are validated when the iterator is created."""
+        with pytest.raises(TopicError):
+            self.api_obj.iter_stories_topic(topic="invalid")
+        assert list(self.api_obj.iter_stories(media="radio")) == []
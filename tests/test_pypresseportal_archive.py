@@ -0,0 +1,104 @@
+"""Tests for the local story archive of PyPresseportal."""
+
+from datetime import datetime, timezone
+
+import pytest
+import responses
+
+from api_responses import ids, story_items
+from pypresseportal import PresseportalApi, Story
+from pypresseportal.pypresseportal_archive import StoryArchive
+from pypresseportal.pypresseportal_errors import ApiDataError
+from pypresseportal.pypresseportal_lazy import LazyStory
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = "https://api.presseportal.de/api/article/all"
+
+
+def archive_items():
+    """Six stories published a day apart, every third by an office."""
+    return story_items(
+        6,
+        first_id=100,
+        office_every=3,
+        published=lambda i: f"2020-07-0{i + 1}T12:00:00+0200",
+        keywords=lambda i: {"keyword": ["Umwelt"] if i % 2 else ["Umwelt", "Verkehr"]},
+    )
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Archive of the six stories."""
+    story_archive = StoryArchive(str(tmp_path / "archive.db"))
+    story_archive.add_items(archive_items())
+    yield story_archive
+    story_archive.close()
+
+
+class TestStoryArchive:
+    """Tests for StoryArchive."""
+
+    def test_get(self, archive):
+        """Test point lookups."""
+        story = archive.get("103")
+
+        assert isinstance(story, Story)
+        assert story.published == datetime(2020, 7, 4, 10, tzinfo=timezone.utc)
+        assert isinstance(archive.get("103", LazyStory), LazyStory)
+        assert archive.get("999") is None
+        assert "105" in archive
+        assert len(archive) == 6
+
+    def test_query(self, archive):
+        """Test queries by company, office, keyword and time range."""
+        start = datetime(2020, 7, 2, tzinfo=timezone.utc)
+        end = datetime(2020, 7, 5, tzinfo=timezone.utc)
+
+        assert ids(archive.query()) == ["105", "104", "103", "102", "101", "100"]
+        assert ids(archive.query(start=start, end=end)) == ["103", "102", "101"]
+        assert ids(archive.query(company_id="1234", limit=2)) == ["104", "103"]
+        assert ids(archive.query(office_id="1234")) == ["105", "102"]
+        assert ids(archive.query(keyword="Verkehr", start=start)) == ["104", "102"]
+        assert archive.query(keyword="Sport") == []
+        assert archive.count(start, end) == 3
+        assert archive.count() == 6
+
+    def test_replace(self, archive):
+        """Test that a story added again replaces the archived version."""
+        item = archive_items()[0]
+        item["title"] = "Korrigiert"
+        item["keywords"] = {"keyword": ["Sport"]}
+        archive.add(Story(item))
+
+        assert len(archive) == 6
+        assert archive.get("100").title == "Korrigiert"
+        assert ids(archive.query(keyword="Sport")) == ["100"]
+        assert "100" not in ids(archive.query(keyword="Umwelt"))
+
+    def test_invalid_items(self, archive):
+        """Test that invalid stories are rejected without storing any."""
+        items = archive_items()
+        items[0]["id"] = "200"
+        del items[1]["published"]
+        with pytest.raises(ApiDataError):
+            archive.add_items(items)
+
+        assert "200" not in archive
+        assert archive.add_items([]) == 0
+
+    @responses.activate
+    def test_write_through(self, tmp_path):
+        """Test that stories returned by the API are archived."""
+        with open("tests/replies/get_stories.json", "r") as in_file:
+            content = in_file.read()
+        responses.add(responses.GET, STORIES_URL, body=content)
+        archive = StoryArchive(str(tmp_path / "archive.db"))
+
+        with PresseportalApi(API_KEY, archive=archive) as api_obj:
+            stories = api_obj.get_stories()
+
+        assert ids(archive.query()) == ids(stories)
+        # Archives survive reopening
+        archive.close()
+        assert "1234567" in StoryArchive(str(tmp_path / "archive.db"))
@@ -0,0 +1,203 @@
+"""Tests for the asyncio client of PyPresseportal."""
+
+import asyncio
+import re
+import threading
+
+import pytest
+
+from api_responses import APIReponses
+from pypresseportal import AsyncPresseportalApi
+from pypresseportal.pypresseportal_archive import StoryArchive
+from pypresseportal.pypresseportal_cache import SqliteCache
+from pypresseportal.pypresseportal_errors import (
+    ApiConnectionFail,
+    ApiDataError,
+    ApiError,
+    TopicError,
+)
+from pypresseportal.pypresseportal_ratelimit import RetryPolicy
+
+aioresponses = pytest.importorskip("aioresponses").aioresponses
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = re.compile(r"^https://api\.presseportal\.de/api/article/all\?.*$")
+REGION_URL = r"https://api\.presseportal\.de/api/article/publicservice/region"
+
+
+class RecordingCache(SqliteCache):
+    """SqliteCache that records the threads reading and writing it."""
+
+    def __init__(self, path):
+        """Constructor method."""
+        super().__init__(path)
+        self.threads = set()
+
+    def _load(self, key):
+        """Record the thread, then load the entry."""
+        self.threads.add(threading.get_ident())
+        return super()._load(key)
+
+    def _store(self, key, expires, json_data):
+        """Record the thread, then store the entry."""
+        self.threads.add(threading.get_ident())
+        super()._store(key, expires, json_data)
+
+
+def run(coroutine):
+    """Run a coroutine on a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncPresseportalApi:
+    """Tests for AsyncPresseportalApi."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup mock responses."""
+        cls.test_response_obj = APIReponses()
+
+    def mock_stories(self, mocked, key, repeat=False):
+        """Register a mock reply for the article/all endpoint."""
+        _, content = self.test_response_obj.load_response(key)
+        mocked.get(STORIES_URL, body=content, status=200, repeat=repeat)
+
+    def assertions_for_story(self, stories):
+        """Check the story from get_stories.json."""
+        assert len(stories) == 1
+        assert stories[0].id == "1234567"
+        assert stories[0].keywords == ["Umwelt", "Klimaschutz"]
+
+    def test_get_stories(self):
+        """Test get_stories()."""
+
+        async def query():
+            async with AsyncPresseportalApi(API_KEY) as api_obj:
+                return await api_obj.get_stories()
+
+        with aioresponses() as mocked:
+            self.mock_stories(mocked, "get_stories")
+            stories = run(query())
+
+        self.assertions_for_story(stories)
+
+    def test_archive(self, tmp_path):
+        """Test that stories returned by a query are archived."""
+        archive = StoryArchive(str(tmp_path / "archive.db"))
+
+        async def query():
+            async with AsyncPresseportalApi(API_KEY, archive=archive) as api_obj:
+                return await api_obj.get_stories()
+
+        with aioresponses() as mocked:
+            self.mock_stories(mocked, "get_stories")
+            stories = run(query())
+
+        assert [story.id for story in archive.query()] == [stories[0].id]
+
+    def test_sqlite_cache(self, tmp_path):
+        """Test that a cache reading files is not called on the event loop thread."""
+        cache = RecordingCache(str(tmp_path / "cache.db"))
+
+        async def query():
+            async with AsyncPresseportalApi(API_KEY, cache=cache) as api_obj:
+                return [await api_obj.get_stories() for _ in range(2)]
+
+        with aioresponses() as mocked:
+            self.mock_stories(mocked, "get_stories")
+            first, second = run(query())
+
+        assert [story.id for story in second] == [story.id for story in first]
+        assert cache.hits == 1
+        assert cache.threads and threading.get_ident() not in cache.threads
+
+    def test_concurrent_queries(self):
+        """Test several queries in flight at the same time."""
+
+        async def query():
+            async with AsyncPresseportalApi(API_KEY) as api_obj:
+                return await asyncio.gather(
+                    *(api_obj.get_stories() for _ in range(5))
+                )
+
+        with aioresponses() as mocked:
+            self.mock_stories(mocked, "get_stories", repeat=True)
+            results = run(query())
+
+        assert len(results) == 5
+        for stories in results:
+            self.assertions_for_story(stories)
+
+    def test_errors(self):
+        """Test that API errors and invalid data raise the usual errors."""
+
+        async def query():
+            async with AsyncPresseportalApi(API_KEY) as api_obj:
+                return await api_obj.get_stories()
+
+        with aioresponses() as mocked:
+            self.mock_stories(mocked, "authentification_failed_error")
+            with pytest.raises(ApiError):
+                run(query())
+
+        with aioresponses() as mocked:
+            self.mock_stories(mocked, "empty_json")
+            with pytest.raises(ApiDataError):
+                run(query())
+
+        with aioresponses():
+            # Unregistered URLs raise a connection error
+            with pytest.raises(ApiConnectionFail):
+                run(query())
+
+    def test_retry(self):
+        """Test that an overloaded API is retried."""
+
+        async def query():
+            retry = RetryPolicy(backoff_factor=0)
+            async with AsyncPresseportalApi(API_KEY, retry=retry) as api_obj:
+                return await api_obj.get_stories()
+
+        with aioresponses() as mocked:
+            mocked.get(STORIES_URL, status=503)
+            self.mock_stories(mocked, "get_stories")
+            stories = run(query())
+
+        self.assertions_for_story(stories)
+
+    def test_validation(self):
+        """Test that arguments are validated like in PresseportalApi."""
+        api_obj = AsyncPresseportalApi(API_KEY)
+        with pytest.raises(TopicError):
+            run(api_obj.get_stories_topic(topic="invalid"))
+        assert run(api_obj.get_stories(media="radio")) == []
+
+    def test_public_service_regions(self):
+        """Test that regions are queried concurrently and merged."""
+
+        async def query():
+            async with AsyncPresseportalApi(API_KEY) as api_obj:
+                return await api_obj.get_public_service_regions(["hh", "sh"])
+
+        _, content = self.test_response_obj.load_response("get_stories")
+        with aioresponses() as mocked:
+            for region in ("hh", "sh"):
+                mocked.get(
+                    re.compile(f"^{REGION_URL}/{region}\\?.*$"),
+                    body=content,
+                    status=200,
+                )
+            tagged = run(query())
+
+        assert len(tagged) == 1
+        assert tagged[0].story.id == "1234567"
+        assert tagged[0].origins == ("hh", "sh")
+
+        with aioresponses():
+            with pytest.raises(ApiConnectionFail):
+                run(query())
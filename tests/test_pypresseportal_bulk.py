@@ -0,0 +1,186 @@
+"""Tests for concurrent bulk queries of PyPresseportal."""
+
+import json
+import re
+import threading
+import time
+
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from pypresseportal import FetchJob, PresseportalApi
+from pypresseportal.pypresseportal_errors import (
+    ApiConnectionFail,
+    ApiError,
+    RegionError,
+    TopicError,
+)
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+TOPIC_URL = re.compile(r"https://api\.presseportal\.de/api/article/topic/[\w-]+.*")
+
+
+class TopicFeed:
+    """Mock reply callback for topic queries, which tracks concurrent requests."""
+
+    def __init__(self, delay=0.0):
+        """Constructor method."""
+        with open("tests/replies/get_stories.json", "r") as in_file:
+            self.template = json.loads(in_file.read())
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, request):
+        """Reply with one page of stories, ids encode topic and position."""
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        url = urlparse(request.url)
+        topic = url.path.rsplit("/", 1)[-1]
+        query = parse_qs(url.query)
+        start, limit = int(query["start"][0]), int(query["limit"][0])
+        json_data = dict(self.template)
+        story = self.template["content"]["story"][0]
+        json_data["content"] = {
+            "story": [
+                dict(story, id=f"{topic}-{position}")
+                for position in range(start, start + limit)
+            ]
+        }
+        with self.lock:
+            self.in_flight -= 1
+        return 200, {}, json.dumps(json_data)
+
+
+def add_topic_feed(feed):
+    """Register the callback for all topic URLs."""
+    responses.add_callback(
+        responses.GET, TOPIC_URL, callback=feed, content_type="application/javascript"
+    )
+
+
+class TestFetchMany:
+    """Tests for PresseportalApi.fetch_many()."""
+
+    @responses.activate
+    def test_results_in_job_and_page_order(self):
+        """Test that results keep the order of jobs and pages."""
+        add_topic_feed(TopicFeed())
+        jobs = [
+            FetchJob(
+                "get_stories_topic", {"topic": "auto-verkehr"}, range(3), page_size=2
+            ),
+            FetchJob("get_stories_topic", {"topic": "sport"}, range(1, 3), 2),
+        ]
+        with PresseportalApi(API_KEY) as api_obj:
+            results = api_obj.fetch_many(jobs, max_workers=4)
+
+        assert [result.job for result in results] == jobs
+        assert [story.id for story in results[0].stories] == [
+            f"auto-verkehr-{i}" for i in range(6)
+        ]
+        assert [story.id for story in results[1].stories] == [
+            f"sport-{i}" for i in range(2, 6)
+        ]
+        assert all(result.ok for result in results)
+
+    @responses.activate
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_workers requests run at the same time."""
+        feed = TopicFeed(delay=0.02)
+        add_topic_feed(feed)
+        jobs = [FetchJob("get_stories_topic", {"topic": "auto-verkehr"}, range(12))]
+        with PresseportalApi(API_KEY) as api_obj:
+            results = api_obj.fetch_many(jobs, max_workers=3)
+
+        assert len(results[0].stories) == 12 * 50
+        assert 1 < feed.max_in_flight <= 3
+
+    @responses.activate
+    def test_errors_per_job(self):
+        """Test that failing jobs do not abort the batch."""
+        add_topic_feed(TopicFeed())
+        responses.add(
+            responses.GET,
+            "https://api.presseportal.de/api/article/all",
+            body='{"error": {"code": "101", "msg": "authentification failed"}}',
+            content_type="application/javascript",
+        )
+        jobs = [
+            FetchJob("get_stories"),
+            FetchJob("get_stories_topic", {"topic": "invalid"}),
+            FetchJob("get_entity_search_results", {"search_term": "test"}),
+            FetchJob("get_stories_topic", {"topic": "auto-verkehr"}),
+        ]
+        with PresseportalApi(API_KEY) as api_obj:
+            results = api_obj.fetch_many(jobs)
+
+        assert isinstance(results[0].error, ApiError)
+        assert isinstance(results[1].error, TopicError)
+        assert isinstance(results[2].error, ValueError)
+        assert results[3].ok
+        assert len(results[3].stories) == 50
+
+
+REGION_URL = re.compile(
+    r"https://api\.presseportal\.de/api/article/publicservice/region/\w+.*"
+)
+
+
+def region_reply(request):
+    """Reply with two stories per region and one story shared by hh and sh."""
+    with open("tests/replies/get_stories.json", "r") as in_file:
+        json_data = json.loads(in_file.read())
+    region = urlparse(request.url).path.rsplit("/", 1)[-1]
+    story = json_data["content"]["story"][0]
+    minute = {"hh": 10, "sh": 20, "he": 30}[region]
+    stories = [
+        dict(story, id=f"{region}-{i}", published=f"2020-07-02T04:{minute + i}:00+0200")
+        for i in range(2)
+    ]
+    if region in ("hh", "sh"):
+        stories.append(dict(story, id="shared", published="2020-07-02T04:15:00+0200"))
+    json_data["content"] = {"story": stories}
+    return 200, {}, json.dumps(json_data)
+
+
+class TestPublicServiceRegions:
+    """Tests for PresseportalApi.get_public_service_regions()."""
+
+    @responses.activate
+    def test_merged(self):
+        """Test that stories are merged, ordered and tagged with their regions."""
+        responses.add_callback(responses.GET, REGION_URL, callback=region_reply)
+        with PresseportalApi(API_KEY) as api_obj:
+            tagged = api_obj.get_public_service_regions(["hh", "sh", "he", "hh"])
+
+        assert [t.story.id for t in tagged] == [
+            "he-1",
+            "he-0",
+            "sh-1",
+            "sh-0",
+            "shared",
+            "hh-1",
+            "hh-0",
+        ]
+        assert [t.origin for t in tagged] == ["he", "he", "sh", "sh", "hh", "hh", "hh"]
+        assert tagged[4].origins == ("hh", "sh")
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_errors(self):
+        """Test that invalid regions are rejected before any request is sent."""
+        responses.add_callback(responses.GET, REGION_URL, callback=region_reply)
+        with PresseportalApi(API_KEY) as api_obj:
+            with pytest.raises(RegionError):
+                api_obj.get_public_service_regions(["hh", "invalid"])
+            assert len(responses.calls) == 0
+            assert api_obj.get_public_service_regions(["hh"], media="video") == []
+            with pytest.raises(ApiConnectionFail):
+                api_obj.get_public_service_offices(["1234", 5678])
@@ -0,0 +1,203 @@
+"""Tests for response caching in PyPresseportal."""
+
+import multiprocessing
+import time
+
+import pytest
+import requests
+import responses
+
+from api_responses import APIReponses
+from pypresseportal import PresseportalApi
+from pypresseportal.pypresseportal_cache import ResponseCache, SqliteCache
+from pypresseportal.pypresseportal_errors import ApiConnectionFail
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = "https://api.presseportal.de/api/article/all"
+COMPANY_URL = "https://api.presseportal.de/api/info/company/100255"
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_key_excludes_api_key(self):
+        """Test that cache keys do not depend on the API key or parameter order."""
+        params_a = {"api_key": "a", "limit": "5", "start": "0"}
+        params_b = {"start": "0", "limit": "5", "api_key": "b"}
+        key_a = ResponseCache.key(STORIES_URL, params_a)
+        key_b = ResponseCache.key(STORIES_URL, params_b)
+        assert key_a == key_b
+        assert "api_key" not in key_a
+
+    def test_ttl_per_endpoint(self):
+        """Test that feeds and info queries have different times to live."""
+        cache = ResponseCache(ttls={"article": 5})
+        assert cache.ttl(STORIES_URL) == 5
+        assert cache.ttl(COMPANY_URL) == 86400
+        assert cache.ttl("https://api.presseportal.de/api/unknown") == 60
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is removed first."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", STORIES_URL, {"content": "a"})
+        cache.set("b", STORIES_URL, {"content": "b"})
+        assert cache.get("a") == {"content": "a"}
+        cache.set("c", STORIES_URL, {"content": "c"})
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_expired_entries_are_stale(self):
+        """Test that expired entries are only returned as stale entries."""
+        cache = ResponseCache(ttls={"article": 0.01})
+        cache.set("a", STORIES_URL, {"content": "a"})
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert cache.get_stale("a") == {"content": "a"}
+        assert cache.stale_hits == 1
+
+        cache.stale_if_error = False
+        assert cache.get_stale("a") is None
+
+
+class TestApiCache:
+    """Tests for PresseportalApi with a cache."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup mock responses."""
+        cls.test_response_obj = APIReponses()
+
+    @responses.activate
+    def test_cached_queries(self):
+        """Test that a cached query does not hit the network again."""
+        self.test_response_obj.set_mock_response("get_stories")
+        cache = ResponseCache()
+        with PresseportalApi(API_KEY, cache=cache) as api_obj:
+            first = api_obj.get_stories()
+            second = api_obj.get_stories()
+
+        assert len(responses.calls) == 1
+        assert [story.id for story in first] == [story.id for story in second]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @responses.activate
+    def test_stale_if_error(self):
+        """Test that the last good response is served if the API is unreachable."""
+        self.test_response_obj.set_mock_response("get_stories")
+        responses.add(
+            responses.GET,
+            STORIES_URL,
+            body=requests.exceptions.ConnectionError("unreachable"),
+        )
+        cache = ResponseCache(ttls={"article": 0.01})
+        with PresseportalApi(API_KEY, cache=cache) as api_obj:
+            api_obj.get_stories()
+            time.sleep(0.02)
+            stories = api_obj.get_stories()
+
+        assert len(responses.calls) == 2
+        assert stories[0].id == "1234567"
+        assert cache.stale_hits == 1
+
+    @responses.activate
+    def test_no_stale_entry(self):
+        """Test that connection errors are raised without a cached response."""
+        responses.add(
+            responses.GET,
+            STORIES_URL,
+            body=requests.exceptions.ConnectionError("unreachable"),
+        )
+        with PresseportalApi(API_KEY, cache=ResponseCache()) as api_obj:
+            with pytest.raises(ApiConnectionFail):
+                api_obj.get_stories()
+
+
+def store_entries(path, prefix, count):
+    """Store entries from another process."""
+    cache = SqliteCache(path)
+    for i in range(count):
+        cache.set(f"{prefix}-{i}", STORIES_URL, {"content": {"story": [i]}})
+    cache.close()
+
+
+class TestSqliteCache:
+    """Tests for SqliteCache."""
+
+    def test_entries_survive_reopening(self, tmp_path):
+        """Test that a new cache object sees entries stored by an earlier one."""
+        path = str(tmp_path / "cache.db")
+        cache = SqliteCache(path)
+        cache.set("a", COMPANY_URL, {"company": {"id": "100255"}})
+        cache.close()
+
+        reopened = SqliteCache(path)
+        assert reopened.get("a") == {"company": {"id": "100255"}}
+        assert len(reopened) == 1
+
+    def test_expiry_and_stale(self, tmp_path):
+        """Test per-endpoint expiry and stale entries."""
+        cache = SqliteCache(str(tmp_path / "cache.db"), ttls={"article": 0.01})
+        cache.set("feed", STORIES_URL, {"content": "feed"})
+        cache.set("info", COMPANY_URL, {"company": "info"})
+        time.sleep(0.02)
+
+        assert cache.get("feed") is None
+        assert cache.get("info") == {"company": "info"}
+        assert cache.get_stale("feed") == {"content": "feed"}
+        assert cache.purge_expired() == 1
+        assert cache.get_stale("feed") is None
+
+    def test_size_limits(self, tmp_path):
+        """Test that the entries expiring first are removed when the cache is full."""
+        cache = SqliteCache(str(tmp_path / "cache.db"), max_entries=3)
+        cache.set("info", COMPANY_URL, {"company": "info"})
+        for i in range(4):
+            cache.set(f"feed-{i}", STORIES_URL, {"content": i})
+        assert len(cache) == 3
+        assert cache.get("info") is not None
+        assert cache.get("feed-0") is None
+
+        cache = SqliteCache(str(tmp_path / "bytes.db"), max_bytes=100)
+        for i in range(10):
+            cache.set(f"feed-{i}", STORIES_URL, {"content": "x" * 20})
+        assert 0 < len(cache) <= 3
+        assert cache.get("feed-9") is not None
+
+    def test_concurrent_processes(self, tmp_path):
+        """Test several processes writing to the same cache file."""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("fork start method not available")
+        path = str(tmp_path / "cache.db")
+        SqliteCache(path).close()
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=store_entries, args=(path, f"p{n}", 25))
+            for n in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in processes)
+        cache = SqliteCache(path)
+        assert len(cache) == 100
+        assert cache.get("p3-24") == {"content": {"story": [24]}}
+
+    @responses.activate
+    def test_api_with_sqlite_cache(self, tmp_path):
+        """Test that a response cached by one API object serves another one."""
+        APIReponses().set_mock_response("get_stories")
+        path = str(tmp_path / "cache.db")
+        with PresseportalApi(API_KEY, cache=SqliteCache(path)) as api_obj:
+            api_obj.get_stories()
+        with PresseportalApi(API_KEY, cache=SqliteCache(path)) as api_obj:
+            stories = api_obj.get_stories()
+
+        assert len(responses.calls) == 1
+        assert stories[0].id == "1234567"
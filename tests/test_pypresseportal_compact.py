@@ -0,0 +1,113 @@
+"""Tests for the compact models of PyPresseportal."""
+
+import json
+
+import pytest
+import responses
+
+from api_responses import APIReponses
+from pypresseportal import PresseportalApi, Story
+from pypresseportal.pypresseportal_compact import (
+    CompactCompany,
+    CompactEntity,
+    CompactOffice,
+    CompactStory,
+)
+from pypresseportal.pypresseportal_errors import ApiDataError
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORY_ATTRIBUTES = (
+    "id",
+    "url",
+    "title",
+    "body",
+    "published",
+    "highlight",
+    "short",
+    "language",
+    "ressort",
+    "company_id",
+    "company_url",
+    "company_name",
+    "image",
+)
+
+
+def load_reply(file_name):
+    """Return the json data of a reply in tests/replies."""
+    with open(f"tests/replies/{file_name}", "r") as in_file:
+        return json.load(in_file)
+
+
+class TestCompactModels:
+    """Tests for the compact model classes."""
+
+    @classmethod
+    def setup_class(cls):
+        """Load story data."""
+        cls.item = load_reply("get_stories.json")["content"]["story"][0]
+
+    def test_story_matches_story(self):
+        """Test that CompactStory has the same attributes as Story."""
+        story = Story(self.item)
+        compact = CompactStory(self.item)
+
+        for attribute in STORY_ATTRIBUTES:
+            assert getattr(compact, attribute) == getattr(story, attribute)
+        assert compact.keywords == tuple(story.keywords)
+        assert compact.data is self.item
+        assert compact.image is self.item["media"]["image"]
+        assert not hasattr(compact, "__dict__")
+        for attribute in ("teaser", "office_id", "video"):
+            assert not hasattr(compact, attribute)
+
+    def test_drop_data(self):
+        """Test that the raw data can be dropped."""
+        compact = CompactStory(self.item, keep_data=False)
+
+        assert not hasattr(compact, "data")
+        assert compact.image[0]["id"] == "123456"
+
+    def test_missing_keys(self):
+        """Test that missing keys raise ApiDataError as for Story."""
+        item = dict(self.item)
+        del item["short"]
+        with pytest.raises(ApiDataError):
+            CompactStory(item)
+
+        item = dict(self.item)
+        del item["body"]
+        with pytest.raises(ApiDataError):
+            CompactStory(item)
+
+    def test_information_models(self):
+        """Test CompactCompany, CompactOffice and CompactEntity."""
+        company = CompactCompany(load_reply("company_info.json")["company"])
+        office = CompactOffice(load_reply("office_info.json")["office"], False)
+        entity = CompactEntity(load_reply("entity_search.json")["content"]["result"][0])
+
+        assert company.name == "Test GmbH"
+        assert company.homepage == "http://www.test.test"
+        assert office.shortname == "FW-Test"
+        assert not hasattr(office, "data")
+        assert not hasattr(office, "isin")
+        assert entity.type == "company"
+
+
+class TestCompactApi:
+    """Tests for PresseportalApi with compact models."""
+
+    @responses.activate
+    def test_get_stories(self):
+        """Test that get_stories() returns compact stories."""
+        APIReponses().set_mock_response("get_stories")
+
+        with PresseportalApi(
+            API_KEY, compact_models=True, keep_raw_data=False
+        ) as api_obj:
+            stories = api_obj.get_stories()
+
+        assert isinstance(stories[0], CompactStory)
+        assert stories[0].id == "1234567"
+        assert not hasattr(stories[0], "data")
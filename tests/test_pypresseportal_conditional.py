@@ -0,0 +1,94 @@
+"""Tests for conditional requests in PyPresseportal."""
+
+import responses
+
+from api_responses import APIReponses
+from pypresseportal import PresseportalApi
+from pypresseportal.pypresseportal_conditional import ConditionalStore
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = "https://api.presseportal.de/api/article/all"
+LAST_MODIFIED = "Thu, 02 Jul 2020 04:30:00 GMT"
+
+
+class TestConditionalRequests:
+    """Tests for PresseportalApi with conditional requests."""
+
+    @classmethod
+    def setup_class(cls):
+        """Load reply content."""
+        _, cls.content = APIReponses().load_response("get_stories")
+
+    @responses.activate
+    def test_not_modified(self):
+        """Test that validators are sent and a 304 reply reuses the stories."""
+        responses.add(
+            responses.GET,
+            STORIES_URL,
+            body=self.content,
+            headers={"ETag": '"v1"', "Last-Modified": LAST_MODIFIED},
+        )
+        responses.add(responses.GET, STORIES_URL, status=304)
+
+        with PresseportalApi(API_KEY, conditional_requests=True) as api_obj:
+            first = api_obj.get_stories()
+            second = api_obj.get_stories()
+
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert responses.calls[1].request.headers["If-Modified-Since"] == LAST_MODIFIED
+        assert second == first
+        assert second is not first
+        assert second[0] is first[0]
+        assert api_obj.conditional.not_modified == 1
+
+    @responses.activate
+    def test_unchanged_payload(self):
+        """Test that an identical payload is not decoded and parsed again."""
+        responses.add(responses.GET, STORIES_URL, body=self.content)
+        responses.add(responses.GET, STORIES_URL, body=self.content)
+        changed_content = self.content.replace("1234567", "7654321")
+        responses.add(responses.GET, STORIES_URL, body=changed_content)
+
+        with PresseportalApi(API_KEY, conditional_requests=True) as api_obj:
+            first = api_obj.get_stories()
+            second = api_obj.get_stories()
+            third = api_obj.get_stories()
+
+        assert second[0] is first[0]
+        assert api_obj.conditional.unchanged == 1
+        assert third[0].id == "7654321"
+
+    @responses.activate
+    def test_disabled_by_default(self):
+        """Test that no validators are sent without conditional_requests."""
+        responses.add(
+            responses.GET, STORIES_URL, body=self.content, headers={"ETag": '"v1"'}
+        )
+        responses.add(responses.GET, STORIES_URL, body=self.content)
+
+        with PresseportalApi(API_KEY) as api_obj:
+            first = api_obj.get_stories()
+            second = api_obj.get_stories()
+
+        assert "If-None-Match" not in responses.calls[1].request.headers
+        assert second[0] is not first[0]
+
+
+class TestConditionalStore:
+    """Tests for ConditionalStore."""
+
+    def test_bounded(self):
+        """Test that the least recently used query is forgotten."""
+        store = ConditionalStore(max_entries=2)
+        data = [{"content": i} for i in range(3)]
+        for i, json_data in enumerate(data):
+            store.update(str(i), None, {"ETag": str(i)}, b"digest", json_data)
+            store.set_parsed(json_data, [i])
+
+        assert len(store) == 2
+        assert store.get("0") is None
+        assert store.parsed(data[0]) is None
+        assert store.parsed(data[2]) == [2]
+        assert store.get("2").request_headers({})["If-None-Match"] == "2"
@@ -0,0 +1,97 @@
+"""Tests for parsing publication dates in PyPresseportal."""
+
+import json
+import random
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pypresseportal.pypresseportal_compact import CompactStory
+from pypresseportal.pypresseportal_dates import (
+    PUBLISHED_FORMAT,
+    epoch_to_datetime,
+    parse_published,
+    parse_published_batch,
+    published_epoch,
+    published_epoch_offset,
+    published_epochs,
+)
+
+
+OFFSETS = (0, 3600, 7200, -5 * 3600, 5 * 3600 + 1800, -(9 * 3600 + 1800))
+
+
+def random_dates(count):
+    """Return dates in the API format with various UTC offsets."""
+    rng = random.Random(42)
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    values = []
+    for _ in range(count):
+        date = epoch + timedelta(seconds=rng.randrange(-(10 ** 9), 3 * 10 ** 9))
+        offset = timezone(timedelta(seconds=rng.choice(OFFSETS)))
+        values.append(date.astimezone(offset).strftime(PUBLISHED_FORMAT))
+    return values
+
+
+class TestDates:
+    """Tests for the date functions."""
+
+    def test_matches_strptime(self):
+        """Test that the fast path returns exactly what strptime returns."""
+        values = random_dates(2000) + ["2020-02-29T23:59:59-0000"]
+        for value, parsed in zip(values, parse_published_batch(values)):
+            expected = datetime.strptime(value, PUBLISHED_FORMAT)
+            assert parsed == expected
+            assert parsed.utcoffset() == expected.utcoffset()
+            assert (parsed.tzinfo is timezone.utc) == (expected.tzinfo is timezone.utc)
+
+    def test_shared_tzinfo(self):
+        """Test that one tzinfo object is used per offset."""
+        first = parse_published("2020-07-02T04:30:00+0200")
+        second = parse_published("2020-07-03T05:00:00+0200")
+
+        assert first.tzinfo is second.tzinfo
+        assert parse_published("2020-07-02T04:30:00+0000").tzinfo is timezone.utc
+
+    def test_other_formats(self):
+        """Test that other formats are parsed or rejected like strptime."""
+        assert parse_published("2020-07-02T04:30:00+02:00") == datetime(
+            2020, 7, 2, 4, 30, tzinfo=timezone(timedelta(hours=2))
+        )
+        assert parse_published("2020-07-02T04:30:00Z").tzinfo is timezone.utc
+        for value in (
+            "2020-13-02T04:30:00+0200",
+            "2020-02-30T04:30:00+0200",
+            "2020-07-02T04:30:00+0260",
+            "2020-07-02 04:30:00",
+        ):
+            with pytest.raises(ValueError):
+                parse_published(value)
+            with pytest.raises(ValueError):
+                published_epoch(value)
+
+    def test_epochs(self):
+        """Test conversion to and from seconds since the epoch."""
+        values = random_dates(2000)
+        epochs = published_epochs(values)
+
+        assert epochs.typecode == "q"
+        for value, epoch in zip(values, epochs):
+            expected = datetime.strptime(value, PUBLISHED_FORMAT)
+            assert epoch == int(expected.timestamp())
+            restored = epoch_to_datetime(*published_epoch_offset(value))
+            assert restored == expected
+            assert restored.utcoffset() == expected.utcoffset()
+
+    def test_compact_story_epoch(self):
+        """Test CompactStory storing the publication date as an integer."""
+        with open("tests/replies/get_stories.json", "r") as in_file:
+            item = json.load(in_file)["content"]["story"][0]
+
+        story = CompactStory(item, epoch_published=True)
+
+        assert story.published_epoch == 1593657000
+        assert story.published_offset == 7200
+        assert story.published == CompactStory(item).published
+        assert story.published.utcoffset() == timedelta(hours=2)
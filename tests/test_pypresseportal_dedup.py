@@ -0,0 +1,90 @@
+"""Tests for the bounded deduplication filters of PyPresseportal."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pypresseportal.pypresseportal_dedup import BloomFilter, SeenStories
+
+
+def false_positive_rate(container, count=20000):
+    """Share of never added keys that are reported as added."""
+    return sum(f"unseen-{i}" in container for i in range(count)) / count
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter."""
+
+    def test_add(self):
+        """Test that added keys are always found."""
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+
+        assert bloom_filter.add("4635945")
+        assert not bloom_filter.add("4635945")
+        for i in range(999):
+            bloom_filter.add(str(i))
+
+        assert all(str(i) in bloom_filter for i in range(999))
+        assert 990 <= len(bloom_filter) <= 1000
+        assert false_positive_rate(bloom_filter) < 0.02
+
+    def test_invalid_arguments(self):
+        """Test that invalid sizes are rejected."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(error_rate=1.5)
+
+
+class TestSeenStories:
+    """Tests for SeenStories."""
+
+    def test_filter(self):
+        """Test that stories are only let through once."""
+        stories = [SimpleNamespace(id=story_id) for story_id in "1213241"]
+        seen = SeenStories()
+
+        assert [story.id for story in seen.filter(stories)] == ["1", "2", "3", "4"]
+        assert "3" in seen
+        assert len(seen) == 4
+
+    def test_fixed_memory(self):
+        """Test that memory stays fixed and recent ids are remembered."""
+        seen = SeenStories(capacity=1000, error_rate=0.01)
+        nbytes = seen.nbytes
+        for i in range(10000):
+            seen.add(str(i))
+
+        assert len(seen.filters) == 2
+        assert sum(len(f.bits) for f in seen.filters) == nbytes
+        assert all(str(i) in seen for i in range(9000, 10000))
+        assert "0" not in seen
+        assert false_positive_rate(seen) < 0.015
+
+    def test_save_load(self, tmp_path):
+        """Test that a saved filter is restored with all ids."""
+        path = str(tmp_path / "seen.bin")
+        seen = SeenStories(capacity=100, error_rate=0.01)
+        for i in range(150):
+            seen.add(str(i))
+        seen.save(path)
+
+        restored = SeenStories.load(path)
+
+        assert restored.capacity == 100
+        assert len(restored.filters) == 2
+        assert len(restored) == len(seen)
+        assert all(str(i) in restored for i in range(150))
+        assert not restored.add("149")
+
+    def test_load_invalid(self, tmp_path):
+        """Test that other and truncated files are rejected."""
+        path = tmp_path / "seen.bin"
+        path.write_bytes(b"not a filter")
+        with pytest.raises(ValueError):
+            SeenStories.load(str(path))
+
+        SeenStories().save(str(path))
+        path.write_bytes(path.read_bytes()[:-10])
+        with pytest.raises(ValueError):
+            SeenStories.load(str(path))
@@ -0,0 +1,118 @@
+"""Tests for the local full-text index of PyPresseportal."""
+
+import json
+
+import pytest
+
+from pypresseportal import Story
+from pypresseportal.pypresseportal_index import StoryIndex, fold, tokenize
+
+
+def make_story(story_id, title, text, keywords=(), teaser=False):
+    """Story based on get_stories.json with the given texts."""
+    with open("tests/replies/get_stories.json", "r") as in_file:
+        data = json.load(in_file)["content"]["story"][0]
+    data = dict(data, id=story_id, title=title, keywords={"keyword": list(keywords)})
+    del data["body"]
+    data["teaser" if teaser else "body"] = text
+    return Story(data)
+
+
+@pytest.fixture
+def index():
+    """Index of three stories."""
+    story_index = StoryIndex(keep_stories=True)
+    story_index.add_many(
+        [
+            make_story(
+                "1",
+                "Erneuerbare Energien im Aufwind",
+                "Die erneuerbare Energie wächst. Kohle verliert Marktanteile.",
+                ["Umwelt", "Klimaschutz"],
+            ),
+            make_story(
+                "2",
+                "Kohleausstieg beschlossen",
+                "Erneuerbare Energien ersetzen Kohle und Gas.",
+                ["Energie", "Umwelt"],
+            ),
+            make_story(
+                "3",
+                "Polizei sucht Zeugen",
+                "Unfall auf der Kreisstraße bei Müllheim",
+                teaser=True,
+            ),
+        ]
+    )
+    return story_index
+
+
+def ids(hits):
+    """Ids of the search hits."""
+    return [hit.id for hit in hits]
+
+
+class TestNormalization:
+    """Tests for German-aware normalization."""
+
+    def test_fold(self):
+        """Test lowercasing and folding of umlauts and accents."""
+        assert fold("Müller MUELLER Straße") == "mueller mueller strasse"
+        assert fold("Café NAÏVE") == "cafe naive"
+        assert fold("Müller") == "mueller"
+        assert tokenize("E-Mail, 24/7!") == ["e", "mail", "24", "7"]
+
+
+class TestStoryIndex:
+    """Tests for StoryIndex."""
+
+    def test_words(self, index):
+        """Test word queries across fields with folding."""
+        assert ids(index.search("KREISSTRASSE")) == ["3"]
+        assert ids(index.search("muellheim")) == ["3"]
+        assert set(ids(index.search("umwelt"))) == {"1", "2"}
+        assert index.search("unbekannt") == []
+        assert index.search("") == []
+
+    def test_boolean(self, index):
+        """Test AND, OR and NOT."""
+        assert ids(index.search("kohle gas")) == ["2"]
+        assert ids(index.search("kohle AND marktanteile")) == ["1"]
+        assert set(ids(index.search("gas OR polizei"))) == {"2", "3"}
+        assert ids(index.search("umwelt -gas")) == ["1"]
+        assert ids(index.search("NOT kohle")) == ["3"]
+        assert ids(index.search("(gas OR zeugen) NOT polizei")) == ["2"]
+
+    def test_phrases_and_fields(self, index):
+        """Test phrase and field queries."""
+        assert ids(index.search('"erneuerbare energien"')) == ["1", "2"]
+        assert ids(index.search('text:"erneuerbare energien"')) == ["2"]
+        assert ids(index.search('"energien erneuerbare"')) == []
+        assert ids(index.search("title:kohle")) == []
+        assert ids(index.search("keyword:energie")) == ["2"]
+        # Keywords are separate, phrases do not span two of them
+        assert ids(index.search('keyword:"umwelt klimaschutz"')) == []
+
+    def test_ranking(self, index):
+        """Test that title matches rank above text matches."""
+        hits = index.search("energien")
+
+        assert ids(hits) == ["1", "2"]
+        assert hits[0].score > hits[1].score > 0
+        assert hits[0].story.title == "Erneuerbare Energien im Aufwind"
+        assert len(index.search("umwelt OR kohle OR zeugen", limit=2)) == 2
+
+    def test_incremental(self, index):
+        """Test that stories can be added between queries."""
+        assert not index.add(make_story("3", "Doppelt", "Doppelt"))
+        assert index.add(make_story("4", "Gas wird teurer", "Preise steigen"))
+
+        assert len(index) == 4
+        assert "4" in index
+        assert set(ids(index.search("gas"))) == {"2", "4"}
+
+    def test_invalid_query(self, index):
+        """Test that invalid queries raise ValueError."""
+        for query in ("(kohle", "kohle)", "kohle OR", "AND"):
+            with pytest.raises(ValueError):
+                index.search(query)
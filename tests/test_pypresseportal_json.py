@@ -0,0 +1,68 @@
+"""Tests for the json decoders of PyPresseportal."""
+
+import json
+
+import pytest
+import responses
+
+from api_responses import APIReponses
+from pypresseportal import PresseportalApi
+from pypresseportal.pypresseportal_json import (
+    default_decoder,
+    orjson,
+    orjson_decoder,
+    stdlib_decoder,
+)
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = "https://api.presseportal.de/api/article/all"
+
+
+class TestDecoders:
+    """Tests for the decoder functions."""
+
+    def test_stdlib_decoder(self):
+        """Test decoding bytes and text with the json module."""
+        _, content = APIReponses().load_response("get_stories")
+        assert stdlib_decoder(content.encode()) == json.loads(content)
+        assert stdlib_decoder(content) == json.loads(content)
+        with pytest.raises(ValueError):
+            stdlib_decoder(b'{"content": ')
+
+    @pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+    def test_orjson_decoder(self):
+        """Test that orjson decodes like the json module."""
+        _, content = APIReponses().load_response("get_stories")
+        assert orjson_decoder(content.encode()) == json.loads(content)
+        # Lone surrogates are rejected by orjson but accepted by json
+        assert orjson_decoder(b'{"title": "\\ud800"}') == {"title": "\ud800"}
+        with pytest.raises(ValueError):
+            orjson_decoder(b'{"content": ')
+        assert default_decoder() is orjson_decoder
+
+
+class TestApiDecoder:
+    """Tests for the json_decoder argument."""
+
+    @responses.activate
+    def test_custom_decoder(self):
+        """Test that responses are decoded from bytes with the given decoder."""
+        status, content = APIReponses().load_response("get_stories")
+        responses.add(responses.GET, STORIES_URL, body=content, status=status)
+        decoded = []
+
+        def decoder(data):
+            decoded.append(data)
+            return json.loads(data)
+
+        with PresseportalApi(API_KEY, json_decoder=decoder) as api_obj:
+            stories = api_obj.get_stories()
+
+        assert stories[0].id == "1234567"
+        assert decoded == [content.encode()]
+
+    def test_default_decoder(self):
+        """Test that the fastest available decoder is used by default."""
+        with PresseportalApi(API_KEY) as api_obj:
+            assert api_obj.json_decoder is default_decoder()
@@ -0,0 +1,101 @@
+"""Tests for lazily decoded stories in PyPresseportal."""
+
+import json
+
+import pytest
+import responses
+
+from api_responses import APIReponses
+from pypresseportal import PresseportalApi, Story
+from pypresseportal.pypresseportal_errors import ApiDataError
+from pypresseportal.pypresseportal_lazy import LazyStory
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+OPTIONAL_ATTRIBUTES = (
+    "body",
+    "teaser",
+    "language",
+    "ressort",
+    "company_id",
+    "company_url",
+    "company_name",
+    "office_id",
+    "office_url",
+    "office_name",
+    "keywords",
+    "image",
+    "document",
+    "audio",
+    "video",
+)
+
+
+class TestLazyStory:
+    """Tests for LazyStory."""
+
+    @classmethod
+    def setup_class(cls):
+        """Load story data."""
+        with open("tests/replies/get_stories.json", "r") as in_file:
+            cls.item = json.load(in_file)["content"]["story"][0]
+
+    def variants(self):
+        """Return story data with a teaser instead of a body and an office."""
+        teaser_item = dict(self.item, teaser="Test teaser.")
+        del teaser_item["body"]
+        office_item = dict(self.item, office=self.item["company"], keywords=[])
+        del office_item["company"], office_item["media"]
+        return [self.item, teaser_item, office_item]
+
+    def test_same_attributes_as_story(self):
+        """Test that LazyStory and Story have the same attributes and values."""
+        for item in self.variants():
+            story = Story(item)
+            lazy = LazyStory(item)
+            for attribute in ("id", "url", "title", "published", "highlight", "short"):
+                assert getattr(lazy, attribute) == getattr(story, attribute)
+            for attribute in OPTIONAL_ATTRIBUTES:
+                assert hasattr(lazy, attribute) == hasattr(story, attribute)
+                if hasattr(story, attribute):
+                    assert getattr(lazy, attribute) == getattr(story, attribute)
+
+    def test_decoded_once(self):
+        """Test that fields are decoded on first access and then kept."""
+        lazy = LazyStory(self.item)
+        assert "published" not in vars(lazy)
+
+        published = lazy.published
+
+        assert vars(lazy)["published"] is published
+        assert lazy.published is published
+
+    def test_validation(self):
+        """Test that missing keys raise on creation, bad values on access."""
+        item = dict(self.item)
+        del item["title"]
+        with pytest.raises(ApiDataError):
+            LazyStory(item)
+
+        item = dict(self.item)
+        del item["body"]
+        with pytest.raises(ApiDataError):
+            LazyStory(item)
+
+        lazy = LazyStory(dict(self.item, published="yesterday"))
+        assert lazy.id == "1234567"
+        with pytest.raises(ValueError):
+            lazy.published
+        with pytest.raises(ValueError):
+            lazy.decode()
+
+    @responses.activate
+    def test_api(self):
+        """Test that get_stories() returns lazy stories."""
+        APIReponses().set_mock_response("get_stories")
+
+        with PresseportalApi(API_KEY, lazy_models=True) as api_obj:
+            stories = api_obj.get_stories()
+
+        assert isinstance(stories[0], LazyStory)
+        assert stories[0].decode().keywords == ["Umwelt", "Klimaschutz"]
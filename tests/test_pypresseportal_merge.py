@@ -0,0 +1,102 @@
+"""Tests for merging story feeds with PyPresseportal."""
+
+import json
+import re
+
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import responses
+
+from pypresseportal import PresseportalApi
+from pypresseportal.pypresseportal_dedup import SeenStories
+from pypresseportal.pypresseportal_merge import merge_feeds
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+TOPIC_URL = re.compile(r"https://api\.presseportal\.de/api/article/topic/[\w-]+.*")
+START = datetime(2020, 7, 2, 4, 30, tzinfo=timezone.utc)
+
+
+def stories(*pairs):
+    """Stories from (id, minutes before START) pairs."""
+    return [
+        SimpleNamespace(id=story_id, published=START - timedelta(minutes=minutes))
+        for story_id, minutes in pairs
+    ]
+
+
+def ids(merged):
+    """Ids of the merged stories."""
+    return [story.id for story in merged]
+
+
+class TestMergeFeeds:
+    """Tests for merge_feeds()."""
+
+    def test_order_and_duplicates(self):
+        """Test that feeds are merged most recent first without duplicates."""
+        first = stories(("a", 0), ("b", 2), ("c", 2), ("d", 5))
+        second = stories(("e", 1), ("c", 2), ("f", 2), ("a", 0))
+        third = stories(("b", 2), ("g", 9))
+
+        merged = ids(merge_feeds(first, second, third))
+
+        assert merged[:2] == ["a", "e"]
+        assert sorted(merged[2:5]) == ["b", "c", "f"]
+        assert merged[5:] == ["d", "g"]
+
+    def test_shifted_pages(self):
+        """Test that stories repeated by a shifted page are skipped."""
+        feed = stories(("a", 0), ("b", 1), ("b", 1), ("new", -1), ("a", 0), ("c", 3))
+
+        assert ids(merge_feeds(feed)) == ["a", "b", "c"]
+
+    def test_seen(self):
+        """Test that stories of earlier streams can be dropped."""
+        seen = SeenStories(capacity=100)
+
+        assert ids(merge_feeds(stories(("a", 0), ("b", 1)), seen=seen)) == ["a", "b"]
+        assert ids(merge_feeds(stories(("b", 1), ("c", 2)), seen=seen)) == ["c"]
+        assert ids(merge_feeds()) == []
+
+    @responses.activate
+    def test_pages_on_demand(self):
+        """Test that pages are only requested when the merged stream reaches them."""
+        with open("tests/replies/get_stories.json", "r") as in_file:
+            template = json.load(in_file)
+
+        def reply(request):
+            url = urlparse(request.url)
+            topic = url.path.rsplit("/", 1)[-1]
+            query = parse_qs(url.query)
+            start, limit = int(query["start"][0]), int(query["limit"][0])
+            # Stories of "finanzen" are published twice as often
+            step = 1 if topic == "finanzen" else 2
+            page = [
+                dict(
+                    template["content"]["story"][0],
+                    id=f"{topic}-{i}",
+                    published=(START - timedelta(minutes=i * step)).strftime(
+                        "%Y-%m-%dT%H:%M:%S%z"
+                    ),
+                )
+                for i in range(start, start + limit)
+            ]
+            return 200, {}, json.dumps(dict(template, content={"story": page}))
+
+        responses.add_callback(responses.GET, TOPIC_URL, callback=reply)
+        with PresseportalApi(API_KEY) as api_obj:
+            merged = merge_feeds(
+                api_obj.iter_stories_topic("finanzen", page_size=10),
+                api_obj.iter_stories_topic("handel", page_size=10),
+            )
+            latest = list(islice(merged, 24))
+
+        published = [story.published for story in latest]
+        assert published == sorted(published, reverse=True)
+        assert len(set(ids(latest))) == 24
+        # 16 stories of finanzen and 8 of handel: two pages and one page
+        assert len(responses.calls) == 3
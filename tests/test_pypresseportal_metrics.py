@@ -0,0 +1,191 @@
+"""Tests for the request, parsing and error metrics of PyPresseportal."""
+
+import json
+import sqlite3
+import urllib.request
+
+import pytest
+import requests
+import responses
+
+from pypresseportal import PresseportalApi
+from pypresseportal.pypresseportal_archive import StoryArchive
+from pypresseportal.pypresseportal_errors import (
+    ApiConnectionFail,
+    ApiDataError,
+    ApiError,
+)
+from pypresseportal.pypresseportal_metrics import (
+    ERRORS,
+    PAGE_STORIES,
+    PARSE_SECONDS,
+    REQUEST_SECONDS,
+    REQUESTS,
+    RESPONSE_BYTES,
+    MetricsSink,
+    PrometheusMetrics,
+    endpoint_label,
+)
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = "https://api.presseportal.de/api/article/all"
+SEARCH_URL = "https://api.presseportal.de/api/search/company"
+
+
+def reply(name):
+    """Content of a file in tests/replies."""
+    with open(f"tests/replies/{name}", "r") as in_file:
+        return in_file.read()
+
+
+class TestPrometheusMetrics:
+    """Tests for PrometheusMetrics."""
+
+    def test_endpoint_label(self):
+        """Test that ids, topics and media types are not part of endpoints."""
+        base = "https://api.presseportal.de/api/"
+        assert endpoint_label(base + "article/all") == "article/all"
+        assert endpoint_label(base + "article/all/image") == "article/all"
+        assert endpoint_label(base + "article/company/1234/video") == "article/company"
+        assert (
+            endpoint_label(base + "article/publicservice/region/be")
+            == "article/publicservice/region"
+        )
+        assert endpoint_label(base + "article/publicservice") == "article/publicservice"
+        assert endpoint_label(base + "ir/company/1234/ad-hoc") == "ir/company"
+        assert endpoint_label(base + "ir/ad-hoc") == "ir"
+        assert endpoint_label(base + "irrelevant") == "other"
+
+    def test_render(self):
+        """Test the text exposition format of counters and histograms."""
+        metrics = PrometheusMetrics(buckets={"latency": (0.1, 1)})
+        metrics.inc(REQUESTS, {"endpoint": "article/all"})
+        metrics.inc(REQUESTS, {"endpoint": "article/all"}, 2)
+        metrics.inc("custom_total", {"name": 'a "b"'})
+        for value in (0.05, 0.1, 0.5, 3):
+            metrics.observe("latency", {}, value)
+
+        assert metrics.counter(REQUESTS, endpoint="article/all") == 3
+        assert metrics.counter(REQUESTS, endpoint="ir") == 0
+        assert metrics.histogram("latency") == (4, 3.65)
+        assert metrics.render().splitlines() == [
+            "# TYPE custom_total counter",
+            'custom_total{name="a \\"b\\""} 1',
+            f"# HELP {REQUESTS} API queries by endpoint, including cache hits.",
+            f"# TYPE {REQUESTS} counter",
+            f'{REQUESTS}{{endpoint="article/all"}} 3',
+            "# TYPE latency histogram",
+            'latency_bucket{le="0.1"} 2',
+            'latency_bucket{le="1"} 3',
+            'latency_bucket{le="+Inf"} 4',
+            "latency_sum 3.65",
+            "latency_count 4",
+        ]
+        metrics.clear()
+        assert metrics.render() == ""
+
+    def test_serve(self):
+        """Test that the metrics are served over HTTP."""
+        metrics = PrometheusMetrics()
+        metrics.inc(REQUESTS, {"endpoint": "ir"})
+        server = metrics.serve(0, "127.0.0.1")
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            with urllib.request.urlopen(url) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert body == metrics.render()
+        assert content_type.startswith("text/plain; version=0.0.4")
+
+    def test_base_sink(self):
+        """Test that the base class accepts and ignores all metrics."""
+        sink = MetricsSink()
+        sink.inc(REQUESTS, {"endpoint": "ir"})
+        sink.observe(REQUEST_SECONDS, {"endpoint": "ir"}, 0.1)
+
+
+class TestApiMetrics:
+    """Tests for PresseportalApi with metrics."""
+
+    @responses.activate
+    def test_story_query(self):
+        """Test request, bytes, parse and page metrics of a story query."""
+        body = reply("get_stories.json")
+        responses.add(responses.GET, STORIES_URL, body=body)
+        metrics = PrometheusMetrics()
+        with PresseportalApi(API_KEY, metrics=metrics) as api_obj:
+            stories = api_obj.get_stories()
+
+        assert metrics.counter(REQUESTS, endpoint="article/all") == 1
+        assert metrics.histogram(REQUEST_SECONDS, endpoint="article/all")[0] == 1
+        assert metrics.counter(RESPONSE_BYTES, endpoint="article/all") == len(
+            body.encode()
+        )
+        assert metrics.histogram(PARSE_SECONDS, parser="stories")[0] == 1
+        assert metrics.histogram(PAGE_STORIES) == (1, len(stories))
+        assert "presseportal_page_stories_bucket" in metrics.render()
+
+    @responses.activate
+    def test_search_query(self):
+        """Test parse metrics of search results."""
+        responses.add(responses.GET, SEARCH_URL, body=reply("entity_search.json"))
+        metrics = PrometheusMetrics()
+        with PresseportalApi(API_KEY, metrics=metrics) as api_obj:
+            api_obj.get_entity_search_results("presse")
+
+        assert metrics.counter(REQUESTS, endpoint="search/company") == 1
+        assert metrics.histogram(PARSE_SECONDS, parser="search_results")[0] == 1
+
+    @responses.activate
+    def test_errors(self):
+        """Test that errors are counted by operation and exception class."""
+        responses.add(
+            responses.GET, STORIES_URL, body=reply("authentification_failed_error.json")
+        )
+        responses.add(
+            responses.GET,
+            STORIES_URL,
+            body=requests.exceptions.ConnectionError("unreachable"),
+        )
+        broken = json.loads(reply("get_stories.json"))
+        del broken["content"]["story"][0]["title"]
+        responses.add(responses.GET, STORIES_URL, json=broken)
+        metrics = PrometheusMetrics()
+        with PresseportalApi(API_KEY, metrics=metrics) as api_obj:
+            for error_class in (ApiError, ApiConnectionFail, ApiDataError):
+                with pytest.raises(error_class):
+                    api_obj.get_stories()
+
+        for operation, error in (
+            ("article/all", "ApiError"),
+            ("article/all", "ApiConnectionFail"),
+            ("stories", "ApiDataError"),
+        ):
+            assert metrics.counter(ERRORS, operation=operation, error=error) == 1
+        assert metrics.counter(REQUESTS, endpoint="article/all") == 3
+        assert metrics.histogram(PARSE_SECONDS, parser="stories")[0] == 0
+
+    @responses.activate
+    def test_archive_not_parsing(self, tmp_path, monkeypatch):
+        """Test that archive writes are neither timed nor counted as parse errors."""
+        responses.add(responses.GET, STORIES_URL, body=reply("get_stories.json"))
+        archive = StoryArchive(str(tmp_path / "archive.db"))
+
+        def fail(items):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(archive, "add_items", fail)
+        metrics = PrometheusMetrics()
+        with PresseportalApi(API_KEY, metrics=metrics, archive=archive) as api_obj:
+            with pytest.raises(sqlite3.OperationalError):
+                api_obj.get_stories()
+
+        assert metrics.histogram(PARSE_SECONDS, parser="stories")[0] == 1
+        assert (
+            metrics.counter(ERRORS, operation="stories", error="OperationalError") == 0
+        )
@@ -0,0 +1,167 @@
+"""Tests for the local stand-in of the presseportal.de API."""
+
+import json
+import urllib.request
+
+import pytest
+
+from pypresseportal import Company, Office, PresseportalApi
+from pypresseportal.pypresseportal_errors import ApiConnectionFail, ApiError
+from pypresseportal.pypresseportal_mockserver import ApiFault, MockApiServer, MockFeed
+from pypresseportal.pypresseportal_ratelimit import RetryPolicy
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+
+
+class Clock:
+    """Manually advanced clock for feeds."""
+
+    def __init__(self):
+        """Constructor method."""
+        self.now = 1600000000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMockFeed:
+    """Tests for MockFeed."""
+
+    def test_advancing_feed(self):
+        """Test that new stories are published at the rate of the feed."""
+        clock = Clock()
+        feed = MockFeed(rate=2, history=100, clock=clock)
+        assert feed.newest() == 99
+        clock.now += 10
+        assert feed.newest() == 119
+        assert (feed.published(119) - feed.published(99)).total_seconds() == 10
+
+    def test_deterministic(self):
+        """Test that feeds with the same arguments return the same stories."""
+        first, second = MockFeed(seed=3), MockFeed(seed=3)
+        assert first.item(42) == second.item(42)
+        assert first.item(42)["id"] == "5000042"
+        assert "teaser" in first.item(42, teaser=True)
+        assert "body" not in first.item(42, teaser=True)
+        assert MockFeed(seed=4).item(42)["title"] != first.item(42)["title"]
+
+    def test_select(self):
+        """Test that pages of matching stories are returned, most recent first."""
+        feed = MockFeed(history=1000)
+        numbers = feed.select(lambda a: a.office, 5, 10)
+        everything = feed.select(lambda a: a.office, 0, 15)
+        assert numbers == everything[5:]
+        assert numbers == sorted(numbers, reverse=True)
+        assert all(feed.attributes(n).office for n in numbers)
+
+
+class TestMockApiServer:
+    """Tests for MockApiServer with the synchronous client."""
+
+    @classmethod
+    def setup_class(cls):
+        """Start a server on a free port."""
+        cls.server = MockApiServer(feed=MockFeed(rate=0, history=2000))
+        cls.server.start()
+        cls.api_obj = PresseportalApi(API_KEY, api_url=cls.server.url)
+
+    @classmethod
+    def teardown_class(cls):
+        """Stop the server."""
+        cls.api_obj.close()
+        cls.server.stop()
+
+    def test_story_queries(self):
+        """Test that the stories match the endpoint of the query."""
+        stories = self.api_obj.get_stories()
+        assert len(stories) == 50
+        assert stories[0].id == "5001999"
+
+        for story in self.api_obj.get_stories_topic("finanzen", limit=10):
+            assert story.ressort == "finanzen"
+        for story in self.api_obj.get_stories_keywords(["umwelt", "verkehr"]):
+            assert {"umwelt", "verkehr"} & set(story.keywords)
+        for story in self.api_obj.get_stories_specific_company("100007"):
+            assert story.company_id == "100007"
+        for story in self.api_obj.get_public_service_specific_office("110003"):
+            assert story.office_id == "110003"
+        assert self.api_obj.get_public_service_specific_region("hh", limit=5)
+        assert self.api_obj.get_investor_relations_news(limit=5)
+        for story in self.api_obj.get_stories(media="image", limit=10):
+            assert story.image
+
+    def test_paging_and_teaser(self):
+        """Test the start, limit and teaser parameters."""
+        first = self.api_obj.get_stories_topic("finanzen", limit=20)
+        second = self.api_obj.get_stories_topic(
+            "finanzen", start=10, limit=10, teaser=True
+        )
+        assert [story.id for story in second] == [story.id for story in first[10:]]
+        assert second[0].teaser and not hasattr(second[0], "body")
+
+    def test_info_and_search(self):
+        """Test information and search queries."""
+        company = self.api_obj.get_company_information("100001")
+        office = self.api_obj.get_public_service_office_information("110001")
+        assert isinstance(company, Company) and company.id == "100001"
+        assert isinstance(office, Office) and office.id == "110001"
+
+        results = self.api_obj.get_entity_search_results("energie")
+        assert results and all("Energie" in entity.name for entity in results)
+        assert all(entity.type == "company" for entity in results)
+
+    def test_error_envelopes(self):
+        """Test that invalid queries are answered with error envelopes."""
+        with pytest.raises(ApiError) as excinfo:
+            self.api_obj.get_company_information("999999")
+        assert "error code 404" in str(excinfo.value)
+
+        url = f"{self.server.url}/article/topic/invalid?api_key={API_KEY}"
+        with urllib.request.urlopen(url) as response:
+            assert json.load(response) == ApiFault("parameter").envelope()
+
+    def test_api_keys(self):
+        """Test that unknown API keys are rejected like by the API."""
+        with MockApiServer(api_keys=["A_VALID_API_KEY"]) as server:
+            with PresseportalApi(API_KEY, api_url=server.url) as api_obj:
+                with pytest.raises(ApiError) as excinfo:
+                    api_obj.get_stories()
+        assert "error code 101 (authentification failed)" in str(excinfo.value)
+
+
+class TestFaults:
+    """Tests for injected latency and failures."""
+
+    def test_failure(self):
+        """Test that failed requests are repeated by a retry policy."""
+        with MockApiServer(failure_rate=1, seed=1) as server:
+            with PresseportalApi(API_KEY, api_url=server.url) as api_obj:
+                with pytest.raises(ApiError):
+                    api_obj.get_stories()
+                api_obj.retry = RetryPolicy(max_retries=2, backoff_factor=0)
+                server.failure_rate = 0.5
+                # The Retry-After header would pause the test
+                server.failure_status = 502
+                assert len(api_obj.get_stories(limit=5)) == 5
+
+    def test_disconnect(self):
+        """Test that closed connections raise ApiConnectionFail."""
+        with MockApiServer(disconnect_rate=1) as server:
+            with PresseportalApi(API_KEY, api_url=server.url) as api_obj:
+                with pytest.raises(ApiConnectionFail):
+                    api_obj.get_stories()
+
+    def test_fault_rates(self):
+        """Test the delay and the share of each injected failure."""
+        server = MockApiServer(
+            latency=0.1, jitter=0.05, failure_rate=0.2, error_rate=0.1, seed=2
+        )
+        server.server_close()
+        faults = [server.fault() for _ in range(2000)]
+        assert all(0.1 <= delay <= 0.15 for delay, _ in faults)
+        kinds = [kind for _, kind in faults]
+        assert kinds.count("disconnect") == 0
+        assert 300 < kinds.count("failure") < 500
+        assert 120 < kinds.count("error") < 280
+        assert server.request_count == 2000
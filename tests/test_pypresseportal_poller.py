@@ -0,0 +1,212 @@
+"""Tests for incremental polling with PyPresseportal."""
+
+import json
+import random
+import re
+
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from pypresseportal import PresseportalApi, StoryPoller
+from pypresseportal.pypresseportal_dedup import SeenStories
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = re.compile(r"https://api\.presseportal\.de/api/article/all.*")
+
+
+class Feed:
+    """Mock article/all feed, new stories can be published between polls."""
+
+    def __init__(self):
+        """Constructor method."""
+        with open("tests/replies/get_stories.json", "r") as in_file:
+            self.template = json.loads(in_file.read())
+        self.stories = []
+        self.time = datetime(2020, 7, 2, 4, 30, tzinfo=timezone.utc)
+        self.next_id = 1
+        self.publish_on_read = {}
+
+    def publish(self, count, same_second=False):
+        """Publish new stories, newest first in the feed."""
+        for _ in range(count):
+            if not same_second:
+                self.time += timedelta(seconds=1)
+            story = dict(
+                self.template["content"]["story"][0],
+                id=str(self.next_id),
+                published=self.time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            )
+            self.stories.insert(0, story)
+            self.next_id += 1
+
+    def __call__(self, request):
+        """Reply with one page of the feed."""
+        query = parse_qs(urlparse(request.url).query)
+        start, limit = int(query["start"][0]), int(query["limit"][0])
+        # Stories published while a poll is paging through the feed
+        self.publish(self.publish_on_read.pop(start, 0))
+        page = self.stories[start : start + limit]
+        json_data = dict(self.template, content={"story": page})
+        return 200, {}, json.dumps(json_data)
+
+
+@pytest.fixture
+def feed():
+    """Register a mock feed for article/all."""
+    with responses.RequestsMock() as mocked:
+        feed = Feed()
+        mocked.add_callback(responses.GET, STORIES_URL, callback=feed)
+        feed.mocked = mocked
+        yield feed
+
+
+def ids(stories):
+    """Ids of a list of stories as integers."""
+    return [int(story.id) for story in stories]
+
+
+class TestStoryPoller:
+    """Tests for StoryPoller."""
+
+    def test_first_poll_returns_first_page(self, feed):
+        """Test that the first poll returns one page and sets the watermark."""
+        feed.publish(30)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=10)
+
+        assert ids(poller.poll()) == list(range(30, 20, -1))
+        assert poller.watermark("get_stories").ids == {"30"}
+        assert len(feed.mocked.calls) == 1
+
+    def test_only_new_stories(self, feed):
+        """Test that later polls only return new stories."""
+        feed.publish(5)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=10)
+        poller.poll()
+
+        assert poller.poll() == []
+        feed.publish(3)
+        assert ids(poller.poll()) == [8, 7, 6]
+        assert poller.poll() == []
+
+    def test_gap_fill_across_pages(self, feed):
+        """Test that a burst of stories is fetched across several pages."""
+        feed.publish(5)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=10)
+        poller.poll()
+        feed.publish(25)
+
+        assert ids(poller.poll()) == list(range(30, 5, -1))
+        assert poller.last_poll_complete
+        assert len(feed.mocked.calls) == 4
+
+    def test_max_pages(self, feed):
+        """Test that polls stop after max_pages and report it."""
+        feed.publish(5)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=10, max_pages=2)
+        poller.poll()
+        feed.publish(50)
+
+        # Pages after the first overlap the previous one by a story
+        assert len(poller.poll()) == 19
+        assert not poller.last_poll_complete
+
+    def test_gap_filled_by_next_polls(self, feed):
+        """Test that stories skipped at max_pages are returned by the next polls."""
+        feed.publish(5)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=10, max_pages=3)
+        poller.poll()
+        feed.publish(50)
+
+        assert ids(poller.poll()) == list(range(55, 27, -1))
+        assert poller.watermark("get_stories").ids == {"55"}
+        assert ids(poller.poll()) == list(range(27, 9, -1))
+        assert not poller.last_poll_complete
+        assert ids(poller.poll()) == [9, 8, 7, 6]
+        assert poller.last_poll_complete
+        assert poller.poll() == []
+        assert poller.last_poll_complete
+        assert poller.gaps == {}
+
+    def test_gap_with_new_stories(self, feed):
+        """Test that new stories are returned before the rest of a gap."""
+        feed.publish(5)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=10, max_pages=2)
+        poller.poll()
+        feed.publish(50)
+        poller.poll()
+        feed.publish(3)
+
+        assert ids(poller.poll()) == [58, 57, 56] + list(range(36, 27, -1))
+        assert poller.watermark("get_stories").ids == {"58"}
+        calls = len(feed.mocked.calls)
+        assert ids(poller.poll()) == list(range(27, 18, -1))
+        # The poll continues in the gap instead of paging through returned stories
+        assert len(feed.mocked.calls) == calls + 2
+
+    def test_published_while_reading_gap(self, feed):
+        """Test that stories published while a gap is read do not shift it."""
+        feed.publish(5)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=5, max_pages=2)
+        poller.poll()
+        feed.publish(20)
+
+        assert ids(poller.poll()) == list(range(25, 16, -1))
+        feed.publish_on_read[12] = 1
+        returned = ids(poller.poll())
+        while not poller.last_poll_complete:
+            returned.extend(ids(poller.poll()))
+        returned.extend(ids(poller.poll()))
+
+        assert sorted(returned) == list(range(6, 17)) + [26]
+        assert poller.gaps == {}
+
+    def test_bursts_returned_once(self, feed):
+        """Test that random bursts are returned completely and only once."""
+        rng = random.Random(5)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=7, max_pages=3)
+        feed.publish(3)
+        returned = ids(poller.poll())
+        for _ in range(40):
+            feed.publish(rng.choice((0, 1, 4, 15, 40)), same_second=rng.random() < 0.3)
+            returned.extend(ids(poller.poll()))
+        while not poller.last_poll_complete:
+            returned.extend(ids(poller.poll()))
+
+        assert sorted(returned) == list(range(1, feed.next_id))
+
+    def test_page_size_limit(self):
+        """Test that pages are not larger than the API allows."""
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=200)
+        assert poller.page_size == 50
+
+    def test_same_second(self, feed):
+        """Test stories published in the same second as the watermark."""
+        feed.publish(2)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=10)
+        poller.poll()
+        feed.publish(2, same_second=True)
+
+        assert ids(poller.poll()) == [4, 3]
+        assert poller.watermark("get_stories").ids == {"2", "3", "4"}
+        assert poller.poll() == []
+
+    def test_invalid_endpoint(self):
+        """Test that only story queries can be polled."""
+        poller = StoryPoller(PresseportalApi(API_KEY))
+        with pytest.raises(ValueError):
+            poller.poll("get_company_information", id="1234")
+
+    def test_seen_across_queries(self, feed):
+        """Test that stories returned for one query are dropped for another."""
+        feed.publish(5)
+        seen = SeenStories(capacity=100)
+        poller = StoryPoller(PresseportalApi(API_KEY), page_size=10, seen=seen)
+
+        assert ids(poller.poll()) == [5, 4, 3, 2, 1]
+        assert poller.poll("get_stories", teaser=True) == []
+        feed.publish(2)
+        assert ids(poller.poll("get_stories", teaser=True)) == [7, 6]
+        assert poller.poll() == []
@@ -0,0 +1,154 @@
+"""Tests for rate limiting and retries in PyPresseportal."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import responses
+
+from api_responses import APIReponses
+from pypresseportal import PresseportalApi
+from pypresseportal.pypresseportal_errors import ApiConnectionFail, ApiError
+from pypresseportal.pypresseportal_ratelimit import (
+    RateLimiter,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = "https://api.presseportal.de/api/article/all"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record waits instead of sleeping."""
+    recorded = []
+    monkeypatch.setattr(
+        "pypresseportal.pypresseportal_ratelimit.time.sleep", recorded.append
+    )
+    return recorded
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_burst_then_rate(self):
+        """Test that a burst passes at once and further requests are spaced out."""
+        limiter = RateLimiter(rate=10, burst=3)
+
+        delays = [limiter.reserve() for _ in range(5)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert delays[3] == pytest.approx(0.1, abs=0.01)
+        assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+    def test_pause(self, sleeps):
+        """Test that a pause holds back requests."""
+        limiter = RateLimiter(rate=100, burst=10)
+        limiter.pause(2)
+
+        limiter.acquire()
+
+        assert sleeps[0] == pytest.approx(2, abs=0.05)
+
+    def test_invalid_rate(self):
+        """Test that the rate must be positive."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy and parse_retry_after."""
+
+    def test_backoff(self):
+        """Test exponential backoff, its limit and jitter."""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+
+        assert [policy.backoff(attempt) for attempt in range(5)] == [0.5, 1, 2, 3, 3]
+        assert policy.backoff(0, retry_after=7) == 7
+        assert 0 <= RetryPolicy(backoff_factor=0.5).backoff(2) <= 2
+        assert policy.can_retry(2)
+        assert not policy.can_retry(3)
+
+    def test_parse_retry_after(self):
+        """Test Retry-After values in seconds and as HTTP date."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+        assert parse_retry_after("5") == 5
+        assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == (
+            pytest.approx(120, abs=2)
+        )
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestRetries:
+    """Tests for PresseportalApi with rate limiting and retries."""
+
+    @classmethod
+    def setup_class(cls):
+        """Load reply content."""
+        _, cls.content = APIReponses().load_response("get_stories")
+        _, cls.error_content = APIReponses().load_response(
+            "authentification_failed_error"
+        )
+
+    @responses.activate
+    def test_retry_after(self, sleeps):
+        """Test that an overloaded API is retried after the requested wait."""
+        responses.add(
+            responses.GET, STORIES_URL, status=503, headers={"Retry-After": "4"}
+        )
+        responses.add(responses.GET, STORIES_URL, status=429)
+        responses.add(responses.GET, STORIES_URL, body=self.content)
+
+        policy = RetryPolicy(backoff_factor=0.5, jitter=False)
+        with PresseportalApi(API_KEY, retry=policy) as api_obj:
+            stories = api_obj.get_stories()
+
+        assert stories[0].id == "1234567"
+        assert len(responses.calls) == 3
+        assert sleeps == [4, 1]
+
+    @responses.activate
+    def test_retries_exhausted(self, sleeps):
+        """Test that a connection failure is raised after the last retry."""
+        policy = RetryPolicy(max_retries=2, backoff_factor=1, jitter=False)
+        with PresseportalApi(API_KEY, retry=policy) as api_obj:
+            with pytest.raises(ApiConnectionFail):
+                api_obj.get_stories()
+
+        assert sleeps == [1, 2]
+
+    @responses.activate
+    def test_api_error_codes(self, sleeps):
+        """Test that only listed API error codes are retried."""
+        responses.add(responses.GET, STORIES_URL, body=self.error_content)
+        responses.add(responses.GET, STORIES_URL, body=self.error_content)
+        responses.add(responses.GET, STORIES_URL, body=self.content)
+
+        with PresseportalApi(API_KEY, retry=RetryPolicy()) as api_obj:
+            with pytest.raises(ApiError):
+                api_obj.get_stories()
+
+        policy = RetryPolicy(api_error_codes=[101], jitter=False)
+        with PresseportalApi(API_KEY, retry=policy) as api_obj:
+            stories = api_obj.get_stories()
+
+        assert stories[0].id == "1234567"
+        assert len(sleeps) == 1
+
+    @responses.activate
+    def test_shared_rate_limiter(self, sleeps):
+        """Test that API objects sharing a rate limiter share its quota."""
+        responses.add(responses.GET, STORIES_URL, body=self.content)
+        limiter = RateLimiter(rate=2, burst=1)
+
+        with PresseportalApi(API_KEY, rate_limiter=limiter) as first:
+            with PresseportalApi(API_KEY, rate_limiter=limiter) as second:
+                first.get_stories()
+                second.get_stories()
+
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(0.5, abs=0.05)
@@ -0,0 +1,159 @@
+"""Tests for compressed segment files of PyPresseportal."""
+
+import json
+import zlib
+
+from datetime import datetime, timezone
+
+import pytest
+
+from api_responses import ids, story_items, story_template
+from pypresseportal import Story
+from pypresseportal import pypresseportal_segment
+from pypresseportal.pypresseportal_errors import ApiDataError
+from pypresseportal.pypresseportal_lazy import LazyStory
+from pypresseportal.pypresseportal_segment import (
+    _FOOTER,
+    CODECS,
+    Segment,
+    SegmentWriter,
+    default_codec,
+)
+
+
+def segment_items(count=60):
+    """Stories published an hour apart, by three companies and an office."""
+    company = story_template()["company"]
+    return story_items(
+        count,
+        office_every=10,
+        published=lambda i: f"2020-07-{1 + i // 24:02d}T{i % 24:02d}:00:00+0000",
+        company=lambda i: dict(company, id="99" if i % 10 == 9 else str(1 + i // 20)),
+    )
+
+
+@pytest.fixture
+def path(write_stories):
+    """Segment file with 60 stories in blocks of about 10 stories."""
+    record_size = len(json.dumps(segment_items(1)[0]))
+    return write_stories(
+        SegmentWriter, "stories.ppseg", segment_items(), block_size=10 * record_size
+    )
+
+
+class TestSegment:
+    """Tests for SegmentWriter and Segment."""
+
+    def test_roundtrip(self, path):
+        """Test that a full scan returns all stories in the order they were written."""
+        with Segment(path) as segment:
+            stories = list(segment.scan())
+
+            assert len(segment) == 60
+            assert segment.codec == default_codec()
+            assert len(segment.blocks) > 4
+            assert segment.ratio > 1
+        assert isinstance(stories[0], Story)
+        assert ids(stories) == [str(1000 + i) for i in range(60)]
+        assert [story.data for story in stories] == segment_items()
+
+    @pytest.mark.parametrize("codec", sorted(CODECS))
+    def test_codecs(self, tmp_path, codec):
+        """Test every available codec."""
+        file_path = str(tmp_path / f"{codec}.ppseg")
+        with SegmentWriter(file_path, codec=codec) as writer:
+            assert writer.write_items(segment_items()) == 60
+            assert len(writer) == 60
+
+        with Segment(file_path, model=LazyStory) as segment:
+            assert segment.codec == codec
+            assert len(segment.blocks) == 1
+            assert ids(segment.scan()) == [str(1000 + i) for i in range(60)]
+            if codec == "none":
+                assert segment.compressed_size == segment.raw_size
+
+    def test_time_range_pushdown(self, path):
+        """Test that time range scans skip the blocks outside of the range."""
+        start = datetime(2020, 7, 2, 3, tzinfo=timezone.utc)
+        end = int(datetime(2020, 7, 2, 6, tzinfo=timezone.utc).timestamp())
+        with Segment(path) as segment:
+            assert len(segment.blocks_for(start=start, end=end)) == 1
+            assert ids(segment.scan(start=start, end=end)) == ["1027", "1028", "1029"]
+            assert ids(segment.scan(end=datetime(2020, 7, 1, 2, tzinfo=timezone.utc)))
+            assert not segment.blocks_for(
+                start=datetime(2021, 1, 1, tzinfo=timezone.utc)
+            )
+
+    def test_publisher_pushdown(self, path):
+        """Test that company and office scans skip the blocks of other publishers."""
+        with Segment(path) as segment:
+            company_blocks = segment.blocks_for(company_id="3")
+            stories = list(segment.scan(company_id="3"))
+
+            assert 0 < len(company_blocks) < len(segment.blocks)
+            assert ids(stories) == [str(1000 + i) for i in range(40, 60) if i % 10 != 9]
+            assert ids(segment.scan(office_id="99")) == [
+                "1009",
+                "1019",
+                "1029",
+                "1039",
+                "1049",
+                "1059",
+            ]
+            assert ids(segment.scan(company_id="1", office_id="99")) == []
+
+    def test_get(self, path):
+        """Test lookups by id."""
+        with Segment(path) as segment:
+            assert segment.get("1042").title == "Titel 42 äöü ß"
+            assert len(segment.blocks_for(story_id="1042")) == 1
+            assert segment.get("999") is None
+
+    def test_missing_key(self, tmp_path):
+        """Test that stories without publication date are rejected."""
+        item = segment_items(1)[0]
+        del item["published"]
+        with SegmentWriter(str(tmp_path / "stories.ppseg")) as writer:
+            with pytest.raises(ApiDataError):
+                writer.write_item(item)
+
+    def test_invalid_files(self, tmp_path):
+        """Test that other and incomplete files are rejected."""
+        other_path = tmp_path / "other.ppseg"
+        other_path.write_bytes(b"{}" * 20)
+        writer = SegmentWriter(str(tmp_path / "open.ppseg"))
+        writer.write_items(segment_items())
+        writer._file.flush()
+
+        with pytest.raises(ValueError):
+            Segment(str(other_path))
+        with pytest.raises(ValueError):
+            Segment(writer.path)
+        with pytest.raises(ValueError):
+            SegmentWriter(str(tmp_path / "x.ppseg"), codec="lzma")
+        writer.close()
+
+    def test_corrupt_index(self, path, monkeypatch):
+        """Test that a corrupt block index raises ValueError and closes the file."""
+        with open(path, "rb") as in_file:
+            data = in_file.read()
+        index_size, magic = _FOOTER.unpack(data[-_FOOTER.size :])
+        body = data[: -_FOOTER.size - index_size]
+        opened = []
+
+        def recording_open(*args, **kwargs):
+            opened.append(open(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(pypresseportal_segment, "open", recording_open, False)
+        for index in (
+            b"x" * index_size,
+            zlib.compress(json.dumps({"blocks": []}).encode()),
+            zlib.compress(json.dumps({"codec": "zlib", "blocks": [[1, 2]]}).encode()),
+        ):
+            with open(path, "wb") as out_file:
+                out_file.write(body + index + _FOOTER.pack(len(index), magic))
+            with pytest.raises(ValueError):
+                Segment(path)
+        assert len(opened) == 3
+        assert all(segment_file.closed for segment_file in opened)
@@ -0,0 +1,109 @@
+"""Tests for connection pooling in PyPresseportal."""
+
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import responses
+
+from api_responses import APIReponses
+from pypresseportal import PresseportalApi
+from pypresseportal.pypresseportal_session import SessionPool, session_pool
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+
+
+class TestSessionPool:
+    """Tests for SessionPool."""
+
+    def test_same_key_shares_session(self):
+        """Test that API objects with the same key share one session."""
+        pool = SessionPool()
+        session_a = pool.acquire(API_KEY)
+        session_b = pool.acquire(API_KEY)
+        session_c = pool.acquire("ANOTHER_API_KEY")
+        assert session_a is session_b
+        assert session_a is not session_c
+        assert len(pool) == 2
+
+    def test_pool_settings_separate_sessions(self):
+        """Test that different pool settings do not share a session."""
+        pool = SessionPool()
+        session_a = pool.acquire(API_KEY, pool_maxsize=10)
+        session_b = pool.acquire(API_KEY, pool_maxsize=20)
+        assert session_a is not session_b
+        adapter = session_b.get_adapter("https://api.presseportal.de")
+        assert adapter._pool_maxsize == 20
+
+    def test_release_closes_last_user(self):
+        """Test that a session is only removed once all users released it."""
+        pool = SessionPool()
+        session_a = pool.acquire(API_KEY)
+        session_b = pool.acquire(API_KEY)
+        pool.release(session_a)
+        assert len(pool) == 1
+        pool.release(session_b)
+        assert len(pool) == 0
+
+    def test_keep_alive_disabled(self):
+        """Test that disabling keep-alive sets the connection header."""
+        pool = SessionPool()
+        session = pool.acquire(API_KEY, keep_alive=False)
+        assert session.headers["Connection"] == "close"
+
+
+class TestApiSession:
+    """Tests for the session handling of PresseportalApi."""
+
+    @responses.activate
+    def test_context_manager_reuses_session(self):
+        """Test that all queries of an API object use the same session."""
+        test_response_obj = APIReponses()
+        test_response_obj.set_mock_response("get_stories")
+        test_response_obj.set_mock_response("get_stories")
+
+        with PresseportalApi(API_KEY, pool_maxsize=3) as api_obj:
+            api_obj.get_stories()
+            session = api_obj.session
+            api_obj.get_stories()
+            assert api_obj.session is session
+            with PresseportalApi(API_KEY, pool_maxsize=3) as other_api_obj:
+                assert other_api_obj.session is session
+
+        assert api_obj._session is None
+        assert len(responses.calls) == 2
+
+    def test_close_releases_session(self):
+        """Test that closing the last API object removes the shared session."""
+        open_sessions = len(session_pool)
+        api_obj = PresseportalApi(API_KEY, pool_connections=7)
+        _ = api_obj.session
+        assert len(session_pool) == open_sessions + 1
+        api_obj.close()
+        assert len(session_pool) == open_sessions
+
+    def test_concurrent_first_use(self, monkeypatch):
+        """Test that threads using a new API object at once acquire one session."""
+        acquire = session_pool.acquire
+
+        def slow_acquire(*args, **kwargs):
+            time.sleep(0.01)
+            return acquire(*args, **kwargs)
+
+        monkeypatch.setattr(session_pool, "acquire", slow_acquire)
+        open_sessions = len(session_pool)
+        api_obj = PresseportalApi(API_KEY, pool_connections=9)
+        barrier = threading.Barrier(8)
+
+        def first_use(_):
+            barrier.wait()
+            return api_obj.session
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(executor.map(first_use, range(8)))
+
+        assert all(session is sessions[0] for session in sessions)
+        api_obj.close()
+        assert len(session_pool) == open_sessions
@@ -0,0 +1,55 @@
+"""Tests for the SQLite connection handling of PyPresseportal."""
+
+import threading
+
+import pytest
+
+from pypresseportal.pypresseportal_sqlite import SqliteConnections
+
+
+@pytest.fixture
+def connections(tmp_path):
+    """Connections to a database with one table."""
+    connections = SqliteConnections(str(tmp_path / "test.db"))
+    connections.get().execute("CREATE TABLE items (value INTEGER)")
+    yield connections
+    connections.close()
+
+
+def count(connections):
+    """Number of rows in the table."""
+    return connections.get().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+class TestSqliteConnections:
+    """Tests for SqliteConnections."""
+
+    def test_write_commits(self, connections):
+        """Test that a write transaction is committed."""
+        with connections.write() as conn:
+            conn.execute("INSERT INTO items VALUES (1)")
+
+        assert not connections.get().in_transaction
+        assert count(connections) == 1
+
+    def test_write_rolls_back(self, connections):
+        """Test that an exception rolls the write transaction back."""
+        with pytest.raises(RuntimeError):
+            with connections.write() as conn:
+                conn.execute("INSERT INTO items VALUES (1)")
+                raise RuntimeError
+
+        assert not connections.get().in_transaction
+        assert count(connections) == 0
+
+    def test_connection_per_thread(self, connections):
+        """Test that each thread uses its own connection."""
+        main = connections.get()
+        others = []
+        thread = threading.Thread(target=lambda: others.append(connections.get()))
+        thread.start()
+        thread.join()
+
+        assert connections.get() is main
+        assert others[0] is not main
+        assert connections.get().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
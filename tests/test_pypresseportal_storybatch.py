@@ -0,0 +1,147 @@
+"""Tests for the columnar StoryBatch of PyPresseportal."""
+
+import json
+import re
+
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from api_responses import APIReponses, story_items
+from pypresseportal import PresseportalApi, Story, StoryBatch
+from pypresseportal.pypresseportal_errors import ApiDataError
+from pypresseportal.pypresseportal_lazy import LazyStory
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = re.compile(r"https://api\.presseportal\.de/api/article/all.*")
+
+
+def batch_items(count):
+    """Return stories published a minute apart, every third by an office."""
+    return story_items(
+        count,
+        first_id=100,
+        office_every=3,
+        published=lambda i: f"2020-07-02T04:{59 - i:02d}:00+0200",
+        keywords=lambda i: {"keyword": [f"k{j}" for j in range(i % 3)]},
+    )
+
+
+class TestStoryBatch:
+    """Tests for StoryBatch."""
+
+    def test_columns(self):
+        """Test that the columns match the stories."""
+        items = batch_items(6)
+        batch = StoryBatch.from_items(items)
+
+        assert len(batch) == 6
+        assert batch.ids == [str(100 + i) for i in range(6)]
+        assert batch.company_ids == ["1234", "1234", None] * 2
+        assert batch.office_ids == [None, None, "1234"] * 2
+        assert batch.ressorts == ["vermischtes"] * 6
+        assert list(batch.keyword_offsets) == [0, 0, 1, 3, 3, 4, 6]
+        for i, item in enumerate(items):
+            story = Story(item)
+            assert batch.published[i] == int(story.published.timestamp())
+            assert batch.published_datetime(i) == story.published
+            assert batch.keywords_of(i) == story.keywords
+            assert batch[i].id == story.id
+        assert isinstance(batch.story(0, LazyStory), LazyStory)
+
+    def test_slice_take_filter(self):
+        """Test that selections keep keywords and raw data aligned."""
+        batch = StoryBatch.from_items(batch_items(6))
+
+        sliced = batch[2:5]
+        assert sliced.ids == ["102", "103", "104"]
+        assert [sliced.keywords_of(i) for i in range(3)] == [
+            ["k0", "k1"],
+            [],
+            ["k0"],
+        ]
+        assert sliced[0].id == "102"
+        assert len(batch[4:2]) == 0
+
+        taken = batch.take([5, -6])
+        assert taken.ids == ["105", "100"]
+        assert taken.keywords_of(0) == ["k0", "k1"]
+        assert taken.published_datetime(1) == batch.published_datetime(0)
+
+        offices = batch.filter(office_id is not None for office_id in batch.office_ids)
+        assert offices.ids == ["102", "105"]
+        assert [story.office_id for story in offices.stories()] == ["1234", "1234"]
+
+    def test_concat(self):
+        """Test concatenation of batches."""
+        items = batch_items(6)
+        first = StoryBatch.from_items(items[:4])
+        second = StoryBatch.from_items(items[4:])
+
+        combined = first + second[1:]
+
+        assert combined.ids == ["100", "101", "102", "103", "105"]
+        assert combined.keywords_of(4) == ["k0", "k1"]
+        assert combined.to_dict()["keywords"][2] == ["k0", "k1"]
+        assert StoryBatch.concat([]).ids == []
+
+    def test_without_data(self):
+        """Test a batch that did not keep the raw data."""
+        batch = StoryBatch.from_json({"content": {"story": batch_items(2)}}, False)
+
+        assert batch.items is None
+        assert batch.ids == ["100", "101"]
+        with pytest.raises(ValueError):
+            batch.story(0)
+        assert (batch + StoryBatch.from_items(batch_items(1))).items is None
+
+    def test_invalid_story(self):
+        """Test that missing keys raise ApiDataError."""
+        item = batch_items(1)[0]
+        del item["published"]
+        with pytest.raises(ApiDataError):
+            StoryBatch.from_items([item])
+
+    def test_invalid_publisher(self):
+        """Test that a publisher without id leaves the columns aligned."""
+        items = batch_items(3)
+        office = dict(items[2]["office"])
+        del office["id"]
+        items[2]["office"] = office
+        batch = StoryBatch.empty()
+        with pytest.raises(ApiDataError):
+            batch.extend(items)
+
+        assert len(batch) == 2
+        for name, column in batch.to_dict().items():
+            assert len(column) == 2, name
+        assert len(batch.keyword_offsets) == 3
+        assert len(batch.items) == 2
+
+    @responses.activate
+    def test_get_story_batch(self):
+        """Test paging into a batch with get_story_batch()."""
+        items = batch_items(7)
+
+        def reply(request):
+            query = parse_qs(urlparse(request.url).query)
+            start, limit = int(query["start"][0]), int(query["limit"][0])
+            _, content = APIReponses.load_response("get_stories")
+            page = items[start : start + limit]
+            json_data = dict(json.loads(content), content={"story": page})
+            return 200, {}, json.dumps(json_data)
+
+        responses.add_callback(responses.GET, STORIES_URL, callback=reply)
+
+        with PresseportalApi(API_KEY) as api_obj:
+            batch = api_obj.get_story_batch(max_stories=None, page_size=3)
+            limited = api_obj.get_story_batch(max_stories=4, page_size=3)
+            with pytest.raises(ValueError):
+                api_obj.get_story_batch("get_company_information")
+
+        assert batch.ids == [item["id"] for item in items]
+        assert len(responses.calls) == 5
+        assert limited.ids == batch.ids[:4]
+        assert StoryBatch.from_stories(batch.stories()).ids == batch.ids
@@ -0,0 +1,108 @@
+"""Tests for memory-mapped story files of PyPresseportal."""
+
+import json
+
+import pytest
+
+from api_responses import story_items
+from pypresseportal import Story
+from pypresseportal import pypresseportal_storyfile
+from pypresseportal.pypresseportal_lazy import LazyStory
+from pypresseportal.pypresseportal_storyfile import (
+    StoryFile,
+    StoryFileWriter,
+    convert_json_files,
+    write_story_file,
+)
+
+
+@pytest.fixture
+def path(write_stories):
+    """Story file with 50 stories."""
+    return write_stories(StoryFileWriter, "stories.ppsf", story_items(50))
+
+
+class TestStoryFile:
+    """Tests for StoryFile."""
+
+    def test_positions(self, path):
+        """Test random access by position."""
+        with StoryFile(path) as stories:
+            assert len(stories) == 50
+            assert isinstance(stories[0], Story)
+            assert stories[0].id == "1000"
+            assert stories[-1].title == "Titel 49 äöü ß"
+            assert stories.item(7) == story_items(50)[7]
+            with pytest.raises(IndexError):
+                stories[50]
+
+    def test_ids(self, path):
+        """Test lookups by id."""
+        with StoryFile(path, model=LazyStory) as stories:
+            story = stories.get("1033")
+
+            assert isinstance(story, LazyStory)
+            assert story.title == "Titel 33 äöü ß"
+            assert stories.position("1049") == 49
+            assert stories.get("999") is None
+            assert "1000" in stories
+
+    def test_scan(self, path):
+        """Test sequential scans."""
+        with StoryFile(path) as stories:
+            assert [story.id for story in stories.stories(10, 13)] == [
+                "1010",
+                "1011",
+                "1012",
+            ]
+            assert len(list(stories)) == 50
+            assert list(stories.stories(60)) == []
+
+    def test_hash_collisions(self, tmp_path, monkeypatch):
+        """Test that ids with the same hash are told apart."""
+        monkeypatch.setattr(pypresseportal_storyfile, "id_hash", lambda story_id: 1)
+        file_path = str(tmp_path / "collisions.ppsf")
+        write_story_file(file_path, (Story(item) for item in story_items(5)))
+
+        with StoryFile(file_path) as stories:
+            assert [stories.position(str(1000 + i)) for i in range(5)] == list(range(5))
+            assert stories.get("1005") is None
+
+    def test_convert_json_files(self, tmp_path):
+        """Test converting saved API responses."""
+        export = tmp_path / "export.json"
+        export.write_text(json.dumps({"content": {"story": story_items(3)}}))
+        file_path = str(tmp_path / "converted.ppsf")
+
+        count = convert_json_files(
+            ["tests/replies/get_stories.json", str(export)], file_path
+        )
+
+        assert count == 4
+        with StoryFile(file_path) as stories:
+            assert [story.id for story in stories] == [
+                "1234567",
+                "1000",
+                "1001",
+                "1002",
+            ]
+
+    def test_invalid_files(self, tmp_path):
+        """Test that other and unfinished files are rejected."""
+        with pytest.raises(ValueError):
+            StoryFile("tests/replies/get_stories.json")
+
+        file_path = str(tmp_path / "unfinished.ppsf")
+        writer = StoryFileWriter(file_path)
+        writer.write_items(story_items(2))
+        writer._file.flush()
+        with pytest.raises(ValueError):
+            StoryFile(file_path)
+        writer.close()
+        assert len(StoryFile(file_path)) == 2
+
+        empty = str(tmp_path / "empty.ppsf")
+        assert write_story_file(empty, []) == 0
+        with StoryFile(empty) as stories:
+            assert len(stories) == 0
+            assert stories.get("1000") is None
@@ -0,0 +1,156 @@
+"""Tests for streaming story responses in PyPresseportal."""
+
+import json
+
+import pytest
+import requests
+import responses
+
+from api_responses import APIReponses
+from pypresseportal import PresseportalApi
+from pypresseportal.pypresseportal_errors import (
+    ApiConnectionFail,
+    ApiDataError,
+    ApiError,
+)
+from pypresseportal.pypresseportal_lazy import LazyStory
+from pypresseportal.pypresseportal_metrics import (
+    ERRORS,
+    REQUESTS,
+    RESPONSE_BYTES,
+    PrometheusMetrics,
+)
+from pypresseportal.pypresseportal_stream import iter_story_items
+
+
+API_KEY = "NO_KEY_NEEDED_DUE_TO_MOCKING_API"
+STORIES_URL = "https://api.presseportal.de/api/article/all"
+
+
+def chunked(data, size):
+    """Split bytes into chunks of ``size`` bytes."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def story_page(count):
+    """Return a page of stories with strings that are hard to scan."""
+    with open("tests/replies/get_stories.json", "r") as in_file:
+        json_data = json.load(in_file)
+    template = json_data["content"]["story"][0]
+    json_data["content"]["story"] = [
+        dict(template, id=str(i), title=f'Titel {i} "zitiert" \\ {{[ ]}} äöü ß 😀')
+        for i in range(count)
+    ]
+    return json_data
+
+
+class TestIterStoryItems:
+    """Tests for the incremental parser."""
+
+    def test_any_chunk_size(self):
+        """Test that stories are parsed correctly for any chunk boundaries."""
+        json_data = story_page(5)
+        for ensure_ascii, indent in ((True, None), (False, 2)):
+            content = json.dumps(json_data, ensure_ascii=ensure_ascii, indent=indent)
+            for size in (1, 2, 3, 5, 64, 100000):
+                items = list(iter_story_items(chunked(content.encode(), size)))
+                assert items == json_data["content"]["story"]
+
+    def test_incremental(self):
+        """Test that a story is yielded before the rest of the page is read."""
+        content = json.dumps(story_page(3)).encode()
+        read = []
+
+        def chunks():
+            for chunk in chunked(content, 16):
+                read.append(len(chunk))
+                yield chunk
+
+        items = iter_story_items(chunks())
+        assert next(items)["id"] == "0"
+        assert sum(read) < len(content) / 2
+
+    def test_checks(self):
+        """Test that errors and missing content are detected."""
+        _, error_content = APIReponses().load_response("authentification_failed_error")
+        with pytest.raises(ApiError):
+            list(iter_story_items([error_content.encode()]))
+
+        _, empty_content = APIReponses().load_response("empty_json")
+        with pytest.raises(ApiDataError):
+            list(iter_story_items([empty_content.encode()]))
+
+        truncated = json.dumps(story_page(2)).encode()[:-40]
+        with pytest.raises(ApiDataError):
+            list(iter_story_items([truncated]))
+
+        assert list(iter_story_items([b'{"content": {"story": []}}'])) == []
+
+
+class TestStreamStories:
+    """Tests for PresseportalApi.stream_stories()."""
+
+    @responses.activate
+    def test_stream_stories(self):
+        """Test streaming a page of stories."""
+        responses.add(
+            responses.GET, STORIES_URL, body=json.dumps(story_page(4)).encode()
+        )
+
+        with PresseportalApi(API_KEY, lazy_models=True) as api_obj:
+            stories = list(api_obj.stream_stories(limit=4, chunk_size=100))
+            assert list(api_obj.stream_stories(media="invalid")) == []
+            with pytest.raises(ApiConnectionFail):
+                list(api_obj.stream_stories("get_stories_topic", topic="finanzen"))
+
+        assert [story.id for story in stories] == ["0", "1", "2", "3"]
+        assert isinstance(stories[0], LazyStory)
+        assert "limit=4" in responses.calls[0].request.url
+
+    @responses.activate
+    def test_error_status(self):
+        """Test that error responses are checked before they are parsed."""
+        _, error_content = APIReponses().load_response("authentification_failed_error")
+        responses.add(responses.GET, STORIES_URL, body=error_content, status=401)
+        responses.add(responses.GET, STORIES_URL, body="<html></html>", status=503)
+
+        with PresseportalApi(API_KEY) as api_obj:
+            with pytest.raises(ApiError) as api_error:
+                list(api_obj.stream_stories())
+            with pytest.raises(ApiError) as status_error:
+                list(api_obj.stream_stories())
+
+        assert api_error.value.error_code == "101"
+        assert status_error.value.error_code == "503"
+
+    @responses.activate
+    def test_broken_connection(self, monkeypatch):
+        """Test that errors while the body is read raise ApiConnectionFail."""
+        content = json.dumps(story_page(4)).encode()
+        responses.add(responses.GET, STORIES_URL, body=content)
+
+        def iter_content(response, chunk_size=1):
+            yield content[:100]
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+        monkeypatch.setattr(requests.Response, "iter_content", iter_content)
+        metrics = PrometheusMetrics()
+        with PresseportalApi(API_KEY, metrics=metrics) as api_obj:
+            with pytest.raises(ApiConnectionFail):
+                list(api_obj.stream_stories())
+
+        labels = {"operation": "article/all", "error": "ApiConnectionFail"}
+        assert metrics.counter(ERRORS, **labels) == 1
+
+    @responses.activate
+    def test_metrics(self):
+        """Test that streamed requests are counted."""
+        content = json.dumps(story_page(4)).encode()
+        responses.add(responses.GET, STORIES_URL, body=content)
+        metrics = PrometheusMetrics()
+
+        with PresseportalApi(API_KEY, metrics=metrics) as api_obj:
+            assert len(list(api_obj.stream_stories(chunk_size=100))) == 4
+
+        assert metrics.counter(REQUESTS, endpoint="article/all") == 1
+        assert metrics.counter(RESPONSE_BYTES, endpoint="article/all") == len(content)